@@ -0,0 +1,44 @@
+"""
+Minimal in-process ASGI driver shared by the middleware benchmarks.
+"""
+
+import time
+from typing import Any, Awaitable, Callable
+
+ASGIApp = Callable[..., Awaitable[None]]
+
+
+def http_scope(path: str, headers: list[tuple[bytes, bytes]] | None = None) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": headers or [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+
+
+async def _receive() -> dict:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(_message: Any) -> None:
+    return None
+
+
+async def drive(
+    app: ASGIApp, n: int, path: str = "/ping/{i}", warmup: int = 200
+) -> float:
+    """Average seconds per request over `n` sequential requests."""
+    for i in range(warmup):
+        await app(http_scope(path.format(i=i)), _receive, _send)
+    started = time.perf_counter()
+    for i in range(n):
+        await app(http_scope(path.format(i=i)), _receive, _send)
+    return (time.perf_counter() - started) / n
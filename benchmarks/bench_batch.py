@@ -0,0 +1,102 @@
+"""
+Compare moving N cards one request at a time against one /cards/batch call.
+
+Usage: python -m benchmarks.bench_batch [--cards 200]
+Runs against a throwaway SQLite file, never the dev database.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+_DB_DIR = tempfile.mkdtemp(prefix="kanban-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+os.environ.setdefault("JWT_SECRET", "bench-secret-key-1234567890")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.adapters.db import Base, engine  # noqa: E402
+from src.main import app  # noqa: E402
+
+client = TestClient(app)
+
+
+def _setup(n_cards: int) -> tuple[dict[str, str], int, list[int]]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    creds = {"email": "bench@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "bench"}, headers=headers
+    ).json()["id"]
+    resp = client.post(
+        "/api/v1/cards/batch",
+        json={
+            "operations": [
+                {
+                    "op": "create",
+                    "title": f"card {i}",
+                    "column": "backlog",
+                    "order_idx": i,
+                    "board_id": board_id,
+                }
+                for i in range(n_cards)
+            ]
+        },
+        headers=headers,
+    )
+    ids = [r["card"]["id"] for r in resp.json()["results"]]
+    return headers, board_id, ids
+
+
+def bench_single(n_cards: int) -> float:
+    headers, _, ids = _setup(n_cards)
+    started = time.perf_counter()
+    for i, card_id in enumerate(ids):
+        resp = client.patch(
+            f"/api/v1/cards/{card_id}/move",
+            json={"column": "todo", "order_idx": i},
+            headers=headers,
+        )
+        assert resp.status_code == 200, resp.text
+    return time.perf_counter() - started
+
+
+def bench_batch(n_cards: int) -> float:
+    headers, _, ids = _setup(n_cards)
+    started = time.perf_counter()
+    resp = client.post(
+        "/api/v1/cards/batch",
+        json={
+            "operations": [
+                {"op": "move", "id": card_id, "column": "todo", "order_idx": i}
+                for i, card_id in enumerate(ids)
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=200)
+    args = parser.parse_args()
+
+    single = bench_single(args.cards)
+    batch = bench_batch(args.cards)
+    print(f"cards moved:      {args.cards}")
+    print(f"single-card path: {single:.3f}s ({args.cards / single:,.0f} moves/s)")
+    print(f"batch endpoint:   {batch:.3f}s ({args.cards / batch:,.0f} moves/s)")
+    print(f"speedup:          {single / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Throughput and memory of NDJSON board export and import.
+
+Usage: python -m benchmarks.bench_board_transfer [--cards 1000000]
+Runs against a throwaway SQLite file, never the dev database. The export is
+written to a temp file and imported back as a new board in 64 KB chunks, as a
+client upload would arrive. Peak RSS is reported after each phase; it should
+stay flat as --cards grows.
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import tempfile
+import time
+
+_DB_DIR = tempfile.mkdtemp(prefix="kanban-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+os.environ.setdefault("JWT_SECRET", "bench-secret-key-1234567890")
+
+from sqlalchemy import func, insert, select  # noqa: E402
+
+from src.adapters.db import Base, SessionLocal, engine  # noqa: E402
+from src.adapters.models import Board, Card, User  # noqa: E402
+from src.services.principals import Principal  # noqa: E402
+from src.services.transfer import export_board_ndjson, import_board  # noqa: E402
+
+_COLUMNS = ("backlog", "todo", "in_progress", "done")
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _load(n_cards: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.execute(
+            insert(User), [{"id": 1, "email": "u@example.com", "hashed_password": "x"}]
+        )
+        db.execute(insert(Board), [{"id": 1, "title": "bench", "owner_id": 1}])
+        chunk = 50_000
+        for start in range(0, n_cards, chunk):
+            db.execute(
+                insert(Card),
+                [
+                    {
+                        "title": f"card {i} with a realistic title",
+                        "column": _COLUMNS[i % 4],
+                        "order_idx": i,
+                        "board_id": 1,
+                        "owner_id": 1,
+                        "estimate_hours": i % 13,
+                    }
+                    for i in range(start, min(n_cards, start + chunk))
+                ],
+            )
+        db.commit()
+
+
+async def _file_chunks(path: str):
+    with open(path, "rb") as fp:
+        while chunk := fp.read(64 * 1024):
+            yield chunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    _load(args.cards)
+    print(f"loaded {args.cards} cards in {time.perf_counter() - started:.1f} s")
+    print(f"peak rss after load:   {_peak_rss_mb():8.1f} MB")
+
+    path = os.path.join(_DB_DIR, "board.ndjson")
+    started = time.perf_counter()
+    with open(path, "wb") as out:
+        for chunk in export_board_ndjson(1):
+            out.write(chunk)
+    elapsed = time.perf_counter() - started
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(
+        f"export: {elapsed:6.1f} s  {args.cards / elapsed:9.0f} cards/s  "
+        f"{size_mb:.0f} MB ndjson"
+    )
+    print(f"peak rss after export: {_peak_rss_mb():8.1f} MB")
+
+    owner = Principal(id=1, role="user", is_active=True)
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        board = asyncio.run(import_board(db, owner, _file_chunks(path)))
+        count = db.scalar(select(func.count()).where(Card.board_id == board.id))
+    elapsed = time.perf_counter() - started
+    assert count == args.cards, count
+    print(f"import: {elapsed:6.1f} s  {args.cards / elapsed:9.0f} cards/s")
+    print(f"peak rss after import: {_peak_rss_mb():8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Per-request cost of MetricsMiddleware on a trivial route.
+
+Usage: python -m benchmarks.bench_metrics_overhead [--requests 5000]
+Drives two otherwise identical apps in-process through raw ASGI calls.
+"""
+
+import argparse
+import asyncio
+import os
+
+os.environ.setdefault("JWT_SECRET", "bench-secret-key-1234567890")
+
+from fastapi import FastAPI  # noqa: E402
+
+from benchmarks.asgi_driver import drive  # noqa: E402
+from src.app.middleware import MetricsMiddleware  # noqa: E402
+
+
+def _app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping/{item}")
+    async def ping(item: int):
+        return {"item": item}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    bare = asyncio.run(drive(_app(False), args.requests))
+    metered = asyncio.run(drive(_app(True), args.requests))
+    print(f"requests:           {args.requests}")
+    print(f"without middleware: {bare * 1e6:.1f} us/request")
+    print(f"with metrics:       {metered * 1e6:.1f} us/request")
+    print(f"overhead:           {(metered - bare) * 1e6:.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare the previous BaseHTTPMiddleware correlation middleware with the
+pure ASGI CorrelationIdMiddleware.
+
+Usage: python -m benchmarks.bench_middleware [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import uuid
+
+os.environ.setdefault("JWT_SECRET", "bench-secret-key-1234567890")
+
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from benchmarks.asgi_driver import drive  # noqa: E402
+from src.app.middleware import CorrelationIdMiddleware  # noqa: E402
+
+
+class LegacyCorrelationIdMiddleware(BaseHTTPMiddleware):
+    """The implementation that src.main used before the pure ASGI rewrite."""
+
+    async def dispatch(self, request: Request, call_next):  # type: ignore[override]
+        corr_id = request.headers.get("X-Correlation-Id") or uuid.uuid4().hex
+        request.state.correlation_id = corr_id
+        response = await call_next(request)
+        response.headers["X-Correlation-Id"] = corr_id
+        return response
+
+
+def _app(middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping/{item}")
+    async def ping(item: int):
+        return {"item": item}
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = {
+        "no middleware": asyncio.run(drive(_app(None), args.requests)),
+        "BaseHTTPMiddleware": asyncio.run(
+            drive(_app(LegacyCorrelationIdMiddleware), args.requests)
+        ),
+        "pure ASGI": asyncio.run(drive(_app(CorrelationIdMiddleware), args.requests)),
+    }
+    print(f"requests: {args.requests}")
+    for name, seconds in results.items():
+        print(f"{name:<20} {seconds * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Latency of /cards/search queries against a LIKE scan on a large cards table.
+
+Usage: python -m benchmarks.bench_search [--cards 1000000] [--rounds 20]
+Runs against a throwaway SQLite file, never the dev database. Cards are bulk
+inserted with the FTS triggers in place, so load time includes indexing.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+_DB_DIR = tempfile.mkdtemp(prefix="kanban-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+os.environ.setdefault("JWT_SECRET", "bench-secret-key-1234567890")
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from src.adapters.db import Base, SessionLocal, engine  # noqa: E402
+from src.adapters.models import Board, Card, User  # noqa: E402
+from src.services.principals import Principal  # noqa: E402
+from src.services.search import search_cards  # noqa: E402
+
+_WORDS = (
+    "release notes login bug crash payment invoice export import search "
+    "onboarding email refactor cache latency dashboard report mobile sync "
+    "upload avatar settings billing migrate schema alert metrics deploy"
+).split()
+QUERIES = {
+    "common term": "release",
+    "rare term": "zeppelin",
+    "prefix": "dash",
+    "two terms": "payment crash",
+}
+
+
+def _load(n_cards: int, owners: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(42)
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {"id": i, "email": f"u{i}@example.com", "hashed_password": "x"}
+                for i in range(1, owners + 1)
+            ],
+        )
+        db.execute(
+            insert(Board),
+            [{"id": i, "title": f"b{i}", "owner_id": i} for i in range(1, owners + 1)],
+        )
+        chunk = 50_000
+        for start in range(0, n_cards, chunk):
+            rows = []
+            for i in range(start, min(n_cards, start + chunk)):
+                words = rng.choices(_WORDS, k=rng.randint(2, 6))
+                if i % 100_000 == 0:
+                    words.append("zeppelin")
+                owner = i % owners + 1
+                rows.append(
+                    {
+                        "title": " ".join(words),
+                        "column": "todo",
+                        "order_idx": i,
+                        "board_id": owner,
+                        "owner_id": owner,
+                    }
+                )
+            db.execute(insert(Card), rows)
+        db.commit()
+
+
+def _like(db, requester: Principal, q: str, limit: int = 20):
+    query = select(Card).where(
+        Card.owner_id == requester.id, Card.title.like(f"%{q.split()[0]}%")
+    )
+    return db.scalars(query.order_by(Card.id).limit(limit)).all()
+
+
+def _percentiles(fn, q: str, rounds: int) -> tuple[float, float]:
+    samples = []
+    requester = Principal(id=1, role="user", is_active=True)
+    with SessionLocal() as db:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            fn(db, requester, q)
+            samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=1_000_000)
+    parser.add_argument("--owners", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    _load(args.cards, args.owners)
+    print(f"loaded {args.cards} cards in {time.perf_counter() - started:.1f} s")
+    print(f"{'query':<14}{'fts p50/p95 ms':>18}{'like p50/p95 ms':>20}")
+    for name, q in QUERIES.items():
+        fts = _percentiles(search_cards, q, args.rounds)
+        like = _percentiles(_like, q, args.rounds)
+        print(
+            f"{name:<14}{fts[0]:>10.2f} /{fts[1]:>6.2f}"
+            f"{like[0]:>12.2f} /{like[1]:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
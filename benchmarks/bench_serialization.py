@@ -0,0 +1,78 @@
+"""
+Compare the CardOut (validate + response_model) path with the trusted encoder.
+
+Usage: python -m benchmarks.bench_serialization [--cards 1000] [--rounds 50]
+Works on in-memory ORM objects; no database is touched.
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+os.environ.setdefault("JWT_SECRET", "bench-secret-key-1234567890")
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from src.adapters.models import Card  # noqa: E402
+from src.domain.schemas import CardOut  # noqa: E402
+from src.services.cards import to_cards_out  # noqa: E402
+from src.services.serialization import cards_json  # noqa: E402
+
+_RESPONSE_ADAPTER = TypeAdapter(list[CardOut])
+
+
+def _cards(n: int) -> list[Card]:
+    now = datetime.now(timezone.utc)
+    return [
+        Card(
+            id=i,
+            title=f"card {i}",
+            column="todo",
+            order_idx=i,
+            board_id=1,
+            owner_id=1,
+            created_at=now,
+            updated_at=now,
+            estimate_hours=Decimal("1.25"),
+            due_date=now,
+        )
+        for i in range(n)
+    ]
+
+
+def current_path(cards: list[Card]) -> bytes:
+    # to_cards_out, then FastAPI's response_model validation and JSON encoding.
+    out = to_cards_out(cards)
+    validated = _RESPONSE_ADAPTER.validate_python(out, from_attributes=True)
+    content = _RESPONSE_ADAPTER.dump_python(validated, mode="json")
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def _time(fn, cards: list[Card], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(cards)
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    cards = _cards(args.cards)
+    assert json.loads(current_path(cards)) == json.loads(cards_json(cards))
+    slow = _time(current_path, cards, args.rounds)
+    fast = _time(cards_json, cards, args.rounds)
+    print(f"cards per response: {args.cards}")
+    print(f"CardOut path:       {slow * 1000:.2f} ms")
+    print(f"trusted encoder:    {fast * 1000:.2f} ms")
+    print(f"speedup:            {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
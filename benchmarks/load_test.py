@@ -0,0 +1,523 @@
+"""
+Load test of the API hot paths against the NFR-001/NFR-002 targets.
+
+Usage: python -m benchmarks.load_test [--cards 100000] [--concurrency 16]
+           [--duration 30] [--output load_results.json]
+           [--baseline baseline.json] [--save-baseline baseline.json]
+
+Seeds a throwaway SQLite file with users, one board per user and --cards cards,
+then serves the real app with uvicorn on a loopback port in this process. A
+stub scoring upstream runs next to it, so the score flow exercises the client,
+breaker and limiter without leaving the machine. --concurrency virtual users
+run a weighted mix of register, login, list, move and score requests (--mix)
+back to back for --duration seconds after a --warmup.
+
+Each flow reports throughput and p50/p95/p99 latency, and the run is checked
+against p95 < 200 ms, p99 < 500 ms, 100 read RPS and 50 write RPS. The results
+are written as JSON. With --baseline, a flow whose p95 grew or whose RPS fell by
+more than --tolerance is reported as a regression and the exit status is 1.
+Client and server share one interpreter, so absolute numbers are a lower bound
+of what a dedicated server achieves; compare runs from the same machine.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+_DB_DIR = tempfile.mkdtemp(prefix="kanban-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+os.environ.setdefault("JWT_SECRET", "bench-secret-key-1234567890")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# The score client reads its upstream on first use, so point it at the stub
+# before the app is imported.
+_SCORE_PORT = _free_port()
+os.environ["SCORE_API_BASE"] = f"http://127.0.0.1:{_SCORE_PORT}"
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from src.adapters.db import Base, SessionLocal, engine  # noqa: E402
+from src.adapters.models import Board, Card, User  # noqa: E402
+from src.main import app  # noqa: E402
+from src.services.auth import get_pwd_context  # noqa: E402
+from src.services.stats import StatsDelta, apply_stats_delta  # noqa: E402
+
+_COLUMNS = ("backlog", "todo", "in_progress", "done")
+PASSWORD = "load-test-password"
+
+READ_FLOWS = ("list", "login")
+WRITE_FLOWS = ("move", "score", "register")
+DEFAULT_MIX = "list=60,move=25,score=10,login=4,register=1"
+
+P95_LIMIT_MS = 200.0
+P99_LIMIT_MS = 500.0
+READ_RPS_TARGET = 100.0
+WRITE_RPS_TARGET = 50.0
+# A p95 this close to the baseline is noise, whatever the ratio.
+MIN_P95_DELTA_MS = 2.0
+
+Sample = Tuple[str, int, float]
+
+
+def _seed(n_users: int, n_cards: int) -> List[Tuple[int, int, int]]:
+    """Users with one board each; (board_id, first_card_id, last_card_id)."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    hashed = get_pwd_context().hash(PASSWORD)
+    per_board = max(1, n_cards // n_users)
+    boards = []
+    stats = StatsDelta()
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {"id": i, "email": _email(i), "hashed_password": hashed}
+                for i in range(1, n_users + 1)
+            ],
+        )
+        db.execute(
+            insert(Board),
+            [
+                {"id": i, "title": f"board {i}", "owner_id": i}
+                for i in range(1, n_users + 1)
+            ],
+        )
+        card_id = 1
+        for board_id in range(1, n_users + 1):
+            rows = []
+            for i in range(per_board):
+                column = _COLUMNS[i % 4]
+                rows.append(
+                    {
+                        "id": card_id + i,
+                        "title": f"card {i} with a realistic title",
+                        "column": column,
+                        "order_idx": i // 4,
+                        "board_id": board_id,
+                        "owner_id": board_id,
+                        "estimate_hours": i % 13,
+                    }
+                )
+                stats.add(board_id, column, i % 13)
+            db.execute(insert(Card), rows)
+            boards.append((board_id, card_id, card_id + per_board - 1))
+            card_id += per_board
+        apply_stats_delta(db, stats)
+        db.commit()
+    return boards
+
+
+def _email(user_id: int) -> str:
+    return f"load-{user_id}@example.com"
+
+
+async def _score_stub(scope, receive, send) -> None:
+    """Upstream stand-in: `POST /score` answers after --score-latency-ms."""
+    if scope["type"] != "http":
+        return
+    more_body = True
+    while more_body:
+        message = await receive()
+        more_body = message.get("more_body", False)
+    await asyncio.sleep(_score_stub.latency)
+    body = json.dumps({"score": random.random()}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+_score_stub.latency = 0.0
+
+
+class _ServerThread(threading.Thread):
+    """uvicorn on a loopback port, in a daemon thread of this process."""
+
+    def __init__(self, asgi_app: Any, port: int, lifespan: str = "on") -> None:
+        super().__init__(daemon=True)
+        config = uvicorn.Config(
+            asgi_app,
+            host="127.0.0.1",
+            port=port,
+            lifespan=lifespan,
+            log_level="warning",
+            access_log=False,
+        )
+        self.server = uvicorn.Server(config)
+
+    def run(self) -> None:
+        self.server.run()
+
+    def __enter__(self) -> "_ServerThread":
+        self.start()
+        while not self.server.started:
+            if not self.is_alive():
+                raise RuntimeError("uvicorn failed to start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.server.should_exit = True
+        self.join()
+
+
+def _parse_mix(spec: str) -> Dict[str, int]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in READ_FLOWS + WRITE_FLOWS:
+            raise argparse.ArgumentTypeError(f"unknown flow {name!r}")
+        mix[name] = int(weight)
+    return mix
+
+
+class _VirtualUser:
+    """One seeded user working on its own board."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        index: int,
+        board: Tuple[int, int, int],
+        rng: random.Random,
+    ) -> None:
+        self.client = client
+        self.index = index
+        self.board_id, self.first_card, self.last_card = board
+        self.email = _email(self.board_id)
+        self.rng = rng
+        self.headers: Dict[str, str] = {}
+        self.sent = 0
+
+    async def login(self) -> httpx.Response:
+        resp = await self.client.post(
+            "/api/v1/auth/login",
+            data={"username": self.email, "password": PASSWORD},
+        )
+        if resp.status_code == 200:
+            token = resp.json()["access_token"]
+            self.headers = {"Authorization": f"Bearer {token}"}
+        return resp
+
+    def _card(self) -> int:
+        return self.rng.randint(self.first_card, self.last_card)
+
+    async def register(self) -> httpx.Response:
+        self.sent += 1
+        email = f"new-{self.index}-{self.sent}-{time.monotonic_ns()}@example.com"
+        return await self.client.post(
+            "/api/v1/auth/register", json={"email": email, "password": PASSWORD}
+        )
+
+    async def list(self) -> httpx.Response:
+        return await self.client.get(
+            "/api/v1/cards",
+            params={"board_id": self.board_id, "limit": 50},
+            headers=self.headers,
+        )
+
+    async def move(self) -> httpx.Response:
+        return await self.client.patch(
+            f"/api/v1/cards/{self._card()}/move",
+            json={"column": self.rng.choice(_COLUMNS)},
+            headers=self.headers,
+        )
+
+    async def score(self) -> httpx.Response:
+        # A fresh context misses the score cache, so every call goes upstream.
+        self.sent += 1
+        return await self.client.post(
+            f"/api/v1/cards/{self._card()}/score",
+            json={"context": f"load {self.index} {self.sent}"},
+            headers=self.headers,
+        )
+
+
+async def _drive(
+    base_url: str,
+    boards: List[Tuple[int, int, int]],
+    mix: Dict[str, int],
+    concurrency: int,
+    warmup: float,
+    duration: float,
+    seed: int,
+) -> Tuple[List[Sample], float]:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples: List[Sample] = []
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30.0
+    ) as client:
+        users = [
+            _VirtualUser(client, i, boards[i % len(boards)], random.Random(seed + i))
+            for i in range(concurrency)
+        ]
+        for user in users:
+            resp = await user.login()
+            resp.raise_for_status()
+
+        loop = asyncio.get_running_loop()
+        measure_from = loop.time() + warmup
+        stop_at = measure_from + duration
+
+        async def run(user: _VirtualUser) -> None:
+            while (now := loop.time()) < stop_at:
+                flow = user.rng.choices(names, weights)[0]
+                started = time.perf_counter()
+                try:
+                    status = (await getattr(user, flow)()).status_code
+                except httpx.HTTPError:
+                    status = 0
+                if now >= measure_from:
+                    samples.append((flow, status, time.perf_counter() - started))
+
+        await asyncio.gather(*(run(user) for user in users))
+    return samples, duration
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(-(-pct * len(sorted_values) // 100)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    """Per-flow throughput, error count and latency percentiles in ms."""
+    by_flow: Dict[str, List[Tuple[int, float]]] = {}
+    for flow, status, seconds in samples:
+        by_flow.setdefault(flow, []).append((status, seconds))
+    flows = {}
+    for flow, rows in sorted(by_flow.items()):
+        latencies = sorted(seconds * 1000 for _, seconds in rows)
+        statuses: Dict[str, int] = {}
+        for status, _ in rows:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        flows[flow] = {
+            "requests": len(rows),
+            "errors": sum(1 for status, _ in rows if not 200 <= status < 300),
+            "rps": round(len(rows) / elapsed, 2),
+            "p50_ms": round(_percentile(latencies, 50), 2),
+            "p95_ms": round(_percentile(latencies, 95), 2),
+            "p99_ms": round(_percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2),
+            "status": statuses,
+        }
+    all_latencies = sorted(seconds * 1000 for _, _, seconds in samples)
+    totals = {
+        "requests": len(samples),
+        "errors": sum(flow["errors"] for flow in flows.values()),
+        "rps": round(len(samples) / elapsed, 2),
+        "read_rps": round(sum(flows[f]["rps"] for f in READ_FLOWS if f in flows), 2),
+        "write_rps": round(sum(flows[f]["rps"] for f in WRITE_FLOWS if f in flows), 2),
+        "p95_ms": round(_percentile(all_latencies, 95), 2),
+        "p99_ms": round(_percentile(all_latencies, 99), 2),
+    }
+    return {"flows": flows, "totals": totals}
+
+
+def check_nfr(summary: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """NFR-001 per flow and NFR-002 for the read and write totals."""
+    checks = []
+    for flow, stats in summary["flows"].items():
+        for metric, limit in (("p95_ms", P95_LIMIT_MS), ("p99_ms", P99_LIMIT_MS)):
+            checks.append(
+                {
+                    "id": "NFR-001",
+                    "check": f"{flow} {metric} < {limit:g}",
+                    "value": stats[metric],
+                    "ok": stats[metric] < limit,
+                }
+            )
+    totals = summary["totals"]
+    for metric, target in (
+        ("read_rps", READ_RPS_TARGET),
+        ("write_rps", WRITE_RPS_TARGET),
+    ):
+        checks.append(
+            {
+                "id": "NFR-002",
+                "check": f"{metric} >= {target:g}",
+                "value": totals[metric],
+                "ok": totals[metric] >= target,
+            }
+        )
+    return checks
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Regressions of `current` against `baseline`, one line each."""
+    regressions = []
+    for flow, base in baseline["flows"].items():
+        now = current["flows"].get(flow)
+        if now is None:
+            continue
+        if (
+            now["p95_ms"] > base["p95_ms"] * (1 + tolerance)
+            and now["p95_ms"] - base["p95_ms"] > MIN_P95_DELTA_MS
+        ):
+            regressions.append(
+                f"{flow}: p95 {base['p95_ms']:.1f} -> {now['p95_ms']:.1f} ms"
+            )
+        if now["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{flow}: rps {base['rps']:.1f} -> {now['rps']:.1f}")
+        base_rate = base["errors"] / max(1, base["requests"])
+        now_rate = now["errors"] / max(1, now["requests"])
+        if now_rate > base_rate + 0.01:
+            regressions.append(f"{flow}: error rate {base_rate:.1%} -> {now_rate:.1%}")
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _print_summary(summary: Dict[str, Any], checks: List[Dict[str, Any]]) -> None:
+    print(
+        f"{'flow':<10}{'requests':>10}{'errors':>8}{'rps':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    for flow, s in summary["flows"].items():
+        print(
+            f"{flow:<10}{s['requests']:>10}{s['errors']:>8}{s['rps']:>9.1f}"
+            f"{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}"
+            f"{s['max_ms']:>9.1f}"
+        )
+    t = summary["totals"]
+    print(
+        f"total: {t['requests']} requests, {t['errors']} errors, {t['rps']:.1f} rps "
+        f"(read {t['read_rps']:.1f}, write {t['write_rps']:.1f}), "
+        f"p95 {t['p95_ms']:.1f} ms, p99 {t['p99_ms']:.1f} ms"
+    )
+    for check in checks:
+        mark = "ok  " if check["ok"] else "FAIL"
+        print(f"{mark} {check['id']} {check['check']}: {check['value']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--cards", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--mix", type=_parse_mix, default=_parse_mix(DEFAULT_MIX))
+    parser.add_argument("--score-latency-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="load_results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--save-baseline", help="also write the results here")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    boards = _seed(args.users, args.cards)
+    print(
+        f"seeded {args.users} users, {args.users} boards, "
+        f"{args.cards} cards in {time.perf_counter() - started:.1f} s"
+    )
+
+    _score_stub.latency = args.score_latency_ms / 1000
+    app_port = _free_port()
+    with _ServerThread(_score_stub, _SCORE_PORT, lifespan="off"), _ServerThread(
+        app, app_port
+    ):
+        samples, elapsed = asyncio.run(
+            _drive(
+                f"http://127.0.0.1:{app_port}",
+                boards,
+                args.mix,
+                args.concurrency,
+                args.warmup,
+                args.duration,
+                args.seed,
+            )
+        )
+
+    summary = summarize(samples, elapsed)
+    checks = check_nfr(summary)
+    _print_summary(summary, checks)
+    results = {
+        "benchmark": "load_test",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "config": {
+            "users": args.users,
+            "cards": args.cards,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "mix": args.mix,
+            "score_latency_ms": args.score_latency_ms,
+        },
+        **summary,
+        "nfr": checks,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as out:
+            json.dump(results, out, indent=2)
+            out.write("\n")
+        print(f"results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        if baseline.get("config") != results["config"]:
+            print("warning: the baseline was recorded with a different config")
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(
+            f"no regressions against {args.baseline} (tolerance {args.tolerance:.0%})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
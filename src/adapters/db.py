@@ -1,8 +1,89 @@
 import os
-from typing import Generator
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Generator, Mapping, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.services.metrics import REGISTRY
+
+POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    labelnames=("engine",),
+)
+POOL_CHECKOUT_TIMEOUTS = REGISTRY.counter(
+    "db_pool_checkout_timeouts",
+    "Pool checkouts that gave up after pool_timeout",
+    labelnames=("engine",),
+)
+POOL_CHECKED_OUT = REGISTRY.gauge(
+    "db_pool_checked_out", "Connections currently in use", labelnames=("engine",)
+)
+POOL_OVERFLOW = REGISTRY.gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool warms up)",
+    labelnames=("engine",),
+)
+POOL_SIZE = REGISTRY.gauge(
+    "db_pool_size", "Configured persistent pool size", labelnames=("engine",)
+)
+DB_QUERIES = REGISTRY.counter("db_queries", "SQL statements executed")
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_seconds", "Time spent executing individual SQL statements"
+)
+
+
+@dataclass
+class QueryStats:
+    """Per-request accumulator filled by the cursor execute hooks."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+# Set by the HTTP metrics middleware; copied into threadpool workers with the
+# request context, so sync handlers report into the same object.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, _cursor, _statement, _params, _context, _executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, _cursor, _statement, _params, _context, _executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    DB_QUERIES.inc()
+    DB_QUERY_SECONDS.observe(elapsed)
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(context) -> None:
+    # after_cursor_execute does not fire for failed statements
+    connection = context.connection
+    started = connection.info.get("query_started") if connection is not None else None
+    if started:
+        started.pop()
 
 
 class Base(DeclarativeBase):
@@ -14,14 +95,134 @@ def _get_database_url() -> str:
     return os.getenv("DATABASE_URL", "sqlite:///./idea_kanban.db")
 
 
+def _to_async_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto its asyncio driver (aiosqlite / asyncpg)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(
+            hide_password=False
+        )
+    if backend == "postgresql":
+        return parsed.set(drivername="postgresql+asyncpg").render_as_string(
+            hide_password=False
+        )
+    return url
+
+
+def _env_flag(env: Mapping[str, str], name: str, default: bool) -> bool:
+    raw = env.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes"}
+
+
+class _CheckoutTimingMixin:
+    """Record how long callers wait for a pooled connection."""
+
+    metrics_label = "sync"
+
+    def _do_get(self):  # SQLAlchemy's pool checkout hook
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(engine=self.metrics_label)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(
+                time.perf_counter() - started, engine=self.metrics_label
+            )
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _engine_options(
+    url: str, env: Mapping[str, str] = os.environ, *, is_async: bool = False
+) -> Dict[str, Any]:
+    """create_engine kwargs from DB_POOL_* settings.
+
+    In-memory SQLite keeps SQLAlchemy's single-connection pool, which takes
+    no sizing options.
+    """
+    options: Dict[str, Any] = {}
+    if make_url(url).get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    if _is_sqlite_memory(url):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=int(env.get("DB_POOL_SIZE", "5")),
+        max_overflow=int(env.get("DB_MAX_OVERFLOW", "10")),
+        pool_timeout=float(env.get("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(env.get("DB_POOL_RECYCLE", "1800")),
+        pool_pre_ping=_env_flag(env, "DB_POOL_PRE_PING", True),
+    )
+    return options
+
+
+_SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SQLITE_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def _sqlite_pragmas(env: Mapping[str, str] = os.environ) -> Dict[str, str]:
+    """Per-connection SQLite tuning; values are allow-listed before use in SQL."""
+    journal_mode = env.get("SQLITE_JOURNAL_MODE", "WAL").upper()
+    synchronous = env.get("SQLITE_SYNCHRONOUS", "NORMAL").upper()
+    if journal_mode not in _SQLITE_JOURNAL_MODES:
+        raise RuntimeError(f"Unsupported SQLITE_JOURNAL_MODE '{journal_mode}'")
+    if synchronous not in _SQLITE_SYNCHRONOUS:
+        raise RuntimeError(f"Unsupported SQLITE_SYNCHRONOUS '{synchronous}'")
+    busy_timeout = int(env.get("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    return {
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "busy_timeout": str(busy_timeout),
+    }
+
+
+def _configure_engine(sync_engine: Engine, url: str, label: str) -> None:
+    if make_url(url).get_backend_name() == "sqlite":
+        pragmas = _sqlite_pragmas()
+        if _is_sqlite_memory(url):
+            pragmas.pop("journal_mode")  # WAL does not apply to :memory:
+
+        @event.listens_for(sync_engine, "connect")
+        def _apply_sqlite_pragmas(dbapi_connection, _record) -> None:
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    pool = sync_engine.pool
+    if isinstance(pool, QueuePool):
+        POOL_CHECKED_OUT.set_function(pool.checkedout, engine=label)
+        POOL_OVERFLOW.set_function(pool.overflow, engine=label)
+        POOL_SIZE.set_function(pool.size, engine=label)
+
+
 DATABASE_URL = _get_database_url()
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _to_async_url(DATABASE_URL)
+# DB_ASYNC=true serves the hot API routes from AsyncSession-based handlers
+ASYNC_DB_ENABLED = _env_flag(os.environ, "DB_ASYNC", False)
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args=(
-        {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-    ),
-)
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+_configure_engine(engine, DATABASE_URL, "sync")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -33,8 +234,105 @@ def get_db() -> Generator:
         db.close()
 
 
-def init_db() -> None:
-    """Create all tables. Call once on application startup."""
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    # Created lazily so the async driver is only required when it is used.
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL, is_async=True)
+    )
+    _configure_engine(async_engine.sync_engine, ASYNC_DATABASE_URL, "async")
+    return async_engine
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+# NOT NULL columns added to tables that already existed in a release. ALTER
+# TABLE needs a constant default for them; the optional SQL expression then
+# backfills existing rows. Nullable columns need no entry.
+ADDED_COLUMN_DEFAULTS: Dict[tuple[str, str], tuple[str, Optional[str]]] = {
+    ("boards", "updated_at"): ("'1970-01-01 00:00:00'", "created_at"),
+    ("boards", "version"): ("0", None),
+}
+
+
+def upgrade_schema(bind: Engine) -> None:
+    """Add the columns and indexes `create_all` skips on existing tables.
+
+    Idempotent: only what the database lacks is added, so it is safe to run
+    on every startup.
+    """
+    preparer = bind.dialect.identifier_preparer
+    with bind.begin() as conn:
+        inspector = inspect(conn)
+        existing = set(inspector.get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing:
+                continue
+            present = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present:
+                    continue
+                ddl = (
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN "
+                    f"{preparer.format_column(column)} "
+                    f"{column.type.compile(dialect=bind.dialect)}"
+                )
+                backfill = None
+                if not column.nullable:
+                    try:
+                        default, backfill = ADDED_COLUMN_DEFAULTS[
+                            (table.name, column.name)
+                        ]
+                    except KeyError:
+                        raise RuntimeError(
+                            f"no upgrade default for {table.name}.{column.name}"
+                        ) from None
+                    ddl += f" NOT NULL DEFAULT {default}"
+                conn.execute(text(ddl))
+                if backfill is not None:
+                    conn.execute(
+                        text(
+                            f"UPDATE {preparer.format_table(table)} "
+                            f"SET {preparer.format_column(column)} = {backfill}"
+                        )
+                    )
+            indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(conn)
+
+
+def init_db(bind: Optional[Engine] = None) -> None:
+    """Create missing tables and upgrade existing ones. Call once on startup.
+
+    Summary tables and the search index created here for an existing `cards`
+    table are filled from it, so they do not start out empty next to cards that
+    are already there.
+    """
     from src.adapters import models  # noqa: F401  - ensure models are imported
+    from src.services.search import ensure_search_index
+    from src.services.stats import rebuild_board_stats
 
-    Base.metadata.create_all(bind=engine)
+    bind = bind or engine
+    existing = set(inspect(bind).get_table_names())
+    Base.metadata.create_all(bind=bind)
+    upgrade_schema(bind)
+    if "cards" not in existing:
+        return
+    with Session(bind) as db:
+        if "board_column_stats" not in existing:
+            rebuild_board_stats(db, fix=True)
+        # The FTS table and its triggers come with a freshly created `cards`
+        # table only. The Postgres index is a cheap IF NOT EXISTS.
+        if bind.dialect.name != "sqlite" or "cards_fts" not in existing:
+            ensure_search_index(db)
@@ -1,14 +1,20 @@
 from datetime import datetime, timezone
 
 from sqlalchemy import (
+    DDL,
+    JSON,
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
+    Text,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.orm import relationship
 
@@ -40,6 +46,9 @@ class Board(Base):
     title = Column(String(255), nullable=False)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    # Bumped with every card change on the board; drives snapshot ETags.
+    updated_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    version = Column(Integer, default=0, nullable=False)
 
     owner = relationship("User", back_populates="boards")
     cards = relationship("Card", back_populates="board")
@@ -51,6 +60,14 @@ class Card(Base):
         UniqueConstraint(
             "board_id", "column", "order_idx", name="uq_cards_board_column_order"
         ),
+        # Matches the list_cards ordering so keyset pages are a single range scan.
+        Index(
+            "ix_cards_board_column_order_id", "board_id", "column", "order_idx", "id"
+        ),
+        # Delta sync reads a board's cards changed after a point in time.
+        Index("ix_cards_board_updated_at", "board_id", "updated_at"),
+        # Board stats count overdue cards at read time.
+        Index("ix_cards_board_due_date", "board_id", "due_date"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -63,6 +80,155 @@ class Card(Base):
     updated_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
     estimate_hours = Column(Numeric(10, 2), nullable=True)
     due_date = Column(DateTime(timezone=True), nullable=True)
+    # Last result of the external scoring service, written by score jobs.
+    score = Column(Float, nullable=True)
 
     board = relationship("Board", back_populates="cards")
     owner = relationship("User", back_populates="cards")
+    # Loaded for a whole result set with one extra IN query, so listing cards
+    # with their attachments never goes N+1.
+    attachments = relationship(
+        "Attachment",
+        back_populates="card",
+        lazy="selectin",
+        order_by="Attachment.id",
+        cascade="all, delete-orphan",
+    )
+
+
+# Full-text index over card titles, queried by src.services.search. SQLite keeps
+# an external-content FTS5 table in step through triggers, so every write path
+# (ORM flushes, bulk UPDATEs, batches) is covered; Postgres indexes the
+# tsvector expression directly. Statements are idempotent so they can also be
+# applied to an existing database.
+CARD_SEARCH_DDL = {
+    "sqlite": (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5("
+        "title, content='cards', content_rowid='id', prefix='2 3', "
+        "tokenize='unicode61 remove_diacritics 2')",
+        "CREATE TRIGGER IF NOT EXISTS cards_fts_ai AFTER INSERT ON cards BEGIN "
+        "INSERT INTO cards_fts(rowid, title) VALUES (new.id, new.title); END",
+        "CREATE TRIGGER IF NOT EXISTS cards_fts_ad AFTER DELETE ON cards BEGIN "
+        "INSERT INTO cards_fts(cards_fts, rowid, title) "
+        "VALUES ('delete', old.id, old.title); END",
+        "CREATE TRIGGER IF NOT EXISTS cards_fts_au AFTER UPDATE OF title ON cards "
+        "BEGIN INSERT INTO cards_fts(cards_fts, rowid, title) "
+        "VALUES ('delete', old.id, old.title); "
+        "INSERT INTO cards_fts(rowid, title) VALUES (new.id, new.title); END",
+    ),
+    "postgresql": (
+        "CREATE INDEX IF NOT EXISTS ix_cards_title_fts ON cards "
+        "USING gin (to_tsvector('simple', title))",
+    ),
+}
+for _dialect, _statements in CARD_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            Card.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect)
+        )
+event.listen(
+    Card.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS cards_fts").execute_if(dialect="sqlite"),
+)
+
+
+class BoardColumnStats(Base):
+    """Card counters per (board, column), maintained by the card services."""
+
+    __tablename__ = "board_column_stats"
+
+    board_id = Column(Integer, ForeignKey("boards.id"), primary_key=True)
+    column = Column(String(64), primary_key=True)
+    card_count = Column(Integer, nullable=False, default=0)
+    estimate_total = Column(Numeric(14, 2), nullable=False, default=0)
+
+
+class CardTombstone(Base):
+    """Deleted card ids, so delta sync can report deletions."""
+
+    __tablename__ = "card_tombstones"
+    __table_args__ = (
+        Index("ix_card_tombstones_board_deleted_at", "board_id", "deleted_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    card_id = Column(Integer, nullable=False)
+    board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+
+class UploadBlob(Base):
+    """Stored upload content, keyed by its SHA-256; shared by identical uploads."""
+
+    __tablename__ = "upload_blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    content_type = Column(String(64), nullable=False)
+    size = Column(Integer, nullable=False)
+    # Number of Upload rows pointing at this blob; the file goes when it hits 0.
+    ref_count = Column(Integer, nullable=False, default=0)
+    # None until first attached, then pending -> ready | failed (thumbnail job).
+    thumbnail = Column(String(16), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+
+class Upload(Base):
+    """A user's handle on uploaded content (ADR-001 UUID name)."""
+
+    __tablename__ = "uploads"
+
+    id = Column(String(32), primary_key=True)
+    sha256 = Column(
+        String(64), ForeignKey("upload_blobs.sha256"), nullable=False, index=True
+    )
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    content_type = Column(String(64), nullable=False)
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+    blob = relationship("UploadBlob", lazy="joined", innerjoin=True)
+
+
+class Attachment(Base):
+    """An upload shown on a card."""
+
+    __tablename__ = "card_attachments"
+    __table_args__ = (
+        UniqueConstraint("card_id", "upload_id", name="uq_card_attachments_upload"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    card_id = Column(
+        Integer, ForeignKey("cards.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    upload_id = Column(String(32), ForeignKey("uploads.id"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+    card = relationship("Card", back_populates="attachments")
+    upload = relationship("Upload", lazy="joined", innerjoin=True)
+
+
+class Job(Base):
+    """Unit of background work; see src.services.jobs for the state machine."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Workers scan for due jobs by status and run_after.
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(64), nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String(16), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    locked_by = Column(String(128), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    result = Column(JSON, nullable=True)
+    last_error = Column(Text, nullable=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
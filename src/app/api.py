@@ -1,35 +1,76 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import os
+from pathlib import Path
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from src.adapters.db import get_db
-from src.adapters.models import Board, User
+from src.adapters.models import Board, Job
+from src.app.responses import RangeFileResponse
 from src.domain.schemas import (
     ApiErrorPayload,
+    AttachmentCreate,
+    AttachmentOut,
+    BoardChanges,
     BoardCreate,
     BoardOut,
+    BoardScoreResponse,
+    BoardSnapshot,
+    BoardStats,
+    CardBatchRequest,
+    CardBatchResponse,
     CardCreate,
     CardMove,
     CardOut,
     CardUpdate,
+    JobOut,
+    JobStatus,
     ScoreRequest,
     ScoreResponse,
     Token,
+    UploadOut,
     UserCreate,
     UserOut,
 )
+from src.services import attachments as attachments_svc
 from src.services import auth as auth_svc
+from src.services import boards as boards_svc
+from src.services import events as events_svc
+from src.services import jobs as jobs_svc
+from src.services import stats as stats_svc
+from src.services import transfer as transfer_svc
+from src.services import uploads as uploads_svc
 from src.services.cards import (
+    apply_card_batch,
     create_card,
     delete_card,
     get_card,
-    list_cards,
+    list_cards_page,
     move_card,
     to_card_out,
-    to_cards_out,
     update_card,
 )
-from src.services.external import fetch_score_or_raise
+from src.services.external import (
+    build_score_payload,
+    enqueue_card_scoring,
+    fetch_score_or_raise_async,
+    score_cards,
+)
+from src.services.principals import Principal
+from src.services.search import search_cards
+from src.services.serialization import attachment_to_dict, cards_json
 
 router = APIRouter(prefix="/api/v1")
 
@@ -39,6 +80,14 @@ def _wrap_error(code: str, message: str, status_code: int) -> HTTPException:
     return HTTPException(status_code=status_code, detail=payload.model_dump())
 
 
+def _job_accepted(job: Job) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=JobOut.model_validate(job).model_dump(mode="json"),
+        headers={"Location": f"{router.prefix}/jobs/{job.id}"},
+    )
+
+
 @router.post(
     "/auth/register", response_model=UserOut, status_code=status.HTTP_201_CREATED
 )
@@ -71,7 +120,7 @@ def logout():
 def create_board(
     data: BoardCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
     board = Board(title=data.title, owner_id=current_user.id)
     db.add(board)
@@ -83,7 +132,7 @@ def create_board(
 @router.get("/boards", response_model=list[BoardOut])
 def list_boards(
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
     q = db.query(Board)
     if current_user.role != "admin":
@@ -92,21 +141,134 @@ def list_boards(
     return boards
 
 
+@router.post(
+    "/boards/import", response_model=BoardOut, status_code=status.HTTP_201_CREATED
+)
+async def import_board_endpoint(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    """NDJSON body as produced by /boards/{id}/export; creates a new board."""
+    return await transfer_svc.import_board(db, current_user, request.stream())
+
+
+@router.get("/boards/{board_id}/export", response_class=StreamingResponse)
+def export_board_endpoint(
+    board_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    board = boards_svc.get_board(db, board_id, current_user)
+    return StreamingResponse(
+        transfer_svc.export_board_ndjson(board.id),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="board-{board.id}.ndjson"'
+        },
+    )
+
+
+@router.get("/boards/{board_id}/snapshot", response_model=BoardSnapshot)
+def board_snapshot_endpoint(
+    board_id: int,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    board = boards_svc.get_board(db, board_id, current_user)
+    etag = boards_svc.board_etag(board)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if boards_svc.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=boards_svc.board_snapshot_json(db, board),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.get("/boards/{board_id}/changes", response_model=BoardChanges)
+def board_changes_endpoint(
+    board_id: int,
+    since: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    board = boards_svc.get_board(db, board_id, current_user)
+    return Response(
+        content=boards_svc.board_changes_json(db, board, since),
+        media_type="application/json",
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+@router.get("/boards/{board_id}/stats", response_model=BoardStats)
+def board_stats_endpoint(
+    board_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    board = boards_svc.get_board(db, board_id, current_user)
+    return stats_svc.board_stats(db, board)
+
+
+@router.get("/boards/{board_id}/events", response_class=StreamingResponse)
+async def board_events_endpoint(
+    board_id: int,
+    last_event_id: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    """Server-sent events with card changes on the board, resumable by Last-Event-ID."""
+    await run_in_threadpool(boards_svc.get_board, db, board_id, current_user)
+    sub = events_svc.broker.subscribe(board_id, last_event_id)
+    return StreamingResponse(
+        events_svc.board_event_stream(
+            sub, float(os.getenv("EVENTS_KEEPALIVE_SECONDS", "15"))
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/cards", response_model=CardOut, status_code=status.HTTP_201_CREATED)
 def create_card_endpoint(
     data: CardCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
     card = create_card(db, current_user, data)
     return to_card_out(card)
 
 
+@router.post("/cards/batch", response_model=CardBatchResponse)
+def batch_cards_endpoint(
+    data: CardBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    results = apply_card_batch(db, current_user, data.operations)
+    return CardBatchResponse(results=results)
+
+
+@router.get("/cards/search", response_model=list[CardOut])
+def search_cards_endpoint(
+    q: str = Query(min_length=1, max_length=200),
+    board_id: int | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    cards = search_cards(db, current_user, q, board_id=board_id, limit=limit)
+    return Response(content=cards_json(cards), media_type="application/json")
+
+
 @router.get("/cards/{card_id}", response_model=CardOut)
 def get_card_endpoint(
     card_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
     card = get_card(db, card_id, current_user)
     return to_card_out(card)
@@ -118,18 +280,28 @@ def list_cards_endpoint(
     offset: int = 0,
     column: str | None = None,
     board_id: int | None = None,
+    cursor: str | None = None,
+    x_cache_bypass: str | None = Header(default=None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
-    cards = list_cards(
+    body, next_cursor, cache_result = list_cards_page(
         db=db,
         requester=current_user,
         limit=limit,
         offset=offset,
         column=column,
         board_id=board_id,
+        cursor=cursor,
+        use_cache=not x_cache_bypass,
     )
-    return to_cards_out(list(cards))
+    headers = {}
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+    if cache_result is not None:
+        headers["X-Cache"] = cache_result.upper()
+    # Rows come from our own DB: skip CardOut re-validation, encode directly.
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.patch("/cards/{card_id}", response_model=CardOut)
@@ -137,7 +309,7 @@ def update_card_endpoint(
     card_id: int,
     data: CardUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
     card = update_card(db, card_id, current_user, data)
     return to_card_out(card)
@@ -147,7 +319,7 @@ def update_card_endpoint(
 def delete_card_endpoint(
     card_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
     delete_card(db, card_id, current_user)
     return
@@ -158,28 +330,191 @@ def move_card_endpoint(
     card_id: int,
     data: CardMove,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
     card = move_card(db, card_id, current_user, data)
     return to_card_out(card)
 
 
-@router.post("/cards/{card_id}/score", response_model=ScoreResponse)
-def score_card_endpoint(
+@router.post(
+    "/cards/{card_id}/score",
+    response_model=ScoreResponse,
+    responses={202: {"model": JobOut}},
+)
+async def score_card_endpoint(
     card_id: int,
     data: ScoreRequest,
+    run_async: bool = Query(False, alias="async"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_svc.get_current_active_user),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
 ):
-    card = get_card(db, card_id, current_user)
-    payload = {
-        "title": card.title,
-        "column": card.column,
-        "estimate_hours": (
-            float(card.estimate_hours) if card.estimate_hours is not None else None
-        ),
-        "due_date": card.due_date.isoformat() if card.due_date else None,
-        "context": data.context,
-    }
-    score = fetch_score_or_raise(payload)
+    # Only the card lookup needs a thread; the scoring call awaits on the loop.
+    card = await run_in_threadpool(get_card, db, card_id, current_user)
+    if run_async:
+        job = await run_in_threadpool(
+            enqueue_card_scoring, db, card, data.context, current_user
+        )
+        return _job_accepted(job)
+    score = await fetch_score_or_raise_async(build_score_payload(card, data.context))
     return ScoreResponse(score=score)
+
+
+@router.post("/boards/{board_id}/score", response_model=BoardScoreResponse)
+async def score_board_endpoint(
+    board_id: int,
+    data: ScoreRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    cards = await run_in_threadpool(
+        boards_svc.load_board_cards, db, board_id, current_user
+    )
+    return BoardScoreResponse(results=await score_cards(cards, data.context))
+
+
+@router.get("/jobs", response_model=list[JobOut])
+def list_jobs_endpoint(
+    status_filter: JobStatus | None = Query(None, alias="status"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    return jobs_svc.list_jobs(db, current_user, status_filter, limit)
+
+
+@router.get("/jobs/{job_id}", response_model=JobOut)
+def get_job_endpoint(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    return jobs_svc.get_job(db, job_id, current_user)
+
+
+@router.post("/upload", response_model=UploadOut, status_code=status.HTTP_201_CREATED)
+async def upload_endpoint(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    """Raw image body (Content-Type image/png or image/jpeg), streamed to disk."""
+    received = await uploads_svc.receive_upload(
+        request.stream(),
+        request.headers.get("content-type"),
+        request.headers.get("content-length"),
+    )
+    return await run_in_threadpool(
+        uploads_svc.register_upload, db, received, current_user
+    )
+
+
+def _file_response(
+    path: Path,
+    *,
+    size: int,
+    media_type: str,
+    etag: str,
+    range_header: str | None,
+    if_range: str | None,
+    if_none_match: str | None,
+) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if boards_svc.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    accel_prefix = os.getenv("UPLOAD_ACCEL_REDIRECT")
+    if accel_prefix:
+        # nginx serves the file itself (sendfile, ranges) from an internal location.
+        return Response(
+            media_type=media_type,
+            headers={**headers, "X-Accel-Redirect": accel_prefix + path.name},
+        )
+    return RangeFileResponse(
+        path,
+        size=size,
+        media_type=media_type,
+        etag=etag,
+        range_header=range_header,
+        if_range=if_range,
+        headers={"Cache-Control": headers["Cache-Control"]},
+    )
+
+
+@router.get("/uploads/{upload_id}", response_class=Response)
+def download_upload_endpoint(
+    upload_id: str,
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_range: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    upload = uploads_svc.get_upload(db, upload_id, current_user)
+    return _file_response(
+        uploads_svc.blob_path(upload.sha256, upload.content_type),
+        size=upload.size,
+        media_type=upload.content_type,
+        etag=uploads_svc.upload_etag(upload),
+        range_header=range_header,
+        if_range=if_range,
+        if_none_match=if_none_match,
+    )
+
+
+@router.get("/uploads/{upload_id}/thumbnail", response_class=Response)
+def download_thumbnail_endpoint(
+    upload_id: str,
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_range: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    upload, path = attachments_svc.get_thumbnail(db, upload_id, current_user)
+    return _file_response(
+        path,
+        size=path.stat().st_size,
+        media_type=upload.content_type,
+        etag=attachments_svc.thumbnail_etag(upload),
+        range_header=range_header,
+        if_range=if_range,
+        if_none_match=if_none_match,
+    )
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_upload_endpoint(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    uploads_svc.delete_upload(db, upload_id, current_user)
+    return
+
+
+@router.post(
+    "/cards/{card_id}/attachments",
+    response_model=AttachmentOut,
+    status_code=status.HTTP_201_CREATED,
+)
+def add_attachment_endpoint(
+    card_id: int,
+    data: AttachmentCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    attachment = attachments_svc.add_attachment(db, card_id, current_user, data)
+    return attachment_to_dict(attachment)
+
+
+@router.delete(
+    "/cards/{card_id}/attachments/{attachment_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def remove_attachment_endpoint(
+    card_id: int,
+    attachment_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user),
+):
+    attachments_svc.remove_attachment(db, card_id, attachment_id, current_user)
+    return
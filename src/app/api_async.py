@@ -0,0 +1,228 @@
+"""
+AsyncSession-backed versions of the hot API routes (enabled with DB_ASYNC=true).
+
+Paths, payloads and error codes mirror `src.app.api`; routes that are not
+redefined here keep being served by the sync router.
+"""
+
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.db import get_async_db
+from src.adapters.models import Board
+from src.app.api import _job_accepted, _wrap_error
+from src.domain.schemas import (
+    BoardCreate,
+    BoardOut,
+    BoardScoreResponse,
+    CardCreate,
+    CardMove,
+    CardOut,
+    CardUpdate,
+    JobOut,
+    ScoreRequest,
+    ScoreResponse,
+    Token,
+    UserCreate,
+    UserOut,
+)
+from src.services import auth as auth_svc
+from src.services import boards as boards_svc
+from src.services.cards import (
+    create_card_async,
+    delete_card_async,
+    get_card_async,
+    list_cards_page_async,
+    move_card_async,
+    to_card_out,
+    update_card_async,
+)
+from src.services.external import (
+    build_score_payload,
+    enqueue_card_scoring,
+    fetch_score_or_raise_async,
+    score_cards,
+)
+from src.services.principals import Principal
+from src.services.search import search_cards_async
+from src.services.serialization import cards_json
+
+router = APIRouter(prefix="/api/v1")
+
+
+@router.post(
+    "/auth/register", response_model=UserOut, status_code=status.HTTP_201_CREATED
+)
+async def register_user(data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    return await auth_svc.create_user_async(db, data)
+
+
+@router.post("/auth/login", response_model=Token)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    user = await auth_svc.authenticate_user_async(
+        db, form_data.username, form_data.password
+    )
+    if not user:
+        raise _wrap_error(
+            code="INVALID_CREDENTIALS",
+            message="Incorrect email or password",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    return auth_svc.issue_token_for_user(user)
+
+
+@router.post("/boards", response_model=BoardOut, status_code=status.HTTP_201_CREATED)
+async def create_board(
+    data: BoardCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    board = Board(title=data.title, owner_id=current_user.id)
+    db.add(board)
+    await db.commit()
+    await db.refresh(board)
+    return board
+
+
+@router.get("/boards", response_model=list[BoardOut])
+async def list_boards(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    stmt = select(Board)
+    if current_user.role != "admin":
+        stmt = stmt.where(Board.owner_id == current_user.id)
+    result = await db.execute(stmt.order_by(Board.id.asc()))
+    return result.scalars().all()
+
+
+@router.post("/cards", response_model=CardOut, status_code=status.HTTP_201_CREATED)
+async def create_card_endpoint(
+    data: CardCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    card = await create_card_async(db, current_user, data)
+    return to_card_out(card)
+
+
+@router.get("/cards/search", response_model=list[CardOut])
+async def search_cards_endpoint(
+    q: str = Query(min_length=1, max_length=200),
+    board_id: int | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    cards = await search_cards_async(
+        db, current_user, q, board_id=board_id, limit=limit
+    )
+    return Response(content=cards_json(cards), media_type="application/json")
+
+
+@router.get("/cards/{card_id}", response_model=CardOut)
+async def get_card_endpoint(
+    card_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    card = await get_card_async(db, card_id, current_user)
+    return to_card_out(card)
+
+
+@router.get("/cards", response_model=list[CardOut])
+async def list_cards_endpoint(
+    limit: int = 20,
+    offset: int = 0,
+    column: str | None = None,
+    board_id: int | None = None,
+    cursor: str | None = None,
+    x_cache_bypass: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    body, next_cursor, cache_result = await list_cards_page_async(
+        db=db,
+        requester=current_user,
+        limit=limit,
+        offset=offset,
+        column=column,
+        board_id=board_id,
+        cursor=cursor,
+        use_cache=not x_cache_bypass,
+    )
+    headers = {}
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+    if cache_result is not None:
+        headers["X-Cache"] = cache_result.upper()
+    # Rows come from our own DB: skip CardOut re-validation, encode directly.
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.patch("/cards/{card_id}", response_model=CardOut)
+async def update_card_endpoint(
+    card_id: int,
+    data: CardUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    card = await update_card_async(db, card_id, current_user, data)
+    return to_card_out(card)
+
+
+@router.delete("/cards/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_card_endpoint(
+    card_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    await delete_card_async(db, card_id, current_user)
+    return
+
+
+@router.patch("/cards/{card_id}/move", response_model=CardOut)
+async def move_card_endpoint(
+    card_id: int,
+    data: CardMove,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    card = await move_card_async(db, card_id, current_user, data)
+    return to_card_out(card)
+
+
+@router.post(
+    "/cards/{card_id}/score",
+    response_model=ScoreResponse,
+    responses={202: {"model": JobOut}},
+)
+async def score_card_endpoint(
+    card_id: int,
+    data: ScoreRequest,
+    run_async: bool = Query(False, alias="async"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    card = await get_card_async(db, card_id, current_user)
+    if run_async:
+        job = await db.run_sync(enqueue_card_scoring, card, data.context, current_user)
+        return _job_accepted(job)
+    score = await fetch_score_or_raise_async(build_score_payload(card, data.context))
+    return ScoreResponse(score=score)
+
+
+@router.post("/boards/{board_id}/score", response_model=BoardScoreResponse)
+async def score_board_endpoint(
+    board_id: int,
+    data: ScoreRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(auth_svc.get_current_active_user_async),
+):
+    cards = await boards_svc.load_board_cards_async(db, board_id, current_user)
+    return BoardScoreResponse(results=await score_cards(cards, data.context))
@@ -0,0 +1,184 @@
+"""
+Pure ASGI middleware for the API (no BaseHTTPMiddleware task/stream wrapping).
+"""
+
+import logging
+import re
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.db import QueryStats, current_query_stats
+from src.services.metrics import REGISTRY
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests",
+    "HTTP requests by method, route template and status code",
+    labelnames=("method", "route", "status"),
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until the response is fully sent",
+    labelnames=("method", "route"),
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+)
+HTTP_DB_QUERIES = REGISTRY.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request",
+    labelnames=("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+HTTP_DB_SECONDS = REGISTRY.histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL statements per HTTP request",
+    labelnames=("route",),
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route; never the raw path (label cardinality)."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if path is not None else "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            current_query_stats.reset(token)
+            route = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+            HTTP_LATENCY.observe(elapsed, method=method, route=route)
+            HTTP_DB_QUERIES.observe(stats.count, route=route)
+            HTTP_DB_SECONDS.observe(stats.seconds, route=route)
+
+
+CORRELATION_HEADER = "X-Correlation-Id"
+_CORRELATION_HEADER_KEY = CORRELATION_HEADER.lower().encode("latin-1")
+# Client-supplied ids end up in logs, so only accept a conservative token format.
+_CORRELATION_ID_RE = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+access_logger = logging.getLogger("idea_kanban.access")
+
+
+@dataclass(frozen=True)
+class AccessLogRecord:
+    correlation_id: str
+    method: str
+    path: str
+    route: str
+    status: int
+    duration_seconds: float
+    response_bytes: int
+    client: Optional[str]
+
+
+AccessLogHook = Callable[[AccessLogRecord], None]
+
+
+def log_access(record: AccessLogRecord) -> None:
+    """Default hook: one structured INFO line per finished request."""
+    if access_logger.isEnabledFor(logging.INFO):
+        access_logger.info(
+            "%s %s %s %.1fms",
+            record.method,
+            record.path,
+            record.status,
+            record.duration_seconds * 1000,
+            extra={"access": asdict(record)},
+        )
+
+
+def _incoming_correlation_id(scope: Scope) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == _CORRELATION_HEADER_KEY:
+            candidate = value.decode("latin-1")
+            if _CORRELATION_ID_RE.fullmatch(candidate):
+                return candidate
+            return None
+    return None
+
+
+class CorrelationIdMiddleware:
+    """Propagate X-Correlation-Id, time the request and emit access-log hooks.
+
+    Messages are forwarded as they arrive, so streaming bodies are never
+    buffered. `request.state.correlation_id` and `request_started` are set
+    for handlers.
+    """
+
+    def __init__(self, app: ASGIApp, hooks: Sequence[AccessLogHook] = ()) -> None:
+        self.app = app
+        self.hooks = tuple(hooks)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        corr_id = _incoming_correlation_id(scope) or uuid.uuid4().hex
+        started = time.perf_counter()
+        state = scope.setdefault("state", {})
+        state["correlation_id"] = corr_id
+        state["request_started"] = started
+        status_code = 500
+        response_bytes = 0
+
+        async def send_with_correlation(message: Message) -> None:
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers[CORRELATION_HEADER] = corr_id
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                headers.append("Server-Timing", f"app;dur={elapsed_ms:.1f}")
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_correlation)
+        finally:
+            if self.hooks:
+                record = AccessLogRecord(
+                    correlation_id=corr_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=route_template(scope),
+                    status=status_code,
+                    duration_seconds=time.perf_counter() - started,
+                    response_bytes=response_bytes,
+                    client=scope["client"][0] if scope.get("client") else None,
+                )
+                for hook in self.hooks:
+                    hook(record)
@@ -0,0 +1,132 @@
+"""
+File responses with single-range support and zero-copy sending.
+
+Starlette's FileResponse always sends the whole file through Python-level
+reads. `RangeFileResponse` honours `Range` / `If-Range` and hands the file
+descriptor to the server when it offers the ASGI `http.response.zerocopy`
+extension (sendfile); otherwise it streams fixed-size chunks, so memory stays
+constant either way. Behind nginx, setting UPLOAD_ACCEL_REDIRECT lets the
+proxy serve the bytes instead (see src/app/api.py).
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+import anyio
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Inclusive (start, end) for a single `bytes=` range.
+
+    Returns None when the header should be ignored (another unit, several
+    ranges or malformed syntax), which means serving the full file.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first.isdigit() or last.isdigit()):
+        return None
+    if not first:
+        # Suffix range: the last N bytes.
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - length), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+
+class RangeFileResponse(Response):
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        size: int,
+        media_type: str,
+        etag: str,
+        range_header: Optional[str] = None,
+        if_range: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.path = path
+        self.media_type = media_type
+        self.background = None
+        self.status_code = 200
+        self.offset, self.count = 0, size
+        response_headers: Dict[str, str] = {
+            **(headers or {}),
+            "accept-ranges": "bytes",
+            "etag": etag,
+        }
+        # If-Range: only honour the range if the client's copy is current.
+        if range_header and (if_range is None or if_range.strip() == etag):
+            try:
+                byte_range = parse_range(range_header, size)
+            except RangeNotSatisfiable:
+                self.status_code = 416
+                self.count = 0
+                response_headers["content-range"] = f"bytes */{size}"
+            else:
+                if byte_range is not None:
+                    start, end = byte_range
+                    self.status_code = 206
+                    self.offset, self.count = start, end - start + 1
+                    response_headers["content-range"] = f"bytes {start}-{end}/{size}"
+        response_headers["content-length"] = str(self.count)
+        self.init_headers(response_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if scope["method"].upper() == "HEAD" or self.count == 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        if "http.response.zerocopy" in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send(
+                    {
+                        "type": "http.response.zerocopy",
+                        "file": file.fileno(),
+                        "offset": self.offset,
+                        "count": self.count,
+                        "more_body": False,
+                    }
+                )
+            return
+        remaining = self.count
+        async with await anyio.open_file(self.path, "rb") as file:
+            await file.seek(self.offset, os.SEEK_SET)
+            while remaining:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:  # file shrank underneath us
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+        if remaining:
+            await send({"type": "http.response.body", "body": b""})
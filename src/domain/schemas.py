@@ -1,10 +1,19 @@
 from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    field_validator,
+    model_validator,
+)
 
 CardColumn = Literal["backlog", "todo", "in_progress", "done"]
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+ThumbnailStatus = Literal["pending", "ready", "failed"]
 
 
 class ApiErrorPayload(BaseModel):
@@ -49,6 +58,8 @@ class BoardOut(BoardBase):
     id: int
     owner_id: int
     created_at: datetime
+    updated_at: datetime
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -136,9 +147,37 @@ class CardUpdate(BaseModel):
 
 
 class CardMove(BaseModel):
+    """Target position: an explicit `order_idx`, or before/after another card.
+
+    With neither given the card is appended to the end of `column`.
+    """
+
     model_config = ConfigDict(extra="forbid")
     column: CardColumn
-    order_idx: int = Field(ge=0)
+    order_idx: Optional[int] = Field(default=None, ge=0)
+    before_id: Optional[int] = None
+    after_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def single_position(self) -> "CardMove":
+        given = [self.order_idx, self.before_id, self.after_id]
+        if sum(v is not None for v in given) > 1:
+            raise ValueError("use only one of order_idx, before_id, after_id")
+        return self
+
+
+class AttachmentCreate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    upload_id: str = Field(min_length=1, max_length=32)
+
+
+class AttachmentOut(BaseModel):
+    id: int
+    upload_id: str
+    content_type: str
+    size: int
+    thumbnail: ThumbnailStatus
+    created_at: datetime
 
 
 class CardOut(CardBase):
@@ -147,15 +186,125 @@ class CardOut(CardBase):
     owner_id: int
     created_at: datetime
     updated_at: datetime
+    score: Optional[float] = None
+    attachments: list[AttachmentOut] = []
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class BoardSnapshot(BaseModel):
+    board: BoardOut
+    columns: dict[CardColumn, list[CardOut]]
+
+
+class ColumnStats(BaseModel):
+    column: CardColumn
+    card_count: int
+    estimate_hours: Decimal
+    overdue: int
+
+
+class BoardStats(BaseModel):
+    board_id: int
+    card_count: int
+    estimate_hours: Decimal
+    overdue: int
+    columns: list[ColumnStats]
+
+
+class BoardChanges(BaseModel):
+    changed: list[CardOut]
+    deleted: list[int]
+    next_token: str
+
+
+class CardBatchCreate(CardCreate):
+    op: Literal["create"]
+
+
+class CardBatchUpdate(CardUpdate):
+    op: Literal["update"]
+    id: int
+
+
+class CardBatchMove(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    op: Literal["move"]
+    id: int
+    column: CardColumn
+    order_idx: int = Field(ge=0)
+
+
+class CardBatchDelete(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    op: Literal["delete"]
+    id: int
+
+
+CardBatchOperation = Annotated[
+    Union[CardBatchCreate, CardBatchUpdate, CardBatchMove, CardBatchDelete],
+    Field(discriminator="op"),
+]
+
+
+class CardBatchRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    operations: list[CardBatchOperation] = Field(min_length=1, max_length=500)
+
+
+class CardBatchResult(BaseModel):
+    index: int
+    op: str
+    status: int
+    card: Optional[CardOut] = None
+    error: Optional[ApiErrorPayload] = None
+
+
+class CardBatchResponse(BaseModel):
+    results: list[CardBatchResult]
+
+
 class ScoreRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
     context: Optional[str] = Field(default=None, max_length=1024)
 
 
+class UploadOut(BaseModel):
+    id: str
+    sha256: str
+    content_type: str
+    size: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ScoreResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
     score: float
+
+
+class CardScoreResult(BaseModel):
+    card_id: int
+    status: int
+    score: Optional[float] = None
+    error: Optional[ApiErrorPayload] = None
+
+
+class BoardScoreResponse(BaseModel):
+    results: list[CardScoreResult]
+
+
+class JobOut(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    result: Optional[dict] = None
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
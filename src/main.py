@@ -1,13 +1,16 @@
-import uuid
-
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import APIRouter, FastAPI, HTTPException, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse, Response
 
-from src.adapters.db import init_db
+from src.adapters.db import ASYNC_DB_ENABLED, init_db
 from src.app.api import router as api_router
+from src.app.api_async import router as async_api_router
+from src.app.middleware import CorrelationIdMiddleware, MetricsMiddleware, log_access
+from src.services import metrics
+from src.services.auth import shutdown_hash_pool
+from src.services.external import shutdown_score_service
+from src.services.jobs import job_runner
 
 app = FastAPI(
     title="Idea Kanban API",
@@ -17,29 +20,35 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
-
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):  # type: ignore[override]
-        corr_id = request.headers.get("X-Correlation-Id") or uuid.uuid4().hex
-        request.state.correlation_id = corr_id
-        response = await call_next(request)
-        response.headers["X-Correlation-Id"] = corr_id
-        return response
-
-
-app.add_middleware(CorrelationIdMiddleware)
+app.add_middleware(CorrelationIdMiddleware, hooks=[log_access])
+app.add_middleware(MetricsMiddleware)
 
 
 @app.on_event("startup")
 def on_startup() -> None:
     """Initialize database on application startup."""
     init_db()
+    job_runner.start()
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    job_runner.stop()
+    shutdown_hash_pool()
+
+
+@app.on_event("shutdown")
+async def close_score_client() -> None:
+    await shutdown_score_service()
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
+    headers = getattr(exc, "headers", None)
     if isinstance(exc.detail, dict) and "code" in exc.detail:
-        return JSONResponse(status_code=exc.status_code, content=exc.detail)
+        return JSONResponse(
+            status_code=exc.status_code, content=exc.detail, headers=headers
+        )
 
     if request.url.path.startswith("/api/v1"):
         message = exc.detail if isinstance(exc.detail, str) else "HTTP error"
@@ -47,11 +56,13 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         if exc.status_code == 401 and message == "Not authenticated":
             code = "UNAUTHORIZED"
         payload = {"code": code, "message": message, "details": {}}
-        return JSONResponse(status_code=exc.status_code, content=payload)
+        return JSONResponse(
+            status_code=exc.status_code, content=payload, headers=headers
+        )
 
     message = exc.detail if isinstance(exc.detail, str) else "HTTP error"
     payload = {"code": "HTTP_ERROR", "message": message, "details": {}}
-    return JSONResponse(status_code=exc.status_code, content=payload)
+    return JSONResponse(status_code=exc.status_code, content=payload, headers=headers)
 
 
 @app.exception_handler(RequestValidationError)
@@ -71,4 +82,32 @@ def health():
     return {"status": "ok"}
 
 
-app.include_router(api_router)
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint():
+    return Response(content=metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
+def include_api_routes(target: FastAPI, *, async_mode: bool) -> None:
+    """Mount the API; in async mode the AsyncSession routes take precedence."""
+    if not async_mode:
+        target.include_router(api_router)
+        return
+    target.include_router(async_api_router)
+    overridden = {
+        (route.path, method)
+        for route in async_api_router.routes
+        for method in getattr(route, "methods", ())
+    }
+    fallback = APIRouter()
+    fallback.routes.extend(
+        route
+        for route in api_router.routes
+        if not any(
+            (route.path, method) in overridden
+            for method in getattr(route, "methods", ())
+        )
+    )
+    target.include_router(fallback)
+
+
+include_api_routes(app, async_mode=ASYNC_DB_ENABLED)
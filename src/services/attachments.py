@@ -0,0 +1,188 @@
+"""
+Card attachments and their thumbnails.
+
+An attachment shows one of the requester's uploads on one of their cards.
+Cards carry their attachments inline in CardOut: ORM reads get them from the
+selectin-loaded `Card.attachments`, row-based reads from
+`attachments_by_card`, so a page of cards costs one extra query either way.
+
+Thumbnails belong to the blob, so identical images share one. The first
+attachment of a blob queues a `thumbnail` job; a worker from the job pool
+renders it next to the original as `<sha256>.thumb.<ext>`, marks the blob
+ready and touches every card showing it, so cached pages, ETags and delta
+sync pick the change up. Rendering needs Pillow, imported by the worker only.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.adapters.models import Attachment, Card, Job, Upload, UploadBlob
+from src.domain.schemas import AttachmentCreate
+from src.services import jobs
+from src.services.cards import get_card, touch_cards
+from src.services.metrics import REGISTRY
+from src.services.principals import Principal
+from src.services.uploads import blob_path, get_upload, thumbnail_path, upload_dir
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+THUMBNAIL_JOB = "thumbnail"
+THUMBNAIL_MAX_SIZE = int(os.getenv("THUMBNAIL_MAX_SIZE", "256"))
+# A 1 MB PNG can decode to gigabytes; bigger sources are not rendered.
+THUMBNAIL_MAX_PIXELS = int(os.getenv("THUMBNAIL_MAX_PIXELS", str(25_000_000)))
+
+THUMBNAILS = REGISTRY.counter(
+    "thumbnails", "Thumbnail renders by result", labelnames=("result",)
+)
+
+
+class ThumbnailError(Exception):
+    """The image cannot be thumbnailed; retrying will not help."""
+
+
+def _not_found(code: str, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={"code": code, "message": message, "details": {}},
+    )
+
+
+def _already_attached() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "code": "ATTACHMENT_EXISTS",
+            "message": "Upload is already attached to this card",
+            "details": {},
+        },
+    )
+
+
+def add_attachment(
+    db: Session, card_id: int, requester: Principal, data: AttachmentCreate
+) -> Attachment:
+    card = get_card(db, card_id, requester)
+    upload = get_upload(db, data.upload_id, requester)
+    if any(a.upload_id == upload.id for a in card.attachments):
+        raise _already_attached()
+    attachment = Attachment(upload=upload)
+    card.attachments.append(attachment)
+    blob = upload.blob
+    # Only the first attachment of a blob asks for its thumbnail; a second
+    # job racing in from another attach finds it ready and does nothing.
+    queue_thumbnail = blob.thumbnail is None
+    if queue_thumbnail:
+        blob.thumbnail = PENDING
+    try:
+        touch_cards(db, [card])
+        if queue_thumbnail:
+            # enqueue commits the attachment together with its job.
+            jobs.enqueue(db, THUMBNAIL_JOB, {"sha256": blob.sha256}, requester)
+        else:
+            db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise _already_attached()
+    db.refresh(attachment)
+    return attachment
+
+
+def remove_attachment(
+    db: Session, card_id: int, attachment_id: int, requester: Principal
+) -> None:
+    card = get_card(db, card_id, requester)
+    attachment = next((a for a in card.attachments if a.id == attachment_id), None)
+    if attachment is None:
+        raise _not_found("ATTACHMENT_NOT_FOUND", "Attachment not found")
+    # delete-orphan removes the row; the upload itself stays.
+    card.attachments.remove(attachment)
+    touch_cards(db, [card])
+    db.commit()
+
+
+def get_thumbnail(
+    db: Session, upload_id: str, requester: Principal
+) -> Tuple[Upload, Path]:
+    upload = get_upload(db, upload_id, requester)
+    if upload.blob.thumbnail != READY:
+        raise _not_found("THUMBNAIL_NOT_FOUND", "Thumbnail is not available")
+    return upload, thumbnail_path(upload.sha256, upload.content_type)
+
+
+def thumbnail_etag(upload: Upload) -> str:
+    return f'"{upload.sha256}-thumb"'
+
+
+def render_thumbnail(source: Path, target: Path, content_type: str) -> None:
+    """Write `source` scaled to fit a THUMBNAIL_MAX_SIZE square to `target`."""
+    try:
+        from PIL import Image
+    except ImportError as exc:
+        raise RuntimeError("Thumbnails need the Pillow package") from exc
+
+    image_format = "PNG" if content_type == "image/png" else "JPEG"
+    size = (THUMBNAIL_MAX_SIZE, THUMBNAIL_MAX_SIZE)
+    try:
+        image = Image.open(source, formats=[image_format])
+    except (Image.UnidentifiedImageError, Image.DecompressionBombError) as exc:
+        raise ThumbnailError(str(exc)) from exc
+    with image:
+        if image.width * image.height > THUMBNAIL_MAX_PIXELS:
+            raise ThumbnailError(f"{image.width}x{image.height} is too large")
+        try:
+            # JPEG decodes straight at a reduced scale; a no-op for PNG.
+            image.draft("RGB", size)
+            image.thumbnail(size)
+        except (OSError, SyntaxError, ValueError) as exc:
+            raise ThumbnailError(str(exc)) from exc
+        if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(target, image_format, optimize=True)
+
+
+@jobs.register_handler(THUMBNAIL_JOB)
+def _thumbnail_job(db: Session, job: Job) -> Dict[str, Any]:
+    sha256 = job.payload["sha256"]
+    blob = db.get(UploadBlob, sha256)
+    if blob is None or blob.thumbnail != PENDING:
+        return {"thumbnail": blob.thumbnail if blob else None}
+    content_type = blob.content_type
+    fd, temp_name = tempfile.mkstemp(dir=upload_dir(), prefix=".thumb-", suffix=".part")
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        try:
+            render_thumbnail(blob_path(sha256, content_type), temp_path, content_type)
+            result = READY
+        except ThumbnailError:
+            result = FAILED
+        # Re-read under a row lock: the blob may have been released meanwhile.
+        blob = db.get(UploadBlob, sha256, with_for_update=True, populate_existing=True)
+        if blob is None:
+            return {"thumbnail": None, "blob_deleted": True}
+        blob.thumbnail = result
+        # As in register_upload, the row write precedes placing the file, so
+        # release_blob cannot remove the blob in between.
+        db.flush()
+        if result == READY:
+            os.replace(temp_path, thumbnail_path(sha256, content_type))
+        cards = db.scalars(
+            select(Card)
+            .join(Attachment, Attachment.card_id == Card.id)
+            .join(Upload, Upload.id == Attachment.upload_id)
+            .where(Upload.sha256 == sha256)
+        ).unique()
+        touch_cards(db, cards)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    THUMBNAILS.inc(result=result)
+    return {"thumbnail": result}
@@ -5,11 +5,15 @@ import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.adapters.db import get_db
+from src.adapters.db import get_async_db, get_db
 from src.adapters.models import User
 from src.domain.schemas import Token, UserCreate
+from src.services.hash_pool import HashPoolSaturatedError, HashWorkerPool, pool_from_env
+from src.services.principals import Principal, principal_cache
 from src.services.secrets import get_secret
 
 # Lazy initialization to avoid bcrypt initialization bug with long test passwords
@@ -30,14 +34,75 @@ JWT_ALGORITHM = "HS256"
 JWT_EXPIRES_MINUTES = 60
 
 
-def get_password_hash(password: str) -> str:
+_hash_pool: HashWorkerPool | None = None
+
+
+def get_hash_pool() -> HashWorkerPool:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = pool_from_env()
+    return _hash_pool
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown()
+        _hash_pool = None
+
+
+def _hash_in_worker(password: str) -> str:
     return get_pwd_context().hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify_in_worker(plain_password: str, hashed_password: str) -> bool:
     return get_pwd_context().verify(plain_password, hashed_password)
 
 
+def _auth_busy_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "code": "AUTH_BUSY",
+            "message": "Authentication is temporarily overloaded, retry later",
+            "details": {},
+        },
+        headers={"Retry-After": "1"},
+    )
+
+
+def get_password_hash(password: str) -> str:
+    try:
+        return get_hash_pool().run("hash", _hash_in_worker, password)
+    except HashPoolSaturatedError as exc:
+        raise _auth_busy_error() from exc
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return get_hash_pool().run(
+            "verify", _verify_in_worker, plain_password, hashed_password
+        )
+    except HashPoolSaturatedError as exc:
+        raise _auth_busy_error() from exc
+
+
+async def get_password_hash_async(password: str) -> str:
+    try:
+        return await get_hash_pool().run_async("hash", _hash_in_worker, password)
+    except HashPoolSaturatedError as exc:
+        raise _auth_busy_error() from exc
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await get_hash_pool().run_async(
+            "verify", _verify_in_worker, plain_password, hashed_password
+        )
+    except HashPoolSaturatedError as exc:
+        raise _auth_busy_error() from exc
+
+
 def create_access_token(sub: str, role: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=JWT_EXPIRES_MINUTES)
     payload = {"sub": sub, "role": role, "exp": expire}
@@ -48,17 +113,21 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 
+def _user_exists_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "USER_ALREADY_EXISTS",
+            "message": "User already exists",
+            "details": {},
+        },
+    )
+
+
 def create_user(db: Session, data: UserCreate, role: str = "user") -> User:
     existing = get_user_by_email(db, data.email)
     if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "USER_ALREADY_EXISTS",
-                "message": "User already exists",
-                "details": {},
-            },
-        )
+        raise _user_exists_error()
     user = User(
         email=data.email,
         hashed_password=get_password_hash(data.password),
@@ -80,10 +149,8 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     return user
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail={
             "code": "UNAUTHORIZED",
@@ -92,6 +159,11 @@ def get_current_user(
         },
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_token(token: str) -> tuple[int, float]:
+    """Return (user id, exp as unix time) of a valid token."""
+    credentials_exception = _credentials_exception()
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         sub: str = payload.get("sub")  # type: ignore[assignment]
@@ -99,14 +171,67 @@ def get_current_user(
             raise credentials_exception
     except jwt.PyJWTError:
         raise credentials_exception
+    return int(sub), float(payload["exp"])
+
 
-    user = db.get(User, int(sub))
+def _remember_principal(token: str, user: User | None, exp: float) -> Principal:
     if user is None or not user.is_active:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    principal = Principal(id=user.id, role=user.role, is_active=user.is_active)
+    principal_cache.put(token, principal, exp)
+    return principal
+
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> Principal:
+    cached = principal_cache.get(token)
+    if cached is not None:
+        return cached
+    user_id, exp = _decode_token(token)
+    return _remember_principal(token, db.get(User, user_id), exp)
+
+
+_CHANGED_USERS_KEY = "principal_cache_invalidate"
+
+
+def _invalidate_on_commit(target: User) -> None:
+    # Flush is too early: a concurrent request could re-cache the old principal
+    # before the change commits and serve it for the whole TTL.
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault(_CHANGED_USERS_KEY, set()).add(target.id)
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+@event.listens_for(User, "after_update")
+def _invalidate_principal_on_user_change(_mapper, _connection, target: User) -> None:
+    state = inspect(target)
+    if (
+        state.attrs.role.history.has_changes()
+        or state.attrs.is_active.history.has_changes()
+    ):
+        _invalidate_on_commit(target)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_principal_on_user_delete(_mapper, _connection, target: User) -> None:
+    _invalidate_on_commit(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session) -> None:
+    for user_id in session.info.pop(_CHANGED_USERS_KEY, ()):
+        principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_principals(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS_KEY, None)
+
+
+def get_current_active_user(
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -115,7 +240,9 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
     return current_user
 
 
-def require_admin(current_user: User = Depends(get_current_active_user)) -> User:
+def require_admin(
+    current_user: Principal = Depends(get_current_active_user),
+) -> Principal:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -131,3 +258,56 @@ def require_admin(current_user: User = Depends(get_current_active_user)) -> User
 def issue_token_for_user(user: User) -> Token:
     token_str = create_access_token(sub=str(user.id), role=user.role)
     return Token(access_token=token_str)
+
+
+# Async variants used by the AsyncSession router (DB_ASYNC=true).
+
+
+async def get_user_by_email_async(db: AsyncSession, email: str) -> Optional[User]:
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
+
+
+async def create_user_async(
+    db: AsyncSession, data: UserCreate, role: str = "user"
+) -> User:
+    existing = await get_user_by_email_async(db, data.email)
+    if existing:
+        raise _user_exists_error()
+    user = User(
+        email=data.email,
+        hashed_password=await get_password_hash_async(data.password),
+        role=role,
+        is_active=True,
+    )
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+async def authenticate_user_async(
+    db: AsyncSession, email: str, password: str
+) -> Optional[User]:
+    user = await get_user_by_email_async(db, email)
+    if not user:
+        return None
+    if not await verify_password_async(password, user.hashed_password):
+        return None
+    return user
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> Principal:
+    cached = principal_cache.get(token)
+    if cached is not None:
+        return cached
+    user_id, exp = _decode_token(token)
+    return _remember_principal(token, await db.get(User, user_id), exp)
+
+
+async def get_current_active_user_async(
+    current_user: Principal = Depends(get_current_user_async),
+) -> Principal:
+    return get_current_active_user(current_user)
@@ -0,0 +1,181 @@
+import base64
+import binascii
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, get_args
+
+from fastapi import HTTPException, status
+from pydantic_core import to_json
+from sqlalchemy import asc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.adapters.models import Board, Card, CardTombstone
+from src.domain.schemas import BoardOut, CardColumn
+from src.services.principals import Principal
+from src.services.serialization import (
+    CARD_OUT_COLUMNS,
+    attachments_by_card,
+    card_to_dict,
+)
+
+
+def get_board(db: Session, board_id: int, requester: Principal) -> Board:
+    board = db.get(Board, board_id)
+    if board is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "BOARD_NOT_FOUND",
+                "message": "Board not found",
+                "details": {},
+            },
+        )
+    if board.owner_id != requester.id and requester.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": "FORBIDDEN", "message": "Access denied", "details": {}},
+        )
+    return board
+
+
+def load_board_cards(db: Session, board_id: int, requester: Principal) -> List[Card]:
+    """All cards of a board the requester can see, in display order."""
+    board = get_board(db, board_id, requester)
+    return list(
+        db.scalars(
+            select(Card)
+            .where(Card.board_id == board.id)
+            .order_by(asc(Card.column), asc(Card.order_idx), asc(Card.id))
+        )
+    )
+
+
+async def load_board_cards_async(
+    db: AsyncSession, board_id: int, requester: Principal
+) -> List[Card]:
+    return await db.run_sync(load_board_cards, board_id, requester)
+
+
+def board_etag(board: Board) -> str:
+    """Strong validator for everything rendered from the board's cards."""
+    return f'"board-{board.id}-v{board.version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so W/"x" matches "x".
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def board_snapshot_json(db: Session, board: Board) -> bytes:
+    """Board plus all its cards grouped by column, as JSON bytes.
+
+    Cards come from one indexed query as plain rows and are encoded in a
+    single pass, without building a Pydantic model per card.
+    """
+    rows = db.execute(
+        select(*CARD_OUT_COLUMNS)
+        .where(Card.board_id == board.id)
+        .order_by(asc(Card.column), asc(Card.order_idx), asc(Card.id))
+    )
+    attachments = attachments_by_card(db, Card.board_id == board.id)
+    columns: Dict[str, List[Dict[str, Any]]] = {c: [] for c in get_args(CardColumn)}
+    for row in rows:
+        card = card_to_dict(row, attachments)
+        columns.setdefault(card["column"], []).append(card)
+    board_out = BoardOut.model_validate(board).model_dump()
+    return to_json({"board": board_out, "columns": columns})
+
+
+# Writers stamp updated_at before they commit, so a change can become visible
+# slightly after a reader's clock passed its timestamp. Each delta re-reads
+# this much history; clients upsert, so the overlap is harmless.
+SYNC_OVERLAP = timedelta(seconds=5)
+# Tombstones older than this are pruned as new ones are written; a token that
+# predates the window may have missed deletes and must reload the snapshot.
+SYNC_TOMBSTONE_RETENTION = timedelta(
+    days=float(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+)
+
+
+def _invalid_sync_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "INVALID_SYNC_TOKEN",
+            "message": "Malformed or foreign sync token",
+            "details": {},
+        },
+    )
+
+
+def _expired_sync_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_410_GONE,
+        detail={
+            "code": "SYNC_TOKEN_EXPIRED",
+            "message": "Sync token is older than the tombstone retention window",
+            "details": {"retention_seconds": SYNC_TOMBSTONE_RETENTION.total_seconds()},
+        },
+    )
+
+
+def encode_sync_token(board_id: int, at: datetime) -> str:
+    raw = json.dumps([board_id, at.isoformat()], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sync_token(token: str, board_id: int) -> datetime:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        token_board, at = json.loads(raw)
+        since = datetime.fromisoformat(at)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise _invalid_sync_token() from None
+    if token_board != board_id or since.tzinfo is None:
+        raise _invalid_sync_token()
+    return since
+
+
+def board_changes_json(db: Session, board: Board, since: Optional[str]) -> bytes:
+    """Cards changed and ids deleted since `since`, plus the token for next time.
+
+    Both lookups are range scans on (board_id, updated_at / deleted_at), so the
+    cost follows the number of changes, not the size of the board. Without a
+    token every card is returned. Apply `deleted` before `changed`. A token older
+    than the tombstone retention window is answered with 410 SYNC_TOKEN_EXPIRED.
+    """
+    now = datetime.now(timezone.utc)
+    criteria = [Card.board_id == board.id]
+    deleted: List[int] = []
+    if since is not None:
+        after = decode_sync_token(since, board.id) - SYNC_OVERLAP
+        if after < now - SYNC_TOMBSTONE_RETENTION:
+            raise _expired_sync_token()
+        criteria.append(Card.updated_at > after)
+        deleted = list(
+            db.scalars(
+                select(CardTombstone.card_id).where(
+                    CardTombstone.board_id == board.id,
+                    CardTombstone.deleted_at > after,
+                )
+            )
+        )
+    rows = db.execute(select(*CARD_OUT_COLUMNS).where(*criteria).order_by(Card.id))
+    attachments = attachments_by_card(db, *criteria)
+    changed = [card_to_dict(row, attachments) for row in rows]
+    live = {card["id"] for card in changed}
+    return to_json(
+        {
+            "changed": changed,
+            # an id can reappear when SQLite reuses the highest rowid
+            "deleted": sorted(set(deleted) - live),
+            "next_token": encode_sync_token(board.id, now),
+        }
+    )
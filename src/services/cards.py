@@ -1,35 +1,87 @@
+import base64
+import binascii
+import json
 from datetime import datetime, timezone
-from typing import List, Optional, Sequence
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import asc
+from sqlalchemy import asc, delete, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.adapters.models import Board, Card, User
-from src.domain.schemas import CardCreate, CardMove, CardOut, CardUpdate
+from src.adapters.models import Attachment, Board, Card, CardTombstone
+from src.domain.schemas import (
+    ApiErrorPayload,
+    CardBatchCreate,
+    CardBatchDelete,
+    CardBatchMove,
+    CardBatchOperation,
+    CardBatchResult,
+    CardBatchUpdate,
+    CardCreate,
+    CardMove,
+    CardOut,
+    CardUpdate,
+)
+from src.services.boards import SYNC_TOMBSTONE_RETENTION, get_board
+from src.services.events import (
+    CARD_CREATED,
+    CARD_DELETED,
+    CARD_MOVED,
+    CARD_UPDATED,
+    queue_card_event,
+)
+from src.services.ordering import assign_rank
+from src.services.principals import Principal
+from src.services.query_cache import BYPASS, HIT, MISS, query_cache
+from src.services.serialization import (
+    CARD_OUT_COLUMNS,
+    attachments_by_card,
+    card_to_dict,
+    cards_json,
+)
+from src.services.stats import StatsDelta, apply_stats_delta
 
 
-def _ensure_board_for_owner(db: Session, board_id: int, owner: User) -> Board:
-    board = db.get(Board, board_id)
-    if board is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "code": "BOARD_NOT_FOUND",
-                "message": "Board not found",
-                "details": {},
-            },
-        )
-    if board.owner_id != owner.id and owner.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={"code": "FORBIDDEN", "message": "Access denied", "details": {}},
-        )
-    return board
+def _touch_boards(db: Session, board_ids: Iterable[int]) -> None:
+    """Bump version/updated_at of boards whose cards change in this transaction."""
+    ids = set(board_ids)
+    if not ids:
+        return
+    db.execute(
+        update(Board)
+        .where(Board.id.in_(ids))
+        .values(version=Board.version + 1, updated_at=datetime.now(timezone.utc)),
+        execution_options={"synchronize_session": False},
+    )
+
 
+def _write_tombstones(db: Session, deleted: Iterable[Any]) -> None:
+    """Record deleted cards (anything with id/board_id) for delta sync.
 
-def create_card(db: Session, owner: User, data: CardCreate) -> Card:
-    _ensure_board_for_owner(db, data.board_id, owner)
+    Tombstones of the same boards that fell out of the retention window are
+    pruned in the same transaction, along (board_id, deleted_at).
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"card_id": card.id, "board_id": card.board_id, "deleted_at": now}
+        for card in deleted
+    ]
+    if not rows:
+        return
+    db.execute(
+        delete(CardTombstone).where(
+            CardTombstone.board_id.in_({row["board_id"] for row in rows}),
+            CardTombstone.deleted_at < now - SYNC_TOMBSTONE_RETENTION,
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    db.execute(insert(CardTombstone), rows)
+
+
+def create_card(db: Session, owner: Principal, data: CardCreate) -> Card:
+    get_board(db, data.board_id, owner)
 
     card = Card(
         title=data.title,
@@ -41,12 +93,17 @@ def create_card(db: Session, owner: User, data: CardCreate) -> Card:
         due_date=data.due_date,
     )
     db.add(card)
+    _touch_boards(db, [data.board_id])
+    stats = StatsDelta()
+    stats.add(card.board_id, card.column, card.estimate_hours)
+    apply_stats_delta(db, stats)
+    queue_card_event(db, CARD_CREATED, card)
     db.commit()
     db.refresh(card)
     return card
 
 
-def get_card(db: Session, card_id: int, requester: User) -> Card:
+def get_card(db: Session, card_id: int, requester: Principal) -> Card:
     card = db.get(Card, card_id)
     if card is None:
         raise HTTPException(
@@ -65,14 +122,55 @@ def get_card(db: Session, card_id: int, requester: User) -> Card:
     return card
 
 
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "INVALID_CURSOR",
+            "message": "Malformed pagination cursor",
+            "details": {},
+        },
+    )
+
+
+def encode_cursor(card: Card) -> str:
+    """Opaque token holding the sort key of the last card on a page."""
+    key = [card.board_id, card.column, card.order_idx, card.id]
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str, int, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        board_id, column, order_idx, card_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise _invalid_cursor() from None
+    if not (
+        isinstance(board_id, int)
+        and isinstance(column, str)
+        and isinstance(order_idx, int)
+        and isinstance(card_id, int)
+    ):
+        raise _invalid_cursor() from None
+    return board_id, column, order_idx, card_id
+
+
 def list_cards(
     db: Session,
-    requester: User,
+    requester: Principal,
     limit: int = 20,
     offset: int = 0,
     column: Optional[str] = None,
     board_id: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> Sequence[Card]:
+    """List cards ordered by (board_id, column, order_idx, id).
+
+    With ``cursor`` the page resumes strictly after the encoded sort key
+    (keyset pagination) and ``offset`` is ignored, so deep pages cost the
+    same as the first one.
+    """
     q = db.query(Card)
     if requester.role != "admin":
         q = q.filter(Card.owner_id == requester.id)
@@ -80,14 +178,74 @@ def list_cards(
         q = q.filter(Card.column == column)
     if board_id is not None:
         q = q.filter(Card.board_id == board_id)
+    if cursor is not None:
+        sort_key = tuple_(Card.board_id, Card.column, Card.order_idx, Card.id)
+        q = q.filter(sort_key > tuple_(*decode_cursor(cursor)))
+        offset = 0
     q = q.order_by(
         asc(Card.board_id), asc(Card.column), asc(Card.order_idx), asc(Card.id)
     )
     return q.offset(offset).limit(limit).all()
 
 
-def update_card(db: Session, card_id: int, requester: User, data: CardUpdate) -> Card:
+def list_cards_page(
+    db: Session,
+    requester: Principal,
+    limit: int = 20,
+    offset: int = 0,
+    column: Optional[str] = None,
+    board_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    *,
+    use_cache: bool = True,
+) -> Tuple[bytes, Optional[str], Optional[str]]:
+    """JSON body and next cursor of a `list_cards` page, read through the cache.
+
+    Only board-scoped pages are cached: the key includes the board's version,
+    which every card mutation bumps, so a cached page is never served after
+    a write. Returns (body, next_cursor, cache_result); cache_result is None
+    when the page was not eligible for caching.
+    """
+    key = None
+    if board_id is not None and query_cache.enabled:
+        # The version is read before the cards: a write racing with this call
+        # can only make the stored page newer than its key, never older.
+        board = db.execute(
+            select(Board.version, Board.created_at).where(Board.id == board_id)
+        ).first()
+        if board is not None:
+            # created_at guards against a reused board id restarting at version 0.
+            scope = "*" if requester.role == "admin" else requester.id
+            key = (
+                f"cards:{board_id}:{board.created_at.isoformat()}:v{board.version}:"
+                f"{scope}:{column or ''}:{limit}:{offset}:{cursor or ''}"
+            )
+    result = None
+    if key is not None:
+        if use_cache:
+            cached = query_cache.get(key)
+            if cached is not None:
+                next_cursor, _, body = cached.partition(b"\n")
+                return body, next_cursor.decode() or None, HIT
+            result = MISS
+        else:
+            query_cache.record_bypass()
+            result = BYPASS
+    cards = list_cards(db, requester, limit, offset, column, board_id, cursor)
+    next_cursor = None
+    if limit > 0 and len(cards) == limit:
+        next_cursor = encode_cursor(cards[-1])
+    body = cards_json(cards)
+    if key is not None:
+        query_cache.put(key, (next_cursor or "").encode() + b"\n" + body)
+    return body, next_cursor, result
+
+
+def update_card(
+    db: Session, card_id: int, requester: Principal, data: CardUpdate
+) -> Card:
     card = get_card(db, card_id, requester)
+    before = (card.column, card.estimate_hours)
 
     if data.title is not None:
         card.title = data.title
@@ -103,30 +261,387 @@ def update_card(db: Session, card_id: int, requester: User, data: CardUpdate) ->
     card.updated_at = datetime.now(timezone.utc)
 
     db.add(card)
+    _touch_boards(db, [card.board_id])
+    stats = StatsDelta()
+    stats.replace(card.board_id, before, (card.column, card.estimate_hours))
+    apply_stats_delta(db, stats)
+    queue_card_event(db, CARD_UPDATED, card)
     db.commit()
     db.refresh(card)
     return card
 
 
-def delete_card(db: Session, card_id: int, requester: User) -> None:
+def delete_card(db: Session, card_id: int, requester: Principal) -> None:
     card = get_card(db, card_id, requester)
     db.delete(card)
+    _write_tombstones(db, [card])
+    _touch_boards(db, [card.board_id])
+    stats = StatsDelta()
+    stats.remove(card.board_id, card.column, card.estimate_hours)
+    apply_stats_delta(db, stats)
+    queue_card_event(db, CARD_DELETED, card)
     db.commit()
 
 
-def move_card(db: Session, card_id: int, requester: User, data: CardMove) -> Card:
+def move_card(db: Session, card_id: int, requester: Principal, data: CardMove) -> Card:
     card = get_card(db, card_id, requester)
+    if data.order_idx is not None:
+        order_idx = data.order_idx
+    else:
+        order_idx = assign_rank(db, card, data.column, data.before_id, data.after_id)
+    stats = StatsDelta()
+    stats.replace(
+        card.board_id,
+        (card.column, card.estimate_hours),
+        (data.column, card.estimate_hours),
+    )
     card.column = data.column
-    card.order_idx = data.order_idx
+    card.order_idx = order_idx
     card.updated_at = datetime.now(timezone.utc)
     db.add(card)
-    db.commit()
+    _touch_boards(db, [card.board_id])
+    try:
+        apply_stats_delta(db, stats)
+        queue_card_event(db, CARD_MOVED, card)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "code": "ORDER_CONFLICT",
+                "message": "Target position is already taken",
+                "details": {},
+            },
+        )
     db.refresh(card)
     return card
 
 
+def touch_cards(db: Session, cards: Iterable[Card]) -> None:
+    """Record a change to something embedded in `cards` (their attachments).
+
+    Stamps updated_at for delta sync, bumps the boards' versions so ETags and
+    cached pages move on, and publishes card.updated on commit.
+    """
+    now = datetime.now(timezone.utc)
+    cards = list(cards)
+    for card in cards:
+        card.updated_at = now
+        queue_card_event(db, CARD_UPDATED, card)
+    _touch_boards(db, [card.board_id for card in cards])
+
+
+def set_card_score(db: Session, card: Card, score: float) -> None:
+    """Store a scoring result on `card`; committed by the caller."""
+    card.score = score
+    card.updated_at = datetime.now(timezone.utc)
+    db.add(card)
+    _touch_boards(db, [card.board_id])
+    queue_card_event(db, CARD_UPDATED, card)
+
+
+def _batch_error(
+    index: int, op: str, status_code: int, code: str, message: str
+) -> CardBatchResult:
+    return CardBatchResult(
+        index=index,
+        op=op,
+        status=status_code,
+        error=ApiErrorPayload(code=code, message=message),
+    )
+
+
+def _authorize_batch(
+    db: Session, requester: Principal, operations: List[CardBatchOperation]
+) -> tuple[dict[int, CardBatchResult], dict[int, Card]]:
+    """Check every operation with one cards query and one boards query.
+
+    Returns per-index errors and the (partial) rows of referenced cards.
+    """
+    card_ids = {op.id for op in operations if not isinstance(op, CardBatchCreate)}
+    board_ids = {op.board_id for op in operations if isinstance(op, CardBatchCreate)}
+    cards = {
+        row.id: row
+        for row in db.execute(
+            select(
+                Card.id,
+                Card.owner_id,
+                Card.board_id,
+                Card.column,
+                Card.order_idx,
+                Card.estimate_hours,
+            ).where(Card.id.in_(card_ids))
+        )
+    }
+    board_owners = dict(
+        db.execute(select(Board.id, Board.owner_id).where(Board.id.in_(board_ids)))
+        .tuples()
+        .all()
+    )
+
+    is_admin = requester.role == "admin"
+    errors: dict[int, CardBatchResult] = {}
+    seen: set[int] = set()
+    for index, op in enumerate(operations):
+        if isinstance(op, CardBatchCreate):
+            owner_id = board_owners.get(op.board_id)
+            if owner_id is None:
+                errors[index] = _batch_error(
+                    index, op.op, 404, "BOARD_NOT_FOUND", "Board not found"
+                )
+            elif owner_id != requester.id and not is_admin:
+                errors[index] = _batch_error(
+                    index, op.op, 403, "FORBIDDEN", "Access denied"
+                )
+            continue
+        row = cards.get(op.id)
+        if row is None:
+            errors[index] = _batch_error(
+                index, op.op, 404, "CARD_NOT_FOUND", "Card not found"
+            )
+        elif row.owner_id != requester.id and not is_admin:
+            errors[index] = _batch_error(
+                index, op.op, 403, "FORBIDDEN", "Access denied"
+            )
+        elif op.id in seen:
+            errors[index] = _batch_error(
+                index,
+                op.op,
+                409,
+                "DUPLICATE_OPERATION",
+                "Card is already modified by an earlier operation in this batch",
+            )
+        else:
+            seen.add(op.id)
+    return errors, cards
+
+
+def _batch_results(
+    operations: List[CardBatchOperation],
+    errors: dict[int, CardBatchResult],
+    creates: list[tuple[int, dict]],
+    created_ids: list[int],
+    cards: dict[int, dict],
+) -> List[CardBatchResult]:
+    created_by_index = {index: cid for (index, _), cid in zip(creates, created_ids)}
+    results: List[CardBatchResult] = []
+    for index, op in enumerate(operations):
+        if index in errors:
+            results.append(errors[index])
+        elif isinstance(op, CardBatchCreate):
+            card = cards[created_by_index[index]]
+            results.append(
+                CardBatchResult(index=index, op=op.op, status=201, card=CardOut(**card))
+            )
+        elif isinstance(op, CardBatchDelete):
+            results.append(CardBatchResult(index=index, op=op.op, status=204))
+        else:
+            card = cards[op.id]
+            results.append(
+                CardBatchResult(index=index, op=op.op, status=200, card=CardOut(**card))
+            )
+    return results
+
+
+def apply_card_batch(
+    db: Session, requester: Principal, operations: List[CardBatchOperation]
+) -> List[CardBatchResult]:
+    """Apply mixed card operations in one transaction using bulk statements.
+
+    Operations that fail authorization are reported per index and skipped;
+    the rest are committed together. A constraint violation rolls the whole
+    batch back with 409 BATCH_CONFLICT.
+    """
+    errors, rows = _authorize_batch(db, requester, operations)
+    now = datetime.now(timezone.utc)
+
+    creates: list[tuple[int, dict]] = []
+    changes: dict[int, dict] = {}
+    deletes: list[int] = []
+    stats = StatsDelta()
+    for index, op in enumerate(operations):
+        if index in errors:
+            continue
+        if isinstance(op, CardBatchCreate):
+            values = op.model_dump(exclude={"op"})
+            creates.append((index, {**values, "owner_id": requester.id}))
+            stats.add(op.board_id, op.column, op.estimate_hours)
+            continue
+        row = rows[op.id]
+        if isinstance(op, CardBatchDelete):
+            deletes.append(op.id)
+            stats.remove(row.board_id, row.column, row.estimate_hours)
+            continue
+        if isinstance(op, CardBatchMove):
+            changes[op.id] = {
+                "column": op.column,
+                "order_idx": op.order_idx,
+                "updated_at": now,
+            }
+        elif isinstance(op, CardBatchUpdate):
+            values = op.model_dump(exclude={"op", "id"}, exclude_none=True)
+            changes[op.id] = {**values, "updated_at": now}
+        new = changes[op.id]
+        stats.replace(
+            row.board_id,
+            (row.column, row.estimate_hours),
+            (
+                new.get("column", row.column),
+                new.get("estimate_hours", row.estimate_hours),
+            ),
+        )
+
+    # Cards changing slot are parked on a unique negative index first so that
+    # swaps and shifts inside a column do not trip uq_cards_board_column_order.
+    repositioned = [
+        card_id
+        for card_id, values in changes.items()
+        if values.get("column", rows[card_id].column) != rows[card_id].column
+        or values.get("order_idx", rows[card_id].order_idx) != rows[card_id].order_idx
+    ]
+    # The second pass must restore a real index even when the client only
+    # changed the column, or the parked negative index would be committed.
+    for card_id in repositioned:
+        changes[card_id].setdefault("order_idx", rows[card_id].order_idx)
+    created_ids: list[int] = []
+    try:
+        if deletes:
+            db.execute(delete(Attachment).where(Attachment.card_id.in_(deletes)))
+            db.execute(
+                delete(Card).where(Card.id.in_(deletes)),
+                execution_options={"synchronize_session": False},
+            )
+            _write_tombstones(db, [rows[card_id] for card_id in deletes])
+        if repositioned:
+            db.execute(
+                update(Card),
+                [{"id": card_id, "order_idx": -card_id} for card_id in repositioned],
+            )
+        if changes:
+            db.execute(
+                update(Card),
+                [{"id": card_id, **values} for card_id, values in changes.items()],
+            )
+        if creates:
+            created_ids = list(
+                db.scalars(
+                    insert(Card).returning(Card.id, sort_by_parameter_order=True),
+                    [values for _, values in creates],
+                )
+            )
+        _touch_boards(
+            db,
+            [rows[card_id].board_id for card_id in [*changes, *deletes]]
+            + [values["board_id"] for _, values in creates],
+        )
+        apply_stats_delta(db, stats)
+        # Read the final state inside the transaction: it feeds both the
+        # results and the change events published on commit.
+        touched = [*created_ids, *changes]
+        attachments = attachments_by_card(db, Card.id.in_(list(changes)))
+        cards = {
+            row.id: card_to_dict(row, attachments)
+            for row in db.execute(select(*CARD_OUT_COLUMNS).where(Card.id.in_(touched)))
+        }
+        for card_id in created_ids:
+            queue_card_event(db, CARD_CREATED, cards[card_id])
+        for card_id, values in changes.items():
+            moved = card_id in repositioned
+            queue_card_event(db, CARD_MOVED if moved else CARD_UPDATED, cards[card_id])
+        for card_id in deletes:
+            queue_card_event(db, CARD_DELETED, rows[card_id])
+        # Build the response before committing so a card that fails validation
+        # rolls the batch back instead of surfacing after the write.
+        results = _batch_results(operations, errors, creates, created_ids, cards)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "code": "BATCH_CONFLICT",
+                "message": "Batch conflicts with existing card positions",
+                "details": {},
+            },
+        )
+    return results
+
+
+# Async variants run the sync service code on the AsyncSession's greenlet-backed
+# session, so the business rules stay in one place and no thread is held while
+# the driver waits on the database.
+
+
+async def create_card_async(
+    db: AsyncSession, owner: Principal, data: CardCreate
+) -> Card:
+    return await db.run_sync(create_card, owner, data)
+
+
+async def get_card_async(db: AsyncSession, card_id: int, requester: Principal) -> Card:
+    return await db.run_sync(get_card, card_id, requester)
+
+
+async def list_cards_async(
+    db: AsyncSession,
+    requester: Principal,
+    limit: int = 20,
+    offset: int = 0,
+    column: Optional[str] = None,
+    board_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Sequence[Card]:
+    return await db.run_sync(
+        list_cards, requester, limit, offset, column, board_id, cursor
+    )
+
+
+async def list_cards_page_async(
+    db: AsyncSession,
+    requester: Principal,
+    limit: int = 20,
+    offset: int = 0,
+    column: Optional[str] = None,
+    board_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    *,
+    use_cache: bool = True,
+) -> Tuple[bytes, Optional[str], Optional[str]]:
+    return await db.run_sync(
+        lambda session: list_cards_page(
+            session,
+            requester,
+            limit,
+            offset,
+            column,
+            board_id,
+            cursor,
+            use_cache=use_cache,
+        )
+    )
+
+
+async def update_card_async(
+    db: AsyncSession, card_id: int, requester: Principal, data: CardUpdate
+) -> Card:
+    return await db.run_sync(update_card, card_id, requester, data)
+
+
+async def delete_card_async(
+    db: AsyncSession, card_id: int, requester: Principal
+) -> None:
+    await db.run_sync(delete_card, card_id, requester)
+
+
+async def move_card_async(
+    db: AsyncSession, card_id: int, requester: Principal, data: CardMove
+) -> Card:
+    return await db.run_sync(move_card, card_id, requester, data)
+
+
 def to_card_out(card: Card) -> CardOut:
-    return CardOut.model_validate(card)
+    return CardOut.model_validate(card_to_dict(card))
 
 
 def to_cards_out(cards: List[Card]) -> List[CardOut]:
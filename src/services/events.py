@@ -0,0 +1,219 @@
+"""
+In-process fan-out of card changes to server-sent event subscribers.
+
+Card services queue a snapshot of each changed card on the session with
+`queue_card_event`; the snapshots are published only after the transaction
+commits and are discarded on rollback. Each board keeps a short replay log so
+a reconnecting client can resume from `Last-Event-ID`. Subscribers get a
+bounded buffer and are dropped when they fall behind; their next reconnect
+resumes from the replay log.
+
+Events are not shared between processes: with several workers a client only
+sees changes made through the process it is connected to.
+"""
+
+import asyncio
+import os
+import secrets
+import threading
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Set, Tuple
+
+from pydantic_core import to_json
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.services.metrics import REGISTRY
+from src.services.serialization import card_to_dict
+
+CARD_CREATED = "card.created"
+CARD_UPDATED = "card.updated"
+CARD_MOVED = "card.moved"
+CARD_DELETED = "card.deleted"
+# Sent instead of a replay when the requested position is no longer available,
+# and for changes too wide to send card by card (a column rebalance).
+RESYNC = "resync"
+
+EVENTS_PUBLISHED = REGISTRY.counter(
+    "board_events_published", "Card change events published", labelnames=("type",)
+)
+EVENT_SUBSCRIBERS = REGISTRY.gauge(
+    "board_event_subscribers", "Open board event streams"
+)
+EVENT_SUBSCRIBERS_DROPPED = REGISTRY.counter(
+    "board_event_subscribers_dropped",
+    "Event streams closed because the client fell behind",
+)
+
+_PENDING_KEY = "pending_card_events"
+
+
+def _frame(event_id: str, event_type: str, data: Mapping[str, Any]) -> bytes:
+    return (
+        f"id: {event_id}\nevent: {event_type}\ndata: ".encode()
+        + to_json(data)
+        + b"\n\n"
+    )
+
+
+class SubscriptionDropped(Exception):
+    """The subscriber's buffer overflowed; the stream must be closed."""
+
+
+class Subscription:
+    def __init__(
+        self, board_id: int, loop: asyncio.AbstractEventLoop, maxsize: int
+    ) -> None:
+        self.board_id = board_id
+        self.dropped = False
+        self._loop = loop
+        self._queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize)
+
+    def _deliver(self, frame: bytes) -> None:
+        # Runs on the subscriber's event loop.
+        if self.dropped:
+            return
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.dropped = True
+            EVENT_SUBSCRIBERS_DROPPED.inc()
+
+    async def get(self) -> bytes:
+        if self.dropped:
+            raise SubscriptionDropped()
+        return await self._queue.get()
+
+
+class BoardEventBroker:
+    def __init__(self, *, replay_size: int, buffer_size: int, max_boards: int) -> None:
+        self._replay_size = replay_size
+        self._buffer_size = buffer_size
+        self._max_boards = max_boards
+        # Event ids are "<epoch>:<seq>"; a new epoch per process means ids from
+        # before a restart are never mistaken for positions in this log.
+        self._epoch = secrets.token_hex(4)
+        self._seq: Dict[int, int] = {}
+        self._logs: "OrderedDict[int, Deque[Tuple[int, bytes]]]" = OrderedDict()
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, board_id: int, event_type: str, data: Mapping[str, Any]) -> None:
+        with self._lock:
+            seq = self._seq.get(board_id, 0) + 1
+            self._seq[board_id] = seq
+            frame = _frame(f"{self._epoch}:{seq}", event_type, data)
+            log = self._logs.get(board_id)
+            if log is None:
+                log = self._logs[board_id] = deque(maxlen=self._replay_size)
+            self._logs.move_to_end(board_id)
+            log.append((seq, frame))
+            # Only the replay log is evicted: the board keeps its sequence so
+            # ids are never reused and an old id cannot pass as up to date.
+            while len(self._logs) > self._max_boards:
+                self._logs.popitem(last=False)
+            subscribers = list(self._subscribers.get(board_id, ()))
+        EVENTS_PUBLISHED.inc(type=event_type)
+        for sub in subscribers:
+            try:
+                sub._loop.call_soon_threadsafe(sub._deliver, frame)
+            except RuntimeError:  # subscriber's loop already closed
+                self.unsubscribe(sub)
+
+    def _replay(self, board_id: int, last_event_id: str) -> Optional[List[bytes]]:
+        """Frames after `last_event_id`, or None if they are not all retained."""
+        epoch, _, raw_seq = last_event_id.partition(":")
+        if epoch != self._epoch or not raw_seq.isdigit():
+            return None
+        seq = int(raw_seq)
+        current = self._seq.get(board_id, 0)
+        if seq > current:
+            return None
+        log = self._logs.get(board_id, ())
+        if seq < current and (not log or log[0][0] > seq + 1):
+            return None
+        frames = [frame for event_seq, frame in log if event_seq > seq]
+        return frames if len(frames) < self._buffer_size else None
+
+    def subscribe(
+        self, board_id: int, last_event_id: Optional[str] = None
+    ) -> Subscription:
+        """Register on the running loop, pre-filled with any replayed events."""
+        sub = Subscription(board_id, asyncio.get_running_loop(), self._buffer_size)
+        with self._lock:
+            if last_event_id:
+                frames = self._replay(board_id, last_event_id)
+                if frames is None:
+                    current = f"{self._epoch}:{self._seq.get(board_id, 0)}"
+                    frames = [_frame(current, RESYNC, {"board_id": board_id})]
+                for frame in frames:
+                    sub._deliver(frame)
+            self._subscribers.setdefault(board_id, set()).add(sub)
+        EVENT_SUBSCRIBERS.inc()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(sub.board_id)
+            if subscribers is None or sub not in subscribers:
+                return
+            subscribers.discard(sub)
+            if not subscribers:
+                del self._subscribers[sub.board_id]
+        EVENT_SUBSCRIBERS.dec()
+
+
+broker = BoardEventBroker(
+    replay_size=int(os.getenv("EVENTS_REPLAY_SIZE", "256")),
+    buffer_size=int(os.getenv("EVENTS_BUFFER_SIZE", "100")),
+    max_boards=int(os.getenv("EVENTS_MAX_BOARDS", "10000")),
+)
+
+
+async def board_event_stream(
+    sub: Subscription, keepalive_seconds: float
+) -> AsyncIterator[bytes]:
+    """SSE body for one subscription; ends when the subscriber is dropped."""
+    try:
+        yield b"retry: 3000\n\n"
+        while True:
+            try:
+                yield await asyncio.wait_for(sub.get(), keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+    except SubscriptionDropped:
+        return
+    finally:
+        broker.unsubscribe(sub)
+
+
+def queue_card_event(db: Session, event_type: str, card: Any) -> None:
+    """Publish `card`'s current state once `db` commits.
+
+    `card` is an ORM card (flushed here so new cards have an id) or a
+    CardOut-shaped mapping; deletes only need `id` and `board_id`.
+    """
+    if event_type == CARD_DELETED:
+        data: Dict[str, Any] = {"id": card.id, "board_id": card.board_id}
+    elif isinstance(card, Mapping):
+        data = dict(card)
+    else:
+        db.flush()
+        data = card_to_dict(card)
+    db.info.setdefault(_PENDING_KEY, []).append((event_type, data))
+
+
+def queue_board_resync(db: Session, board_id: int) -> None:
+    """Tell `board_id`'s subscribers to re-read the snapshot once `db` commits."""
+    db.info.setdefault(_PENDING_KEY, []).append((RESYNC, {"board_id": board_id}))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    for event_type, data in session.info.pop(_PENDING_KEY, ()):
+        broker.publish(data["board_id"], event_type, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,29 +1,189 @@
+import asyncio
 import os
 from functools import lru_cache
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence
 
 from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
 
 import src.services.http_client
+from src.adapters.models import Card, Job
+from src.domain.schemas import ApiErrorPayload, CardScoreResult
+from src.services import jobs
+from src.services.cards import set_card_score
+from src.services.metrics import REGISTRY
+from src.services.principals import Principal
+from src.services.resilience import AdaptiveLimiter, CircuitBreaker
+from src.services.score_cache import score_cache, score_cache_key
+
+SCORE_COALESCED = REGISTRY.counter(
+    "score_requests_coalesced",
+    "Scoring requests that joined an identical call already in flight",
+)
+
+# Identical payloads scored concurrently share one upstream call.
+_inflight: Dict[str, "asyncio.Future[float]"] = {}
+
+
+@lru_cache(maxsize=1)
+def _score_guards() -> Dict[str, Any]:
+    """One breaker and limiter per upstream, shared by the sync and async clients."""
+    return {
+        "name": "score",
+        "breaker": CircuitBreaker(
+            "score",
+            failure_ratio=float(os.getenv("SCORE_BREAKER_FAILURE_RATIO", "0.5")),
+            min_calls=int(os.getenv("SCORE_BREAKER_MIN_CALLS", "10")),
+            window_seconds=float(os.getenv("SCORE_BREAKER_WINDOW", "30")),
+            open_seconds=float(os.getenv("SCORE_BREAKER_OPEN_SECONDS", "15")),
+        ),
+        "limiter": AdaptiveLimiter(
+            "score",
+            initial_limit=int(os.getenv("SCORE_LIMIT_INITIAL", "5")),
+            max_limit=int(os.getenv("SCORE_LIMIT_MAX", "50")),
+            latency_threshold=float(os.getenv("SCORE_LIMIT_LATENCY_THRESHOLD", "1.0")),
+        ),
+    }
 
 
 @lru_cache(maxsize=1)
 def get_score_service() -> src.services.http_client.ExternalScoreService:
     base_url = os.getenv("SCORE_API_BASE", "https://example.com")
-    client = src.services.http_client.SafeHttpClient(base_url=base_url)
+    client = src.services.http_client.SafeHttpClient(
+        base_url=base_url, **_score_guards()
+    )
     return src.services.http_client.ExternalScoreService(client)
 
 
+@lru_cache(maxsize=1)
+def get_async_score_service() -> src.services.http_client.AsyncExternalScoreService:
+    base_url = os.getenv("SCORE_API_BASE", "https://example.com")
+    client = src.services.http_client.AsyncSafeHttpClient(
+        base_url=base_url, **_score_guards()
+    )
+    return src.services.http_client.AsyncExternalScoreService(client)
+
+
+async def shutdown_score_service() -> None:
+    if get_async_score_service.cache_info().currsize:
+        await get_async_score_service().aclose()
+
+
+def build_score_payload(card: Any, context: Optional[str]) -> Dict[str, Any]:
+    return {
+        "title": card.title,
+        "column": card.column,
+        "estimate_hours": (
+            float(card.estimate_hours) if card.estimate_hours is not None else None
+        ),
+        "due_date": card.due_date.isoformat() if card.due_date else None,
+        "context": context,
+    }
+
+
+def _score_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail={
+            "code": "EXTERNAL_SERVICE_UNAVAILABLE",
+            "message": "External scoring service unavailable",
+            "details": {},
+        },
+    )
+
+
 def fetch_score_or_raise(payload: Dict[str, Any]) -> float:
+    key = score_cache_key(payload)
+    cached = score_cache.get(key)
+    if cached is not None:
+        return cached
     service = get_score_service()
     try:
-        return service.fetch_score(payload)
+        score = service.fetch_score(payload)
+    except src.services.http_client.ExternalServiceError as exc:
+        raise _score_unavailable() from exc
+    score_cache.put(key, score)
+    return score
+
+
+async def _fetch_and_cache(key: str, payload: Dict[str, Any]) -> float:
+    score = await get_async_score_service().fetch_score(payload)
+    score_cache.put(key, score)
+    return score
+
+
+async def fetch_score_or_raise_async(payload: Dict[str, Any]) -> float:
+    key = score_cache_key(payload)
+    cached = score_cache.get(key)
+    if cached is not None:
+        return cached
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_fetch_and_cache(key, payload))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        SCORE_COALESCED.inc()
+    try:
+        # shield: one caller disconnecting must not cancel the shared call
+        return await asyncio.shield(future)
     except src.services.http_client.ExternalServiceError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail={
-                "code": "EXTERNAL_SERVICE_UNAVAILABLE",
-                "message": "External scoring service unavailable",
-                "details": {},
-            },
-        ) from exc
+        raise _score_unavailable() from exc
+
+
+async def score_cards(
+    cards: Sequence[Any], context: Optional[str]
+) -> List[CardScoreResult]:
+    """Score every card with at most SCORE_BOARD_CONCURRENCY upstream calls open.
+
+    A failing card is reported in its own result instead of failing the batch.
+    """
+    limit = asyncio.Semaphore(int(os.getenv("SCORE_BOARD_CONCURRENCY", "8")))
+
+    async def score_one(card: Any) -> CardScoreResult:
+        async with limit:
+            try:
+                score = await fetch_score_or_raise_async(
+                    build_score_payload(card, context)
+                )
+            except HTTPException as exc:
+                error = exc
+            except src.services.http_client.ExternalServiceError:
+                # Whatever escapes the per-card mapping, e.g. an open circuit
+                # or a limiter rejection, still fails only this card.
+                error = _score_unavailable()
+            else:
+                return CardScoreResult(card_id=card.id, status=200, score=score)
+        return CardScoreResult(
+            card_id=card.id,
+            status=error.status_code,
+            error=ApiErrorPayload(**error.detail),
+        )
+
+    return list(await asyncio.gather(*(score_one(card) for card in cards)))
+
+
+SCORE_CARD_JOB = "score_card"
+
+
+@jobs.register_handler(SCORE_CARD_JOB)
+def _score_card_job(db: Session, job: Job) -> Dict[str, Any]:
+    card = db.get(Card, job.payload["card_id"])
+    if card is None:
+        return {"score": None, "card_deleted": True}
+    score = fetch_score_or_raise(build_score_payload(card, job.payload["context"]))
+    set_card_score(db, card, score)
+    return {"score": score}
+
+
+def enqueue_card_scoring(
+    db: Session, card: Card, context: Optional[str], owner: Principal
+) -> Job:
+    """Queue scoring of an already authorized card; the worker persists the score."""
+    return jobs.enqueue(
+        db,
+        SCORE_CARD_JOB,
+        {"card_id": card.id, "context": context},
+        owner,
+        max_attempts=int(os.getenv("SCORE_JOB_MAX_ATTEMPTS", "3")),
+    )
@@ -0,0 +1,155 @@
+"""
+Bounded worker pool for CPU-heavy password hashing.
+
+bcrypt work is shipped to a dedicated executor so request threads and the
+event loop stay free. Admission is bounded: when `max_pending` jobs are
+already queued or running the call fails immediately, and a job that has not
+started within `queue_timeout` seconds is cancelled.
+"""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from src.services.metrics import REGISTRY
+
+HASH_WAIT_SECONDS = REGISTRY.histogram(
+    "auth_hash_pool_wait_seconds",
+    "Time a password hashing job waited for a pool worker",
+)
+HASH_SECONDS = REGISTRY.histogram(
+    "auth_hash_seconds",
+    "Time spent hashing or verifying a password in a pool worker",
+    labelnames=("op",),
+)
+HASH_QUEUE_DEPTH = REGISTRY.gauge(
+    "auth_hash_pool_queue_depth",
+    "Password hashing jobs admitted to the pool and not yet finished",
+)
+HASH_REJECTED = REGISTRY.counter(
+    "auth_hash_pool_rejected",
+    "Password hashing jobs rejected by admission control",
+    labelnames=("reason",),
+)
+
+
+class HashPoolSaturatedError(Exception):
+    """Raised when the hashing pool cannot take or start a job in time."""
+
+
+def _timed_call(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float, float]:
+    # CLOCK_MONOTONIC is system-wide, so timestamps are comparable across workers.
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic()
+
+
+class HashWorkerPool:
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_pending: int,
+        queue_timeout: float,
+        kind: str = "process",
+    ) -> None:
+        if kind not in {"process", "thread"}:
+            raise ValueError("kind must be 'process' or 'thread'")
+        self._workers = max(1, workers)
+        self._queue_timeout = queue_timeout
+        self._kind = kind
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        with self._lock:
+            if self._executor is None:
+                if self._kind == "process":
+                    # spawn: never fork a process that already runs server threads
+                    self._executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self._workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self._workers, thread_name_prefix="hash-pool"
+                    )
+            return self._executor
+
+    def _release(self, _future: concurrent.futures.Future) -> None:
+        HASH_QUEUE_DEPTH.dec()
+        self._slots.release()
+
+    def _submit(
+        self, fn: Callable[..., Any], *args: Any
+    ) -> Tuple[concurrent.futures.Future, float]:
+        if not self._slots.acquire(blocking=False):
+            HASH_REJECTED.inc(reason="saturated")
+            raise HashPoolSaturatedError("Password hashing pool is saturated")
+        HASH_QUEUE_DEPTH.inc()
+        submitted = time.monotonic()
+        try:
+            future = self._get_executor().submit(_timed_call, fn, *args)
+        except BaseException:
+            HASH_QUEUE_DEPTH.dec()
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release)
+        return future, submitted
+
+    def _timed_out(self, future: concurrent.futures.Future) -> bool:
+        """Cancel a job that is still queued; running jobs are allowed to finish."""
+        if future.cancel():
+            HASH_REJECTED.inc(reason="timeout")
+            return True
+        return False
+
+    @staticmethod
+    def _observe(op: str, submitted: float, started: float, finished: float) -> None:
+        HASH_WAIT_SECONDS.observe(max(0.0, started - submitted))
+        HASH_SECONDS.observe(finished - started, op=op)
+
+    def run(self, op: str, fn: Callable[..., Any], *args: Any) -> Any:
+        future, submitted = self._submit(fn, *args)
+        try:
+            result, started, finished = future.result(timeout=self._queue_timeout)
+        except concurrent.futures.TimeoutError:
+            if self._timed_out(future):
+                raise HashPoolSaturatedError("Password hashing queue wait exceeded")
+            result, started, finished = future.result()
+        self._observe(op, submitted, started, finished)
+        return result
+
+    async def run_async(self, op: str, fn: Callable[..., Any], *args: Any) -> Any:
+        future, submitted = self._submit(fn, *args)
+        wrapped = asyncio.wrap_future(future)
+        try:
+            result, started, finished = await asyncio.wait_for(
+                asyncio.shield(wrapped), timeout=self._queue_timeout
+            )
+        except asyncio.TimeoutError:
+            if self._timed_out(future):
+                raise HashPoolSaturatedError("Password hashing queue wait exceeded")
+            result, started, finished = await wrapped
+        self._observe(op, submitted, started, finished)
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def pool_from_env() -> HashWorkerPool:
+    return HashWorkerPool(
+        workers=int(os.getenv("AUTH_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))),
+        max_pending=int(os.getenv("AUTH_HASH_MAX_PENDING", "64")),
+        queue_timeout=float(os.getenv("AUTH_HASH_QUEUE_TIMEOUT", "2.0")),
+        kind=os.getenv("AUTH_HASH_EXECUTOR", "process"),
+    )
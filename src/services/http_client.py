@@ -1,15 +1,67 @@
-import threading
+import asyncio
+import random
 import time
 from typing import Any, Dict, Optional
 
 import httpx
 
+from src.services.metrics import REGISTRY
+from src.services.resilience import AdaptiveLimiter, CircuitBreaker
+
+EXTERNAL_SCORE_SECONDS = REGISTRY.histogram(
+    "external_score_request_seconds",
+    "Latency of scoring service calls, including retries",
+    labelnames=("outcome",),
+)
+
 
 class ExternalServiceError(Exception):
     """Raised when an external HTTP call fails after retries."""
 
 
-class SafeHttpClient:
+class CircuitOpenError(ExternalServiceError):
+    """Raised without calling the upstream while its circuit is open."""
+
+
+class _GuardedClient:
+    """Circuit breaker and adaptive in-flight limit shared by both clients.
+
+    Transport errors (timeouts, refused or dropped connections) and 5xx
+    responses count as upstream failures and are retried; other httpx errors
+    (redirect loops, unsupported protocols) count too but fail at once. 4xx
+    responses do not count, since they say nothing about the upstream's health.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        timeout: float,
+        retries: int,
+        backoff_seconds: float,
+        max_in_flight: int,
+        breaker: Optional[CircuitBreaker],
+        limiter: Optional[AdaptiveLimiter],
+    ) -> None:
+        self._timeout = timeout
+        self._retries = max(1, retries)
+        self._backoff = backoff_seconds
+        self._breaker = breaker or CircuitBreaker(name)
+        self._limiter = limiter or AdaptiveLimiter(name, initial_limit=max_in_flight)
+
+    def _check_circuit(self) -> None:
+        if not self._breaker.allow():
+            raise CircuitOpenError("External service circuit is open")
+
+    def _saturated(self) -> ExternalServiceError:
+        return ExternalServiceError("External service concurrency limit reached")
+
+    def _record(self, started: float, healthy: bool) -> None:
+        self._limiter.release(time.perf_counter() - started, ok=healthy)
+        self._breaker.record(healthy)
+
+
+class SafeHttpClient(_GuardedClient):
     def __init__(
         self,
         *,
@@ -19,44 +71,193 @@ class SafeHttpClient:
         backoff_seconds: float = 0.2,
         max_in_flight: int = 5,
         transport: Optional[httpx.BaseTransport] = None,
+        name: str = "external",
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
     ) -> None:
+        super().__init__(
+            name=name,
+            timeout=timeout,
+            retries=retries,
+            backoff_seconds=backoff_seconds,
+            max_in_flight=max_in_flight,
+            breaker=breaker,
+            limiter=limiter,
+        )
         self._client = httpx.Client(
             base_url=base_url,
             timeout=httpx.Timeout(timeout),
             limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
             transport=transport,
         )
-        self._retries = max(1, retries)
-        self._backoff = backoff_seconds
-        self._semaphore = threading.BoundedSemaphore(max_in_flight)
+
+    def _attempt(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        self._check_circuit()
+        if not self._limiter.acquire(self._timeout):
+            raise self._saturated()
+        started = time.perf_counter()
+        healthy = False
+        try:
+            response = self._client.request(method, url, **kwargs)
+            healthy = response.status_code < 500
+        finally:
+            self._record(started, healthy)
+        response.raise_for_status()
+        return response
 
     def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         last_exc: Exception | None = None
         for attempt in range(self._retries):
             try:
-                with self._semaphore:
-                    response = self._client.request(method, url, **kwargs)
-                response.raise_for_status()
-                return response
-            except (httpx.TimeoutException, httpx.HTTPStatusError) as exc:
+                return self._attempt(method, url, **kwargs)
+            except httpx.DecodingError as exc:
+                raise ExternalServiceError("Undecodable response") from exc
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
                 last_exc = exc
                 if attempt == self._retries - 1:
                     raise ExternalServiceError("External service unavailable") from exc
                 time.sleep(self._backoff * (attempt + 1))
+            except httpx.HTTPError as exc:
+                # Redirect loops, bad protocols and the like: retrying won't help.
+                raise ExternalServiceError("External service unavailable") from exc
         raise ExternalServiceError("External service unavailable") from last_exc
 
     def post(self, url: str, **kwargs: Any) -> httpx.Response:
         return self.request("POST", url, **kwargs)
 
 
+class AsyncSafeHttpClient(_GuardedClient):
+    """`SafeHttpClient` policy on `httpx.AsyncClient`.
+
+    Callers past the in-flight limit wait on the event loop instead of
+    holding a thread, and retry backoff sleeps on the event loop with jitter.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        timeout: float = 3.0,
+        retries: int = 2,
+        backoff_seconds: float = 0.2,
+        max_in_flight: int = 5,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        name: str = "external",
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            timeout=timeout,
+            retries=retries,
+            backoff_seconds=backoff_seconds,
+            max_in_flight=max_in_flight,
+            breaker=breaker,
+            limiter=limiter,
+        )
+        self._base_url = base_url
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind(self) -> httpx.AsyncClient:
+        # Pooled connections belong to one event loop; rebuild if the loop
+        # changed (e.g. a test client that runs each request in a fresh loop).
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=httpx.Timeout(self._timeout),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                transport=self._transport,
+            )
+            self._loop = loop
+        return self._client
+
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = self._backoff * (attempt + 1)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _attempt(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        self._check_circuit()
+        if not await self._limiter.acquire_async(self._timeout):
+            raise self._saturated()
+        started = time.perf_counter()
+        healthy = False
+        try:
+            response = await self._bind().request(method, url, **kwargs)
+            healthy = response.status_code < 500
+        finally:
+            self._record(started, healthy)
+        response.raise_for_status()
+        return response
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        last_exc: Exception | None = None
+        for attempt in range(self._retries):
+            try:
+                return await self._attempt(method, url, **kwargs)
+            except httpx.DecodingError as exc:
+                raise ExternalServiceError("Undecodable response") from exc
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                last_exc = exc
+                if attempt == self._retries - 1:
+                    raise ExternalServiceError("External service unavailable") from exc
+                await asyncio.sleep(self._backoff_delay(attempt))
+            except httpx.HTTPError as exc:
+                # Redirect loops, bad protocols and the like: retrying won't help.
+                raise ExternalServiceError("External service unavailable") from exc
+        raise ExternalServiceError("External service unavailable") from last_exc
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+
+def _parse_score(response: httpx.Response) -> float:
+    try:
+        body = response.json()
+        return float(body["score"])
+    except (ValueError, TypeError, KeyError):
+        raise ExternalServiceError("Malformed response from scoring service") from None
+
+
 class ExternalScoreService:
     def __init__(self, client: SafeHttpClient) -> None:
         self._client = client
 
     def fetch_score(self, payload: Dict[str, Any]) -> float:
-        response = self._client.post("/score", json=payload)
-        data = response.json()
-        score = data.get("score")
-        if score is None:
-            raise ExternalServiceError("Malformed response from scoring service")
-        return float(score)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            score = _parse_score(self._client.post("/score", json=payload))
+            outcome = "ok"
+            return score
+        finally:
+            EXTERNAL_SCORE_SECONDS.observe(
+                time.perf_counter() - started, outcome=outcome
+            )
+
+
+class AsyncExternalScoreService:
+    def __init__(self, client: AsyncSafeHttpClient) -> None:
+        self._client = client
+
+    async def fetch_score(self, payload: Dict[str, Any]) -> float:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            score = _parse_score(await self._client.post("/score", json=payload))
+            outcome = "ok"
+            return score
+        finally:
+            EXTERNAL_SCORE_SECONDS.observe(
+                time.perf_counter() - started, outcome=outcome
+            )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,291 @@
+"""
+In-process background jobs backed by the `jobs` table.
+
+Jobs move queued -> running -> succeeded | failed. A worker claims a job with
+a conditional UPDATE (status and lease checked in the WHERE clause), so any
+number of worker threads or processes can poll the same table without an
+external broker; only the one whose UPDATE matched a row runs the job. The
+claim holds a lease: a job whose worker died is picked up again once
+`locked_until` has passed. Failures are retried with exponential backoff
+until `max_attempts` is reached.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from src.adapters.db import SessionLocal
+from src.adapters.models import Job
+from src.services.metrics import REGISTRY
+from src.services.principals import Principal
+
+logger = logging.getLogger("idea_kanban.jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+JOBS_ENQUEUED = REGISTRY.counter(
+    "jobs_enqueued", "Background jobs enqueued", labelnames=("kind",)
+)
+JOBS_FINISHED = REGISTRY.counter(
+    "jobs_finished",
+    "Background job attempts by outcome (succeeded, retried, failed)",
+    labelnames=("kind", "outcome"),
+)
+JOB_SECONDS = REGISTRY.histogram(
+    "job_run_seconds", "Time spent running one job attempt", labelnames=("kind",)
+)
+
+JobHandler = Callable[[Session, Job], Optional[Dict[str, Any]]]
+_HANDLERS: Dict[str, JobHandler] = {}
+
+# Set on enqueue so idle workers in this process start without waiting a poll.
+_work_available = threading.Event()
+
+
+def register_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Register `handler(db, job) -> result` for jobs of `kind`.
+
+    The handler's writes are committed in the same transaction that marks the
+    job succeeded; if it raises they are rolled back and the job is retried.
+    """
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        _HANDLERS[kind] = handler
+        return handler
+
+    return decorator
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def retry_delay(attempts: int) -> float:
+    base = float(os.getenv("JOB_RETRY_BACKOFF", "2.0"))
+    return min(300.0, base * 2 ** max(0, attempts - 1))
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: Dict[str, Any],
+    owner: Principal,
+    *,
+    max_attempts: int = 3,
+) -> Job:
+    if kind not in _HANDLERS:
+        raise ValueError(f"No handler registered for job kind '{kind}'")
+    job = Job(
+        kind=kind,
+        payload=payload,
+        status=QUEUED,
+        max_attempts=max_attempts,
+        owner_id=owner.id,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    JOBS_ENQUEUED.inc(kind=kind)
+    _work_available.set()
+    return job
+
+
+def get_job(db: Session, job_id: int, requester: Principal) -> Job:
+    job = db.get(Job, job_id)
+    if job is None or (job.owner_id != requester.id and requester.role != "admin"):
+        # Other users' jobs are reported as missing rather than forbidden.
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "JOB_NOT_FOUND", "message": "Job not found", "details": {}},
+        )
+    return job
+
+
+def list_jobs(
+    db: Session,
+    requester: Principal,
+    status_filter: Optional[str] = None,
+    limit: int = 20,
+) -> List[Job]:
+    query = select(Job)
+    if requester.role != "admin":
+        query = query.where(Job.owner_id == requester.id)
+    if status_filter is not None:
+        query = query.where(Job.status == status_filter)
+    return list(db.scalars(query.order_by(Job.id.desc()).limit(limit)))
+
+
+def claim_next(db: Session, worker_id: str, lease_seconds: float) -> Optional[Job]:
+    """Claim one due job for `worker_id`, or return None if there is none."""
+    now = _now()
+    expired = and_(Job.status == RUNNING, Job.locked_until < now)
+    # A job whose last lease expired with no attempts left is not retried.
+    db.execute(
+        update(Job)
+        .where(expired, Job.attempts >= Job.max_attempts)
+        .values(status=FAILED, last_error="lease expired", updated_at=now)
+    )
+    claimable = or_(and_(Job.status == QUEUED, Job.run_after <= now), expired)
+    candidates = db.scalars(
+        select(Job.id).where(claimable).order_by(Job.run_after, Job.id).limit(5)
+    ).all()
+    for job_id in candidates:
+        claimed = db.execute(
+            update(Job)
+            .where(Job.id == job_id, claimable)
+            .values(
+                status=RUNNING,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=lease_seconds),
+                attempts=Job.attempts + 1,
+                updated_at=now,
+            )
+        )
+        if claimed.rowcount == 1:
+            db.commit()
+            return db.get(Job, job_id, populate_existing=True)
+    db.commit()
+    return None
+
+
+def _finish(db: Session, job: Job, worker_id: str, **values: Any) -> bool:
+    # Only the lease holder may finish a job; a worker that overran its lease
+    # must not overwrite the outcome of whoever reclaimed it.
+    finished = db.execute(
+        update(Job)
+        .where(Job.id == job.id, Job.status == RUNNING, Job.locked_by == worker_id)
+        .values(locked_by=None, locked_until=None, updated_at=_now(), **values)
+    )
+    return finished.rowcount == 1
+
+
+def run_one(
+    worker_id: str,
+    *,
+    lease_seconds: float = 60.0,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> bool:
+    """Claim and run a single job. Returns False if nothing was due."""
+    with session_factory() as db:
+        job = claim_next(db, worker_id, lease_seconds)
+        if job is None:
+            return False
+        kind = job.kind
+        started = time.perf_counter()
+        try:
+            result = _HANDLERS[kind](db, job)
+        except Exception as exc:
+            db.rollback()
+            logger.warning("job %s (%s) failed: %r", job.id, kind, exc)
+            error = f"{type(exc).__name__}: {exc}"
+            job = db.get(Job, job.id, populate_existing=True)
+            if job.attempts >= job.max_attempts:
+                outcome = "failed"
+                values: Dict[str, Any] = {"status": FAILED, "last_error": error}
+            else:
+                outcome = "retried"
+                values = {
+                    "status": QUEUED,
+                    "last_error": error,
+                    "run_after": _now() + timedelta(seconds=retry_delay(job.attempts)),
+                }
+            _finish(db, job, worker_id, **values)
+            db.commit()
+        else:
+            if _finish(db, job, worker_id, status=SUCCEEDED, result=result):
+                outcome = "succeeded"
+                db.commit()
+            else:
+                outcome = "lost_lease"
+                db.rollback()
+        JOB_SECONDS.observe(time.perf_counter() - started, kind=kind)
+        JOBS_FINISHED.inc(kind=kind, outcome=outcome)
+        return True
+
+
+def run_pending(
+    *,
+    max_jobs: int = 100,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> int:
+    """Run due jobs inline until none are left (management commands and tests)."""
+    ran = 0
+    while ran < max_jobs and run_one(
+        f"inline-{os.getpid()}", session_factory=session_factory
+    ):
+        ran += 1
+    return ran
+
+
+class JobRunner:
+    """Pool of worker threads polling the job table."""
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 60.0,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self._workers = workers
+        self._poll_interval = poll_interval
+        self._lease_seconds = lease_seconds
+        self._session_factory = session_factory
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        if self._threads or self._workers <= 0:
+            return
+        self._stop.clear()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        for n in range(self._workers):
+            thread = threading.Thread(
+                target=self._loop,
+                args=(f"{prefix}:{n}",),
+                name=f"job-worker-{n}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        _work_available.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def _loop(self, worker_id: str) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = run_one(
+                    worker_id,
+                    lease_seconds=self._lease_seconds,
+                    session_factory=self._session_factory,
+                )
+            except Exception:
+                logger.exception("job worker %s crashed while claiming", worker_id)
+                ran = False
+            if not ran:
+                _work_available.wait(self._poll_interval)
+                _work_available.clear()
+
+
+job_runner = JobRunner(
+    workers=int(os.getenv("JOB_WORKERS", "2")),
+    poll_interval=float(os.getenv("JOB_POLL_INTERVAL", "1.0")),
+    lease_seconds=float(os.getenv("JOB_LEASE_SECONDS", "60")),
+)
@@ -0,0 +1,142 @@
+"""
+Gap-based ordering for cards inside a (board, column).
+
+Ranks are spaced `RANK_GAP` apart, so a card moved between two neighbours
+gets the midpoint of their ranks and only its own row is written. When two
+neighbours are adjacent integers the column is renumbered once in bulk.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from src.adapters.models import Card
+from src.services.events import queue_board_resync
+
+RANK_GAP = 1024
+
+
+def rank_between(prev_rank: Optional[int], next_rank: Optional[int]) -> Optional[int]:
+    """Pick a rank strictly between two neighbours, or None if there is no room."""
+    if prev_rank is None and next_rank is None:
+        return RANK_GAP
+    if next_rank is None:
+        return prev_rank + RANK_GAP
+    low = -1 if prev_rank is None else prev_rank
+    if next_rank - low <= 1:
+        return None
+    if prev_rank is None and next_rank > RANK_GAP:
+        return next_rank - RANK_GAP
+    return (low + next_rank) // 2
+
+
+def _invalid_anchor(message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={"code": "INVALID_MOVE_ANCHOR", "message": message, "details": {}},
+    )
+
+
+def _no_gap_left() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "code": "ORDER_CONFLICT",
+            "message": "No free position left in the target column",
+            "details": {},
+        },
+    )
+
+
+def _other_cards_in(card: Card, column: str) -> tuple:
+    return (Card.board_id == card.board_id, Card.column == column, Card.id != card.id)
+
+
+def _neighbours(
+    db: Session,
+    card: Card,
+    column: str,
+    before_id: Optional[int],
+    after_id: Optional[int],
+) -> tuple[Optional[int], Optional[int]]:
+    others = _other_cards_in(card, column)
+    anchor_id = before_id if before_id is not None else after_id
+    if anchor_id is None:
+        return db.scalar(select(func.max(Card.order_idx)).where(*others)), None
+
+    if anchor_id == card.id:
+        raise _invalid_anchor("A card cannot be positioned relative to itself")
+    anchor = db.execute(
+        select(Card.board_id, Card.column, Card.order_idx).where(Card.id == anchor_id)
+    ).first()
+    if anchor is None or anchor.board_id != card.board_id or anchor.column != column:
+        raise _invalid_anchor("Anchor card must be in the target column of this board")
+
+    if after_id is not None:
+        next_rank = db.scalar(
+            select(func.min(Card.order_idx)).where(
+                *others, Card.order_idx > anchor.order_idx
+            )
+        )
+        return anchor.order_idx, next_rank
+    prev_rank = db.scalar(
+        select(func.max(Card.order_idx)).where(
+            *others, Card.order_idx < anchor.order_idx
+        )
+    )
+    return prev_rank, anchor.order_idx
+
+
+def rebalance_column(db: Session, board_id: int, column: str) -> None:
+    """Respace a column to multiples of RANK_GAP, keeping the current order.
+
+    Every card in the column changes rank, so event subscribers get one
+    `resync` on commit rather than an event per card.
+    """
+    ids = db.scalars(
+        select(Card.id)
+        .where(Card.board_id == board_id, Card.column == column)
+        .order_by(Card.order_idx.asc(), Card.id.asc())
+    ).all()
+    if not ids:
+        return
+    # Stamped so delta sync (/boards/{id}/changes) reports every renumbered card.
+    now = datetime.now(timezone.utc)
+    # Park on unique negative ranks first so the renumbering never collides.
+    db.execute(
+        update(Card),
+        [{"id": card_id, "order_idx": -card_id, "updated_at": now} for card_id in ids],
+    )
+    db.execute(
+        update(Card),
+        [
+            {"id": card_id, "order_idx": (position + 1) * RANK_GAP, "updated_at": now}
+            for position, card_id in enumerate(ids)
+        ],
+    )
+    queue_board_resync(db, board_id)
+
+
+def assign_rank(
+    db: Session,
+    card: Card,
+    column: str,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> int:
+    """Rank for `card` placed before/after an anchor, or at the end of `column`."""
+    prev_rank, next_rank = _neighbours(db, card, column, before_id, after_id)
+    rank = rank_between(prev_rank, next_rank)
+    if rank is not None:
+        return rank
+    rebalance_column(db, card.board_id, column)
+    db.refresh(card)
+    prev_rank, next_rank = _neighbours(db, card, column, before_id, after_id)
+    rank = rank_between(prev_rank, next_rank)
+    if rank is None:
+        # Only a concurrent writer refilling the column can get here.
+        raise _no_gap_left()
+    return rank
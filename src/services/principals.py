@@ -0,0 +1,53 @@
+"""
+Verified-principal cache for bearer tokens.
+
+A token that has already been verified maps to a lightweight `Principal`, so
+authenticated requests can skip both JWT decoding and the user lookup. Entries
+never outlive the token's `exp` and are dropped when the user's role or
+active flag changes.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+
+from src.services.metrics import REGISTRY
+from src.services.ttl_cache import TTLCache
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "auth_principal_cache_requests",
+    "Principal cache lookups by result",
+    labelnames=("result",),
+)
+CACHE_SIZE = REGISTRY.gauge(
+    "auth_principal_cache_entries", "Tokens currently held in the principal cache"
+)
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    role: str
+    is_active: bool
+
+
+class PrincipalCache(TTLCache[str, Principal]):
+    def __init__(self, *, maxsize: int, ttl_seconds: float) -> None:
+        super().__init__(
+            maxsize=maxsize, ttl_seconds=ttl_seconds, requests=CACHE_REQUESTS
+        )
+
+    def put(self, token: str, principal: Principal, token_exp: float) -> None:
+        """Cache `principal` until min(now + ttl, token_exp); `token_exp` is a unix time."""
+        super().put(token, principal, token_exp - time.time())
+
+    def invalidate_user(self, user_id: int) -> None:
+        # Role and active-flag changes are rare, so a scan beats a per-user index.
+        self.discard_where(lambda principal: principal.id == user_id)
+
+
+principal_cache = PrincipalCache(
+    maxsize=int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", "10000")),
+    ttl_seconds=float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", "60")),
+)
+CACHE_SIZE.set_function(lambda: len(principal_cache))
@@ -0,0 +1,215 @@
+"""
+Read-through cache for serialized query results.
+
+Keys carry everything the result depends on, including the version counter
+of the board being read. Card mutations bump that counter in their own
+transaction, so a write makes every older key unreachable at once; nothing
+has to be deleted or scanned, and stale entries simply age out of the LRU
+(or expire in Redis).
+
+The default backend is an in-process LRU bounded by entry count and total
+bytes. `QUERY_CACHE_BACKEND=redis` shares entries between workers through a
+local Redis-compatible server; it needs the `redis` package, and backend
+errors degrade to uncached reads.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+from src.services.metrics import REGISTRY
+
+logger = logging.getLogger("idea_kanban.query_cache")
+
+HIT = "hit"
+MISS = "miss"
+BYPASS = "bypass"
+
+QUERY_CACHE_REQUESTS = REGISTRY.counter(
+    "query_cache_requests",
+    "Query cache lookups by result (hit, miss, bypass)",
+    labelnames=("result",),
+)
+QUERY_CACHE_ERRORS = REGISTRY.counter(
+    "query_cache_errors", "Query cache backend errors (served uncached)"
+)
+QUERY_CACHE_EVICTIONS = REGISTRY.counter(
+    "query_cache_evictions", "Entries evicted from the in-process query cache"
+)
+QUERY_CACHE_ENTRIES = REGISTRY.gauge(
+    "query_cache_entries", "Entries held in the in-process query cache"
+)
+QUERY_CACHE_BYTES = REGISTRY.gauge(
+    "query_cache_bytes", "Key and value bytes held in the in-process query cache"
+)
+
+
+class MemoryBackend:
+    """LRU bounded by both entry count and total key + value bytes."""
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+            self._bytes += len(key) + len(value)
+            while self._entries and (
+                len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+                QUERY_CACHE_EVICTIONS.inc()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(key) + len(entry[0])
+
+
+class RedisBackend:
+    """Entries in a Redis-compatible server; its `maxmemory` bounds the size."""
+
+    def __init__(self, url: str, *, prefix: str = "idea_kanban:") -> None:
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "QUERY_CACHE_BACKEND=redis requires the 'redis' package"
+            ) from None
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=0.1, socket_connect_timeout=0.1
+        )
+        self._errors = (redis.RedisError,)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._client.get(self._prefix + key)
+        except self._errors as exc:
+            self._failed("get", exc)
+            return None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        try:
+            self._client.set(self._prefix + key, value, px=int(ttl_seconds * 1000))
+        except self._errors as exc:
+            self._failed("set", exc)
+
+    def clear(self) -> None:
+        # Only our own keys; the server may be shared.
+        for key in self._client.scan_iter(match=self._prefix + "*", count=500):
+            self._client.delete(key)
+
+    def _failed(self, operation: str, exc: Exception) -> None:
+        QUERY_CACHE_ERRORS.inc()
+        logger.warning("query cache %s failed: %r", operation, exc)
+
+
+Backend = Union[MemoryBackend, RedisBackend]
+
+
+class QueryCache:
+    def __init__(
+        self,
+        backend: Optional[Backend],
+        *,
+        ttl_seconds: float,
+        max_entry_bytes: int,
+    ) -> None:
+        self.backend = backend
+        self._ttl = ttl_seconds
+        self._max_entry_bytes = max_entry_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self._ttl > 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        value = self.backend.get(key)
+        QUERY_CACHE_REQUESTS.inc(result=MISS if value is None else HIT)
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        # Huge pages would push many small ones out for a single reuse.
+        if self.enabled and len(value) <= self._max_entry_bytes:
+            self.backend.set(key, value, self._ttl)
+
+    def record_bypass(self) -> None:
+        QUERY_CACHE_REQUESTS.inc(result=BYPASS)
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+
+
+def query_cache_from_env() -> QueryCache:
+    kind = os.getenv("QUERY_CACHE_BACKEND", "memory").lower()
+    backend: Optional[Backend]
+    if kind == "memory":
+        backend = MemoryBackend(
+            max_entries=int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "2000")),
+            max_bytes=int(os.getenv("QUERY_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+        )
+    elif kind == "redis":
+        backend = RedisBackend(
+            os.getenv("QUERY_CACHE_REDIS_URL", "redis://localhost:6379/0")
+        )
+    elif kind == "off":
+        backend = None
+    else:
+        raise RuntimeError(f"Unknown QUERY_CACHE_BACKEND '{kind}'")
+    return QueryCache(
+        backend,
+        ttl_seconds=float(os.getenv("QUERY_CACHE_TTL", "300")),
+        max_entry_bytes=int(os.getenv("QUERY_CACHE_MAX_ENTRY_BYTES", str(1024 * 1024))),
+    )
+
+
+query_cache = query_cache_from_env()
+QUERY_CACHE_ENTRIES.set_function(
+    lambda: (
+        len(query_cache.backend)
+        if isinstance(query_cache.backend, MemoryBackend)
+        else 0
+    )
+)
+QUERY_CACHE_BYTES.set_function(
+    lambda: (
+        query_cache.backend.nbytes
+        if isinstance(query_cache.backend, MemoryBackend)
+        else 0
+    )
+)
@@ -0,0 +1,250 @@
+"""
+Failure isolation for calls to external services.
+
+`CircuitBreaker` stops calling an upstream whose recent failure ratio is too
+high and lets a single probe through after a cool-down. `AdaptiveLimiter`
+replaces a fixed in-flight cap with an AIMD limit: it grows by roughly one
+slot per window of fast, successful calls and is cut multiplicatively when a
+call fails or exceeds the latency threshold. Both are thread-safe and can be
+shared by the sync and async clients of the same upstream.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+from src.services.metrics import REGISTRY
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+CIRCUIT_STATE = REGISTRY.gauge(
+    "external_circuit_state",
+    "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+    labelnames=("upstream",),
+)
+CIRCUIT_TRANSITIONS = REGISTRY.counter(
+    "external_circuit_transitions",
+    "Circuit breaker state changes by new state",
+    labelnames=("upstream", "state"),
+)
+CIRCUIT_REJECTED = REGISTRY.counter(
+    "external_circuit_rejected",
+    "Calls rejected without reaching the upstream because the circuit is open",
+    labelnames=("upstream",),
+)
+CONCURRENCY_LIMIT = REGISTRY.gauge(
+    "external_concurrency_limit",
+    "Current adaptive in-flight limit",
+    labelnames=("upstream",),
+)
+CONCURRENCY_LIMIT_CHANGES = REGISTRY.counter(
+    "external_concurrency_limit_changes",
+    "Adaptive limit adjustments by direction",
+    labelnames=("upstream", "direction"),
+)
+CONCURRENCY_IN_FLIGHT = REGISTRY.gauge(
+    "external_concurrency_in_flight",
+    "Calls currently holding an adaptive limiter slot",
+    labelnames=("upstream",),
+)
+CONCURRENCY_REJECTED = REGISTRY.counter(
+    "external_concurrency_rejected",
+    "Calls that gave up waiting for an adaptive limiter slot",
+    labelnames=("upstream",),
+)
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_ratio: float = 0.5,
+        min_calls: int = 10,
+        window_seconds: float = 30.0,
+        open_seconds: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_ratio = failure_ratio
+        self._min_calls = max(1, min_calls)
+        self._window_seconds = window_seconds
+        self._open_seconds = open_seconds
+        self._clock = clock
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._window: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._lock = threading.Lock()
+        CIRCUIT_STATE.set(_STATE_VALUES[CLOSED], upstream=name)
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now; rejections are counted."""
+        with self._lock:
+            now = self._clock()
+            if self._state == OPEN and now - self._opened_at >= self._open_seconds:
+                self._transition(HALF_OPEN)
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN:
+                # One probe at a time; a probe that never reported back is
+                # presumed lost after another cool-down.
+                probe = self._probe_started
+                if probe is None or now - probe >= self._open_seconds:
+                    self._probe_started = now
+                    return True
+        CIRCUIT_REJECTED.inc(upstream=self.name)
+        return False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._state == HALF_OPEN:
+                if ok:
+                    self._transition(CLOSED)
+                else:
+                    self._open(now)
+                return
+            if self._state == OPEN:
+                return  # late result of a call started before the circuit opened
+            self._window.append((now, ok))
+            if not ok:
+                self._failures += 1
+            horizon = now - self._window_seconds
+            while self._window and self._window[0][0] < horizon:
+                _, was_ok = self._window.popleft()
+                if not was_ok:
+                    self._failures -= 1
+            calls = len(self._window)
+            if (
+                calls >= self._min_calls
+                and self._failures / calls >= self._failure_ratio
+            ):
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        self._opened_at = now
+        self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        self._probe_started = None
+        self._window.clear()
+        self._failures = 0
+        CIRCUIT_STATE.set(_STATE_VALUES[state], upstream=self.name)
+        CIRCUIT_TRANSITIONS.inc(upstream=self.name, state=state)
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        latency_threshold: float = 1.0,
+        backoff_ratio: float = 0.5,
+    ) -> None:
+        self.name = name
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._latency_threshold = latency_threshold
+        self._backoff_ratio = backoff_ratio
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: Deque["asyncio.Future[None]"] = deque()
+        CONCURRENCY_LIMIT.set(self.limit, upstream=name)
+        CONCURRENCY_IN_FLIGHT.set(0, upstream=name)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight >= self.limit:
+            return False
+        self._in_flight += 1
+        CONCURRENCY_IN_FLIGHT.set(self._in_flight, upstream=self.name)
+        return True
+
+    def acquire(self, timeout: float) -> bool:
+        """Take a slot, blocking the calling thread for at most `timeout` seconds."""
+        with self._slot_freed:
+            if self._slot_freed.wait_for(self._try_acquire, timeout):
+                return True
+        CONCURRENCY_REJECTED.inc(upstream=self.name)
+        return False
+
+    async def acquire_async(self, timeout: float) -> bool:
+        """Take a slot, waiting on the event loop for at most `timeout` seconds."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._try_acquire():
+                    return True
+                waiter = loop.create_future()
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                # A wake-up may have raced with the timeout; use the slot if so.
+                with self._lock:
+                    if self._try_acquire():
+                        return True
+                CONCURRENCY_REJECTED.inc(upstream=self.name)
+                return False
+            finally:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def release(self, latency: float, *, ok: bool) -> None:
+        """Free a slot and feed the call's outcome into the limit."""
+        with self._lock:
+            saturated = self._in_flight * 2 >= self.limit
+            self._in_flight -= 1
+            CONCURRENCY_IN_FLIGHT.set(self._in_flight, upstream=self.name)
+            previous = self.limit
+            if not ok or latency > self._latency_threshold:
+                self._limit = max(self._min_limit, self._limit * self._backoff_ratio)
+            elif saturated:
+                # +1/limit per success grows the limit by ~1 per full window
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            if self.limit != previous:
+                direction = "up" if self.limit > previous else "down"
+                CONCURRENCY_LIMIT.set(self.limit, upstream=self.name)
+                CONCURRENCY_LIMIT_CHANGES.inc(upstream=self.name, direction=direction)
+            free = max(0, self.limit - self._in_flight)
+            self._slot_freed.notify(free)
+            while free and self._async_waiters:
+                waiter = self._async_waiters.popleft()
+                if waiter.done():
+                    continue
+                try:
+                    waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+                except RuntimeError:  # the waiter's event loop is already closed
+                    continue
+                free -= 1
@@ -0,0 +1,44 @@
+"""
+Content-keyed cache for external card scores.
+
+The scoring service only sees the fields built by `build_score_payload`, so a
+score is reused for any card whose title, column, estimate, due date and
+context are unchanged. Entries expire after a TTL and the least recently used
+entry is evicted once the cache is full.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict
+
+from src.services.metrics import REGISTRY
+from src.services.ttl_cache import TTLCache
+
+SCORE_CACHE_REQUESTS = REGISTRY.counter(
+    "score_cache_requests",
+    "Score cache lookups by result",
+    labelnames=("result",),
+)
+SCORE_CACHE_SIZE = REGISTRY.gauge(
+    "score_cache_entries", "Scores currently held in the score cache"
+)
+
+
+def score_cache_key(payload: Dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ScoreCache(TTLCache[str, float]):
+    def __init__(self, *, maxsize: int, ttl_seconds: float) -> None:
+        super().__init__(
+            maxsize=maxsize, ttl_seconds=ttl_seconds, requests=SCORE_CACHE_REQUESTS
+        )
+
+
+score_cache = ScoreCache(
+    maxsize=int(os.getenv("SCORE_CACHE_SIZE", "1000")),
+    ttl_seconds=float(os.getenv("SCORE_CACHE_TTL", "300")),
+)
+SCORE_CACHE_SIZE.set_function(lambda: len(score_cache))
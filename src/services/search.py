@@ -0,0 +1,116 @@
+"""
+Ranked full-text search over card titles.
+
+SQLite queries the `cards_fts` FTS5 table and ranks by bm25; Postgres matches
+`to_tsvector('simple', title)` through its GIN index and ranks by ts_rank (see
+CARD_SEARCH_DDL in src.adapters.models). User input is reduced to word terms
+before it reaches either query language, so operators in `q` are literal.
+Every term must match, the last one as a prefix for search-as-you-type.
+
+`python -m src.services.search` creates the index on an existing database and
+rebuilds it from `cards`.
+"""
+
+import re
+from typing import List, Optional, Sequence
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.adapters.models import CARD_SEARCH_DDL, Card
+from src.services.principals import Principal
+
+MAX_TERMS = 8
+_TERM = re.compile(r"\w+")
+
+_cards_fts = table("cards_fts", column("rowid"))
+_SIMPLE = literal_column("'simple'")
+
+
+def search_terms(q: str) -> List[str]:
+    return _TERM.findall(q.lower())[:MAX_TERMS]
+
+
+def _fts5_query(terms: Sequence[str]) -> str:
+    *words, last = terms
+    return " ".join([f'"{word}"' for word in words] + [f'"{last}"*'])
+
+
+def _tsquery(terms: Sequence[str]) -> str:
+    *words, last = terms
+    return " & ".join(list(words) + [f"{last}:*"])
+
+
+def search_cards(
+    db: Session,
+    requester: Principal,
+    q: str,
+    *,
+    board_id: Optional[int] = None,
+    limit: int = 20,
+) -> Sequence[Card]:
+    """Best matches first; visibility follows `get_card` (owner or admin)."""
+    terms = search_terms(q)
+    if not terms:
+        return []
+    query = select(Card)
+    if requester.role != "admin":
+        query = query.where(Card.owner_id == requester.id)
+    if board_id is not None:
+        query = query.where(Card.board_id == board_id)
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        query = (
+            query.join(_cards_fts, _cards_fts.c.rowid == Card.id)
+            .where(text("cards_fts MATCH :match").bindparams(match=_fts5_query(terms)))
+            .order_by(func.bm25(literal_column("cards_fts")), Card.id)
+        )
+    elif dialect == "postgresql":
+        vector = func.to_tsvector(_SIMPLE, Card.title)
+        tsquery = func.to_tsquery(_SIMPLE, _tsquery(terms))
+        query = query.where(vector.op("@@")(tsquery)).order_by(
+            func.ts_rank(vector, tsquery).desc(), Card.id
+        )
+    else:
+        raise RuntimeError(f"card search is not implemented for {dialect}")
+    return db.scalars(query.limit(limit)).all()
+
+
+async def search_cards_async(
+    db: AsyncSession,
+    requester: Principal,
+    q: str,
+    *,
+    board_id: Optional[int] = None,
+    limit: int = 20,
+) -> Sequence[Card]:
+    return await db.run_sync(
+        lambda session: search_cards(
+            session, requester, q, board_id=board_id, limit=limit
+        )
+    )
+
+
+def ensure_search_index(db: Session) -> None:
+    """Create the search index if missing and rebuild it from `cards`."""
+    dialect = db.get_bind().dialect.name
+    for statement in CARD_SEARCH_DDL.get(dialect, ()):
+        db.execute(text(statement))
+    if dialect == "sqlite":
+        db.execute(text("INSERT INTO cards_fts(cards_fts) VALUES ('rebuild')"))
+    db.commit()
+
+
+def main() -> int:
+    from src.adapters.db import SessionLocal, init_db
+
+    init_db()
+    with SessionLocal() as db:
+        ensure_search_index(db)
+    print("card search index rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+"""
+Trusted-output JSON encoding for cards read from our own database.
+
+Rows written through the API already passed `CardBase` validation (stripped
+title, quantized estimate, UTC due date), so re-running the validators and
+FastAPI's response_model check on every read is wasted work. These helpers
+copy the `CardOut` fields straight into dicts and encode them with
+pydantic-core, producing the same JSON as `CardOut` would.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from pydantic_core import to_json
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.adapters.models import Attachment, Card, Upload, UploadBlob
+from src.domain.schemas import CardOut
+
+CARD_OUT_FIELDS = tuple(name for name in CardOut.model_fields if name != "attachments")
+# Selectable columns in CardOut field order, for queries that skip the ORM.
+CARD_OUT_COLUMNS = tuple(getattr(Card, name) for name in CARD_OUT_FIELDS)
+ATTACHMENT_OUT_COLUMNS = (
+    Attachment.card_id,
+    Attachment.id,
+    Attachment.upload_id,
+    Upload.content_type,
+    Upload.size,
+    UploadBlob.thumbnail,
+    Attachment.created_at,
+)
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Same normalisation CardBase applies to due_date.
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def attachment_to_dict(attachment: Any) -> Dict[str, Any]:
+    """AttachmentOut-shaped dict from an ORM attachment."""
+    upload = attachment.upload
+    return {
+        "id": attachment.id,
+        "upload_id": attachment.upload_id,
+        "content_type": upload.content_type,
+        "size": upload.size,
+        "thumbnail": upload.blob.thumbnail,
+        "created_at": attachment.created_at,
+    }
+
+
+def attachments_by_card(db: Session, *criteria: Any) -> Dict[int, List[Dict[str, Any]]]:
+    """Attachments of the cards matching `criteria`, in one query.
+
+    The counterpart of CARD_OUT_COLUMNS for row-based reads; cards loaded
+    through the ORM get theirs from the `Card.attachments` relationship.
+    """
+    query = (
+        select(*ATTACHMENT_OUT_COLUMNS)
+        .join(Card, Card.id == Attachment.card_id)
+        .join(Upload, Upload.id == Attachment.upload_id)
+        .join(UploadBlob, UploadBlob.sha256 == Upload.sha256)
+        .where(*criteria)
+        .order_by(Attachment.id)
+    )
+    grouped: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for row in db.execute(query):
+        grouped[row.card_id].append(
+            {
+                "id": row.id,
+                "upload_id": row.upload_id,
+                "content_type": row.content_type,
+                "size": row.size,
+                "thumbnail": row.thumbnail,
+                "created_at": row.created_at,
+            }
+        )
+    return grouped
+
+
+def card_to_dict(
+    card: Any, attachments: Optional[Mapping[int, List[Dict[str, Any]]]] = None
+) -> Dict[str, Any]:
+    """CardOut-shaped dict from an ORM card or a row of CARD_OUT_COLUMNS.
+
+    Rows carry no attachments, so callers pass the `attachments_by_card`
+    mapping for them.
+    """
+    data = {name: getattr(card, name) for name in CARD_OUT_FIELDS}
+    data["due_date"] = as_utc(data["due_date"])
+    if attachments is None:
+        data["attachments"] = [attachment_to_dict(a) for a in card.attachments]
+    else:
+        data["attachments"] = attachments.get(data["id"], [])
+    return data
+
+
+def cards_to_dicts(
+    cards: Iterable[Any],
+    attachments: Optional[Mapping[int, List[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
+    return [card_to_dict(card, attachments) for card in cards]
+
+
+def cards_json(
+    cards: Iterable[Any],
+    attachments: Optional[Mapping[int, List[Dict[str, Any]]]] = None,
+) -> bytes:
+    return to_json(cards_to_dicts(cards, attachments))
@@ -0,0 +1,225 @@
+"""
+Per-(board, column) card counters kept in `board_column_stats`.
+
+Card services collect the count/estimate changes of a transaction in a
+`StatsDelta` and apply it with one upsert before committing, so reading a
+board's stats touches one row per column. Overdue cards depend on the clock
+rather than on writes, so they are counted at read time from the
+(board_id, due_date) index; that scan only visits overdue cards.
+
+`python -m src.services.stats [--fix]` recomputes the table from `cards` and
+reports (or repairs) any drift.
+"""
+
+import argparse
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple, get_args
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.adapters.models import Board, BoardColumnStats, Card
+from src.domain.schemas import CardColumn
+
+ZERO = Decimal("0.00")
+# Cards in this column are finished and never count as overdue.
+DONE_COLUMN = "done"
+
+StatsKey = Tuple[int, str]
+
+
+def _estimate(value: Optional[Any]) -> Decimal:
+    if value is None:
+        return ZERO
+    return Decimal(str(value)).quantize(ZERO)
+
+
+class StatsDelta:
+    """Net change to card_count / estimate_total per (board, column)."""
+
+    def __init__(self) -> None:
+        self._changes: DefaultDict[StatsKey, List[Any]] = defaultdict(lambda: [0, ZERO])
+
+    def add(self, board_id: int, column: str, estimate: Optional[Any]) -> None:
+        change = self._changes[(board_id, column)]
+        change[0] += 1
+        change[1] += _estimate(estimate)
+
+    def remove(self, board_id: int, column: str, estimate: Optional[Any]) -> None:
+        change = self._changes[(board_id, column)]
+        change[0] -= 1
+        change[1] -= _estimate(estimate)
+
+    def replace(
+        self,
+        board_id: int,
+        old: Tuple[str, Optional[Any]],
+        new: Tuple[str, Optional[Any]],
+    ) -> None:
+        """A card moved from (column, estimate) `old` to `new`."""
+        if old[0] == new[0] and _estimate(old[1]) == _estimate(new[1]):
+            return
+        self.remove(board_id, *old)
+        self.add(board_id, *new)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        # Sorted so concurrent writers lock summary rows in the same order.
+        return [
+            {
+                "board_id": board_id,
+                "column": column,
+                "card_count": count,
+                "estimate_total": estimate,
+            }
+            for (board_id, column), (count, estimate) in sorted(self._changes.items())
+            if count or estimate
+        ]
+
+
+def apply_stats_delta(db: Session, delta: StatsDelta) -> None:
+    """Upsert the delta inside the caller's transaction."""
+    rows = delta.rows()
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(BoardColumnStats)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(BoardColumnStats)
+    else:
+        raise RuntimeError(f"board stats upsert is not implemented for {dialect}")
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[BoardColumnStats.board_id, BoardColumnStats.column],
+        set_={
+            "card_count": BoardColumnStats.card_count + stmt.excluded.card_count,
+            "estimate_total": BoardColumnStats.estimate_total
+            + stmt.excluded.estimate_total,
+        },
+    )
+    db.execute(stmt, rows)
+
+
+def board_stats(db: Session, board: Board) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    columns = {
+        column: {
+            "column": column,
+            "card_count": 0,
+            "estimate_hours": ZERO,
+            "overdue": 0,
+        }
+        for column in get_args(CardColumn)
+    }
+    summary = db.execute(
+        select(
+            BoardColumnStats.column,
+            BoardColumnStats.card_count,
+            BoardColumnStats.estimate_total,
+        ).where(BoardColumnStats.board_id == board.id)
+    )
+    for column, count, estimate in summary:
+        columns[column]["card_count"] = count
+        columns[column]["estimate_hours"] = _estimate(estimate)
+    overdue = db.execute(
+        select(Card.column, func.count())
+        .where(
+            Card.board_id == board.id,
+            Card.due_date < now,
+            Card.column != DONE_COLUMN,
+        )
+        .group_by(Card.column)
+    )
+    for column, count in overdue:
+        columns[column]["overdue"] = count
+    entries = list(columns.values())
+    return {
+        "board_id": board.id,
+        "card_count": sum(e["card_count"] for e in entries),
+        "estimate_hours": sum((e["estimate_hours"] for e in entries), ZERO),
+        "overdue": sum(e["overdue"] for e in entries),
+        "columns": entries,
+    }
+
+
+def _actual_stats(db: Session) -> Dict[StatsKey, Tuple[int, Decimal]]:
+    rows = db.execute(
+        select(
+            Card.board_id,
+            Card.column,
+            func.count(),
+            func.coalesce(func.sum(Card.estimate_hours), 0),
+        ).group_by(Card.board_id, Card.column)
+    )
+    return {
+        (board_id, column): (count, _estimate(total))
+        for board_id, column, count, total in rows
+    }
+
+
+def rebuild_board_stats(db: Session, *, fix: bool) -> List[Dict[str, Any]]:
+    """Compare the summary table with `cards`; with `fix`, rewrite it.
+
+    Returns one entry per (board, column) whose stored values drifted.
+    """
+    actual = _actual_stats(db)
+    stored = {
+        (row.board_id, row.column): (row.card_count, _estimate(row.estimate_total))
+        for row in db.scalars(select(BoardColumnStats))
+    }
+    drift = [
+        {
+            "board_id": key[0],
+            "column": key[1],
+            "stored": stored.get(key, (0, ZERO)),
+            "actual": actual.get(key, (0, ZERO)),
+        }
+        for key in sorted(set(actual) | set(stored))
+        if stored.get(key, (0, ZERO)) != actual.get(key, (0, ZERO))
+    ]
+    if fix:
+        db.execute(delete(BoardColumnStats))
+        if actual:
+            db.execute(
+                BoardColumnStats.__table__.insert(),
+                [
+                    {
+                        "board_id": board_id,
+                        "column": column,
+                        "card_count": count,
+                        "estimate_total": estimate,
+                    }
+                    for (board_id, column), (count, estimate) in sorted(actual.items())
+                ],
+            )
+        db.commit()
+    return drift
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Verify board_column_stats against cards"
+    )
+    parser.add_argument(
+        "--fix", action="store_true", help="rewrite the table from cards"
+    )
+    args = parser.parse_args(argv)
+
+    from src.adapters.db import SessionLocal, init_db
+
+    init_db()
+    with SessionLocal() as db:
+        drift = rebuild_board_stats(db, fix=args.fix)
+    for entry in drift:
+        print(
+            f"board {entry['board_id']} column {entry['column']}: "
+            f"stored {entry['stored']} actual {entry['actual']}"
+        )
+    print(f"{len(drift)} drifted rows" + (", rebuilt" if args.fix else ""))
+    return 1 if drift and not args.fix else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,242 @@
+"""
+Board export and import as NDJSON streams.
+
+An export is one `{"type": "board", ...}` line followed by one
+`{"type": "card", ...}` line per card, in display order. Cards carry exactly
+the `CardBase` fields, so an export imports back unchanged. Attachments,
+scores and ids are not part of it.
+
+Both directions use constant memory whatever the board size. The export reads
+the cards through a server-side cursor (`yield_per`) in its own session, so
+the stream outlives the request's session. The import first spools the body
+to a temporary file, checking line lengths as it arrives. Only then, in one
+worker thread, does it validate and insert the lines `BOARD_IMPORT_BATCH_SIZE`
+at a time with executemany Core inserts, which build no ORM objects. The whole
+import is one transaction that creates a new board.
+
+On SQLite an import serializes writers. Other writes wait (up to the busy
+timeout) while its transaction inserts the cards. Spooling first keeps that
+window to the server's own work, so a slow uploader does not hold the lock.
+"""
+
+import json
+import os
+import tempfile
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from pydantic_core import to_json
+from sqlalchemy import asc, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.adapters.db import SessionLocal
+from src.adapters.models import Board, Card
+from src.domain.schemas import BoardCreate, CardBase, CardCreate
+from src.services.metrics import REGISTRY
+from src.services.principals import Principal
+from src.services.serialization import as_utc
+from src.services.stats import StatsDelta, apply_stats_delta
+
+EXPORT_FIELDS = tuple(CardBase.model_fields)
+EXPORT_BATCH_SIZE = int(os.getenv("BOARD_EXPORT_BATCH_SIZE", "1000"))
+IMPORT_BATCH_SIZE = int(os.getenv("BOARD_IMPORT_BATCH_SIZE", "1000"))
+MAX_LINE_BYTES = 64 * 1024
+
+EXPORTED_CARDS = REGISTRY.counter("board_export_cards", "Cards written by exports")
+IMPORTED_CARDS = REGISTRY.counter("board_import_cards", "Cards created by imports")
+
+NdjsonLine = Tuple[int, bytes]
+
+
+def export_board_ndjson(
+    board_id: int,
+    *,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Iterator[bytes]:
+    """NDJSON chunks for an already authorized board, one per cursor batch."""
+    with session_factory() as db:
+        board = db.get(Board, board_id)
+        if board is None:
+            return
+        yield to_json({"type": "board", "title": board.title}) + b"\n"
+        rows = db.execute(
+            select(*(getattr(Card, name) for name in EXPORT_FIELDS))
+            .where(Card.board_id == board_id)
+            .order_by(asc(Card.column), asc(Card.order_idx), asc(Card.id))
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        for batch in rows.partitions():
+            lines = []
+            for row in batch:
+                card = {"type": "card", **row._asdict()}
+                card["due_date"] = as_utc(card["due_date"])
+                lines.append(to_json(card))
+            EXPORTED_CARDS.inc(len(lines))
+            yield b"\n".join(lines) + b"\n"
+
+
+def _invalid_line(line_no: int, message: str, errors: Any = None) -> HTTPException:
+    details: Dict[str, Any] = {"line": line_no}
+    if errors is not None:
+        details["errors"] = errors
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={"code": "IMPORT_INVALID_LINE", "message": message, "details": details},
+    )
+
+
+async def ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[NdjsonLine]:
+    """Non-blank lines of a streamed body with their 1-based line numbers."""
+    line_no = 0
+    pending = b""
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            line_no += 1
+            if len(line) > MAX_LINE_BYTES:
+                raise _invalid_line(line_no, "Line is too long")
+            if line.strip():
+                yield line_no, line
+        if len(pending) > MAX_LINE_BYTES:
+            raise _invalid_line(line_no + 1, "Line is too long")
+    if pending.strip():
+        yield line_no + 1, pending
+
+
+class _BoardImporter:
+    """Accumulates one import; each method runs in a worker thread."""
+
+    def __init__(self, db: Session, owner: Principal) -> None:
+        self.db = db
+        self.owner = owner
+        self.board: Optional[Board] = None
+        self.stats = StatsDelta()
+        self.cards = 0
+
+    def _record(self, line_no: int, raw: bytes) -> Dict[str, Any]:
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            raise _invalid_line(line_no, "Line is not valid JSON") from None
+        if not isinstance(record, dict):
+            raise _invalid_line(line_no, "Line must be a JSON object")
+        return record
+
+    def _start(self, line_no: int, record: Dict[str, Any]) -> None:
+        if record.pop("type", None) != "board":
+            raise _invalid_line(line_no, "The first line must describe the board")
+        try:
+            data = BoardCreate.model_validate(record)
+        except ValidationError as exc:
+            raise _invalid_line(
+                line_no,
+                "Invalid board",
+                exc.errors(include_url=False, include_context=False),
+            ) from None
+        self.board = Board(title=data.title, owner_id=self.owner.id)
+        self.db.add(self.board)
+        self.db.flush()
+
+    def load(self, lines: List[NdjsonLine]) -> None:
+        rows = []
+        for line_no, raw in lines:
+            record = self._record(line_no, raw)
+            if self.board is None:
+                self._start(line_no, record)
+                continue
+            if record.pop("type", None) != "card":
+                raise _invalid_line(line_no, "Expected a card line")
+            try:
+                card = CardCreate.model_validate({**record, "board_id": self.board.id})
+            except ValidationError as exc:
+                raise _invalid_line(
+                    line_no,
+                    "Invalid card",
+                    exc.errors(include_url=False, include_context=False),
+                ) from None
+            rows.append({**card.model_dump(), "owner_id": self.owner.id})
+            self.stats.add(card.board_id, card.column, card.estimate_hours)
+        if rows:
+            # A Core insert on the table skips the ORM bulk-save bookkeeping.
+            self.db.execute(insert(Card.__table__), rows)
+            self.cards += len(rows)
+
+    def finish(self) -> Board:
+        if self.board is None:
+            raise _invalid_line(1, "The import is empty")
+        apply_stats_delta(self.db, self.stats)
+        self.db.commit()
+        self.db.refresh(self.board)
+        IMPORTED_CARDS.inc(self.cards)
+        return self.board
+
+
+async def _spool_body(chunks: AsyncIterator[bytes], spool: IO[bytes]) -> None:
+    """Copy the body to `spool`, rejecting over-long lines as they arrive."""
+
+    async def written() -> AsyncIterator[bytes]:
+        async for chunk in chunks:
+            await run_in_threadpool(spool.write, chunk)
+            yield chunk
+
+    async for _ in ndjson_lines(written()):
+        pass
+
+
+def _spooled_lines(spool: IO[bytes]) -> Iterator[NdjsonLine]:
+    """Non-blank lines of a spooled body, numbered as `ndjson_lines` does."""
+    spool.seek(0)
+    for line_no, line in enumerate(spool, start=1):
+        line = line.rstrip(b"\n")
+        if line.strip():
+            yield line_no, line
+
+
+def _import_spooled(importer: _BoardImporter, spool: IO[bytes]) -> Board:
+    batch: List[NdjsonLine] = []
+    for line in _spooled_lines(spool):
+        batch.append(line)
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            importer.load(batch)
+            batch = []
+    importer.load(batch)
+    return importer.finish()
+
+
+async def import_board(
+    db: Session,
+    owner: Principal,
+    chunks: AsyncIterator[bytes],
+) -> Board:
+    """Create a board from an export stream; nothing is kept on error."""
+    with tempfile.TemporaryFile() as spool:
+        await _spool_body(chunks, spool)
+        importer = _BoardImporter(db, owner)
+        try:
+            return await run_in_threadpool(_import_spooled, importer, spool)
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "code": "IMPORT_CONFLICT",
+                    "message": "Two cards share a column position",
+                    "details": {},
+                },
+            ) from None
+        except BaseException:
+            db.rollback()
+            raise
@@ -0,0 +1,74 @@
+"""
+Bounded, thread-safe LRU map whose entries expire.
+
+Shared by the in-process caches that hold small values per key (verified
+principals, external scores). Lookups are counted on a `result` = hit|miss
+counter supplied by the owner. A cache with `maxsize` or `ttl_seconds` of 0 is
+disabled: it stores nothing and counts nothing.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from src.services.metrics import Counter
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(self, *, maxsize: int, ttl_seconds: float, requests: Counter) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._requests = requests
+        self._entries: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0 and self._ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._requests.inc(result="miss")
+                return None
+            self._entries.move_to_end(key)
+        self._requests.inc(result="hit")
+        return entry[0]
+
+    def put(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Store `value` for the cache TTL, or for `ttl_seconds` if shorter."""
+        if not self.enabled:
+            return
+        ttl = self._ttl if ttl_seconds is None else min(self._ttl, ttl_seconds)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[V], bool]) -> None:
+        """Drop every entry whose value matches; a full scan, meant for rare events."""
+        with self._lock:
+            for key in [
+                k for k, (value, _) in self._entries.items() if predicate(value)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
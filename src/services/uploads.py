@@ -0,0 +1,275 @@
+"""
+Streaming, content-addressed image uploads (ADR-001).
+
+The request body is written chunk by chunk to a temporary file inside the
+upload directory and hashed on the way, so memory per upload is bounded by
+the server's chunk size regardless of file size or concurrency. The size
+limit is enforced as bytes arrive (and up front from Content-Length) and the
+magic bytes are checked as soon as enough of the body has been seen; the
+client's file name is never used.
+
+Content is stored once per SHA-256 as `<sha256>.<ext>` and reference counted
+in `upload_blobs`; each upload is a UUID-named `Upload` row pointing at its
+blob, so re-uploading the same file costs a row, not disk space. A blob's
+thumbnail, once rendered (src.services.attachments), sits next to it as
+`<sha256>.thumb.<ext>` and goes with it.
+"""
+
+import hashlib
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.adapters.models import Attachment, Upload, UploadBlob
+from src.services.metrics import REGISTRY
+from src.services.principals import Principal
+
+UPLOAD_DIR = Path(
+    os.getenv("UPLOAD_DIR", str(Path(__file__).resolve().parents[2] / "uploads"))
+)
+MAX_UPLOAD_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(1024 * 1024)))
+
+SIGNATURES = {
+    "image/png": b"\x89PNG\r\n\x1a\n",
+    "image/jpeg": b"\xff\xd8\xff",
+}
+EXTENSIONS = {"image/png": ".png", "image/jpeg": ".jpg"}
+
+UPLOADS = REGISTRY.counter(
+    "uploads", "Upload attempts by result", labelnames=("result",)
+)
+UPLOAD_BYTES = REGISTRY.counter("upload_bytes", "Bytes received by accepted uploads")
+UPLOAD_DEDUP_BYTES = REGISTRY.counter(
+    "upload_dedup_bytes", "Bytes not stored because identical content already was"
+)
+
+
+@dataclass(frozen=True)
+class ReceivedUpload:
+    """A validated body in a temp file, not yet registered."""
+
+    temp_path: Path
+    sha256: str
+    content_type: str
+    size: int
+
+
+def _reject(result: str, status_code: int, code: str, message: str) -> HTTPException:
+    UPLOADS.inc(result=result)
+    return HTTPException(
+        status_code=status_code,
+        detail={"code": code, "message": message, "details": {}},
+    )
+
+
+def _too_large() -> HTTPException:
+    return _reject(
+        "too_large",
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        "FILE_TOO_LARGE",
+        f"File exceeds {MAX_UPLOAD_BYTES} bytes",
+    )
+
+
+def _bad_signature() -> HTTPException:
+    return _reject(
+        "bad_signature",
+        status.HTTP_400_BAD_REQUEST,
+        "INVALID_FILE_SIGNATURE",
+        "File content does not match its content type",
+    )
+
+
+def upload_dir() -> Path:
+    """The canonical upload directory; refuses to write through a symlink."""
+    if UPLOAD_DIR.is_symlink():
+        raise RuntimeError(f"Upload directory {UPLOAD_DIR} must not be a symlink")
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    return UPLOAD_DIR.resolve()
+
+
+def blob_path(sha256: str, content_type: str) -> Path:
+    return upload_dir() / f"{sha256}{EXTENSIONS[content_type]}"
+
+
+def thumbnail_path(sha256: str, content_type: str) -> Path:
+    return upload_dir() / f"{sha256}.thumb{EXTENSIONS[content_type]}"
+
+
+def media_type(content_type: Optional[str]) -> str:
+    mime = (content_type or "").split(";", 1)[0].strip().lower()
+    if mime not in SIGNATURES:
+        raise _reject(
+            "unsupported_type",
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            "UNSUPPORTED_MEDIA_TYPE",
+            "Only image/png and image/jpeg uploads are accepted",
+        )
+    return mime
+
+
+def _write(out: Any, hasher: Any, chunk: bytes) -> None:
+    out.write(chunk)
+    hasher.update(chunk)
+
+
+async def receive_upload(
+    chunks: AsyncIterator[bytes],
+    content_type: Optional[str],
+    content_length: Optional[str] = None,
+) -> ReceivedUpload:
+    """Stream a validated body to a temp file; the caller must register it."""
+    mime = media_type(content_type)
+    if content_length is not None and content_length.isdigit():
+        if int(content_length) > MAX_UPLOAD_BYTES:
+            raise _too_large()
+    signature = SIGNATURES[mime]
+    # mkstemp opens with O_CREAT | O_EXCL, so it never follows an existing link.
+    fd, temp_name = tempfile.mkstemp(
+        dir=upload_dir(), prefix=".upload-", suffix=".part"
+    )
+    temp_path = Path(temp_name)
+    hasher = hashlib.sha256()
+    size = 0
+    # Only the first len(signature) bytes are kept, in case chunks are tiny.
+    head = b""
+    try:
+        with os.fdopen(fd, "wb") as out:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise _too_large()
+                if len(head) < len(signature):
+                    head += chunk[: len(signature) - len(head)]
+                    if not signature.startswith(head):
+                        raise _bad_signature()
+                await run_in_threadpool(_write, out, hasher, chunk)
+        if len(head) < len(signature):
+            raise _bad_signature()
+    except BaseException:
+        # Covers rejections, client disconnects and cancellation alike.
+        temp_path.unlink(missing_ok=True)
+        raise
+    return ReceivedUpload(temp_path, hasher.hexdigest(), mime, size)
+
+
+def _blob_insert(db: Session) -> Any:
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(UploadBlob)
+    if dialect == "sqlite":
+        return sqlite.insert(UploadBlob)
+    raise RuntimeError(f"upload blob upsert is not implemented for {dialect}")
+
+
+def register_upload(db: Session, received: ReceivedUpload, owner: Principal) -> Upload:
+    """Take a reference on the blob for `received` and create the Upload row."""
+    try:
+        stmt = _blob_insert(db).values(
+            sha256=received.sha256,
+            content_type=received.content_type,
+            size=received.size,
+            ref_count=1,
+        )
+        # The upsert locks the blob row until commit, so placing the file
+        # cannot interleave with release_blob removing it.
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UploadBlob.sha256],
+                set_={"ref_count": UploadBlob.ref_count + 1},
+            )
+        )
+        path = blob_path(received.sha256, received.content_type)
+        if path.exists():
+            received.temp_path.unlink()
+            UPLOADS.inc(result="deduplicated")
+            UPLOAD_DEDUP_BYTES.inc(received.size)
+        else:
+            os.replace(received.temp_path, path)
+            UPLOADS.inc(result="stored")
+        upload = Upload(
+            id=uuid.uuid4().hex,
+            sha256=received.sha256,
+            owner_id=owner.id,
+            content_type=received.content_type,
+            size=received.size,
+        )
+        db.add(upload)
+        db.commit()
+    except BaseException:
+        db.rollback()
+        received.temp_path.unlink(missing_ok=True)
+        raise
+    UPLOAD_BYTES.inc(received.size)
+    db.refresh(upload)
+    return upload
+
+
+def get_upload(db: Session, upload_id: str, requester: Principal) -> Upload:
+    upload = db.get(Upload, upload_id)
+    if upload is None or (
+        upload.owner_id != requester.id and requester.role != "admin"
+    ):
+        # Other users' uploads are reported as missing rather than forbidden.
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "UPLOAD_NOT_FOUND",
+                "message": "Upload not found",
+                "details": {},
+            },
+        )
+    return upload
+
+
+def release_blob(db: Session, sha256: str, content_type: str) -> None:
+    """Drop one reference; the last one removes the row and the file.
+
+    Runs inside the caller's transaction. The file is unlinked before the
+    commit while the row is locked; if the commit then fails, the next
+    upload of the same content puts the file back.
+    """
+    db.execute(
+        update(UploadBlob)
+        .where(UploadBlob.sha256 == sha256)
+        .values(ref_count=UploadBlob.ref_count - 1)
+    )
+    removed = db.execute(
+        delete(UploadBlob).where(UploadBlob.sha256 == sha256, UploadBlob.ref_count <= 0)
+    )
+    if removed.rowcount:
+        blob_path(sha256, content_type).unlink(missing_ok=True)
+        thumbnail_path(sha256, content_type).unlink(missing_ok=True)
+
+
+def delete_upload(db: Session, upload_id: str, requester: Principal) -> None:
+    upload = get_upload(db, upload_id, requester)
+    attached = select(Attachment.id).where(Attachment.upload_id == upload.id)
+    if db.scalar(attached.limit(1)) is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "code": "UPLOAD_IN_USE",
+                "message": "Upload is attached to a card",
+                "details": {},
+            },
+        )
+    db.delete(upload)
+    db.flush()
+    release_blob(db, upload.sha256, upload.content_type)
+    db.commit()
+
+
+def upload_etag(upload: Upload) -> str:
+    return f'"{upload.sha256}"'
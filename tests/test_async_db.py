@@ -0,0 +1,111 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.db import (
+    Base,
+    _to_async_url,
+    engine,
+    get_async_engine,
+    get_async_sessionmaker,
+)
+from src.adapters.models import Board, User
+from src.domain.schemas import CardCreate, CardMove
+from src.main import app, include_api_routes
+from src.services.cards import create_card_async, list_cards_async, move_card_async
+
+
+def _reset_db() -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _async_app() -> FastAPI:
+    async_app = FastAPI(exception_handlers=app.exception_handlers)
+    include_api_routes(async_app, async_mode=True)
+    return async_app
+
+
+def test_async_url_mapping():
+    assert _to_async_url("sqlite:///./x.db") == "sqlite+aiosqlite:///./x.db"
+    assert (
+        _to_async_url("postgresql+psycopg2://u:p@db:5432/kanban")
+        == "postgresql+asyncpg://u:p@db:5432/kanban"
+    )
+
+
+def test_async_card_services_share_sync_rules():
+    _reset_db()
+
+    async def scenario():
+        async with get_async_sessionmaker()() as db:
+            owner = User(email="async@example.com", hashed_password="x", role="user")
+            db.add(owner)
+            await db.flush()
+            board = Board(title="Async", owner_id=owner.id)
+            db.add(board)
+            await db.commit()
+
+            data = CardCreate(
+                title="  idea  ", column="backlog", order_idx=0, board_id=board.id
+            )
+            card = await create_card_async(db, owner, data)
+            moved = await move_card_async(
+                db, card.id, owner, CardMove(column="done", order_idx=3)
+            )
+            cards = await list_cards_async(db, owner, board_id=board.id)
+        await get_async_engine().dispose()
+        return card, moved, cards
+
+    card, moved, cards = asyncio.run(scenario())
+    assert card.title == "idea"
+    assert (moved.column, moved.order_idx) == ("done", 3)
+    assert [c.id for c in cards] == [card.id]
+
+
+def test_async_router_end_to_end():
+    _reset_db()
+    with TestClient(_async_app()) as async_client:
+        creds = {"email": "async-api@example.com", "password": "password123"}
+        resp = async_client.post("/api/v1/auth/register", json=creds)
+        assert resp.status_code == 201
+        resp = async_client.post(
+            "/api/v1/auth/login",
+            data={"username": creds["email"], "password": creds["password"]},
+        )
+        assert resp.status_code == 200
+        headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+        board = async_client.post(
+            "/api/v1/boards", json={"title": "A"}, headers=headers
+        ).json()
+        resp = async_client.post(
+            "/api/v1/cards",
+            json={
+                "title": "card",
+                "column": "todo",
+                "order_idx": 0,
+                "board_id": board["id"],
+            },
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        card_id = resp.json()["id"]
+        resp = async_client.patch(
+            f"/api/v1/cards/{card_id}", json={"title": "renamed"}, headers=headers
+        )
+        assert resp.status_code == 200
+        assert resp.json()["attachments"] == []
+
+        resp = async_client.get("/api/v1/cards/999", headers=headers)
+        assert resp.status_code == 404
+        assert resp.json()["code"] == "CARD_NOT_FOUND"
+
+        resp = async_client.delete(f"/api/v1/cards/{card_id}", headers=headers)
+        assert resp.status_code == 204
+        assert async_client.get("/api/v1/cards", headers=headers).json() == []
+
+        # routes without an async override are still served by the sync router
+        assert async_client.post("/api/v1/auth/logout").status_code == 200
+    asyncio.run(get_async_engine().dispose())
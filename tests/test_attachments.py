@@ -0,0 +1,221 @@
+import io
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.adapters.models import Attachment
+from src.main import app
+from src.services import jobs
+from src.services import uploads as uploads_svc
+
+client = TestClient(app)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+@pytest.fixture
+def headers(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads_svc, "UPLOAD_DIR", tmp_path / "uploads")
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    creds = {"email": "attach@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@contextmanager
+def _count_queries():
+    counter = {"n": 0}
+
+    def count(*_args):
+        counter["n"] += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+
+def _upload(headers, content: bytes = PNG, content_type: str = "image/png") -> str:
+    resp = client.post(
+        "/api/v1/upload",
+        content=content,
+        headers={**headers, "Content-Type": content_type},
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()["id"]
+
+
+def _cards(headers, board_id: int, first: int, count: int) -> list[int]:
+    return [
+        client.post(
+            "/api/v1/cards",
+            json={
+                "title": f"card {i}",
+                "column": "todo",
+                "order_idx": i,
+                "board_id": board_id,
+            },
+            headers=headers,
+        ).json()["id"]
+        for i in range(first, first + count)
+    ]
+
+
+def _attach(headers, card_id: int, upload_id: str):
+    return client.post(
+        f"/api/v1/cards/{card_id}/attachments",
+        json={"upload_id": upload_id},
+        headers=headers,
+    )
+
+
+def _list(headers, board_id: int) -> list[dict]:
+    resp = client.get(
+        "/api/v1/cards",
+        params={"board_id": board_id, "limit": 100},
+        headers={**headers, "X-Cache-Bypass": "1"},
+    )
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_attachments_are_listed_inline_without_n_plus_one(headers):
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "attach"}, headers=headers
+    ).json()["id"]
+    upload_id = _upload(headers)
+    card_ids = _cards(headers, board_id, 0, 3)
+    created = _attach(headers, card_ids[0], upload_id)
+    assert created.status_code == 201
+    assert created.json()["thumbnail"] == "pending"
+    assert _attach(headers, card_ids[0], upload_id).status_code == 409
+
+    with _count_queries() as few:
+        cards = _list(headers, board_id)
+    assert cards[0]["attachments"] == [created.json()]
+    assert cards[1]["attachments"] == []
+
+    for card_id in [*card_ids, *_cards(headers, board_id, 3, 10)]:
+        _attach(headers, card_id, _upload(headers))
+    with _count_queries() as many:
+        cards = _list(headers, board_id)
+    assert all(card["attachments"] for card in cards)
+    assert many["n"] == few["n"]
+
+    # Row-based reads embed the same attachments.
+    snapshot = client.get(f"/api/v1/boards/{board_id}/snapshot", headers=headers)
+    assert snapshot.json()["columns"]["todo"] == cards
+    changes = client.get(f"/api/v1/boards/{board_id}/changes", headers=headers)
+    assert changes.json()["changed"] == sorted(cards, key=lambda card: card["id"])
+    batch = client.post(
+        "/api/v1/cards/batch",
+        json={"operations": [{"op": "update", "id": card_ids[0], "title": "renamed"}]},
+        headers=headers,
+    )
+    assert len(batch.json()["results"][0]["card"]["attachments"]) == 2
+
+
+def test_detach_delete_and_in_use_uploads(headers):
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "attach"}, headers=headers
+    ).json()["id"]
+    upload_id = _upload(headers)
+    first, second = _cards(headers, board_id, 0, 2)
+    attachment = _attach(headers, first, upload_id).json()
+    _attach(headers, second, upload_id)
+
+    # An attached upload cannot be deleted.
+    resp = client.delete(f"/api/v1/uploads/{upload_id}", headers=headers)
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "UPLOAD_IN_USE"
+
+    url = f"/api/v1/cards/{first}/attachments/{attachment['id']}"
+    assert client.delete(url, headers=headers).status_code == 204
+    assert client.delete(url, headers=headers).status_code == 404
+    assert (
+        client.get(f"/api/v1/cards/{first}", headers=headers).json()["attachments"]
+        == []
+    )
+    client.post(
+        "/api/v1/cards/batch",
+        json={"operations": [{"op": "delete", "id": second}]},
+        headers=headers,
+    )
+    with SessionLocal() as db:
+        assert db.scalar(select(func.count()).select_from(Attachment)) == 0
+    assert (
+        client.delete(f"/api/v1/uploads/{upload_id}", headers=headers).status_code
+        == 204
+    )
+
+
+def _image(image_format: str, size: tuple[int, int]) -> bytes:
+    from PIL import Image
+
+    out = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(out, image_format)
+    return out.getvalue()
+
+
+def test_thumbnails_are_rendered_by_the_job_worker(headers):
+    Image = pytest.importorskip("PIL.Image")
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "thumbs"}, headers=headers
+    ).json()["id"]
+    png, jpeg, broken = _cards(headers, board_id, 0, 3)
+    png_upload = _upload(headers, _image("PNG", (1000, 500)))
+    jpeg_upload = _upload(headers, _image("JPEG", (300, 900)), "image/jpeg")
+    broken_upload = _upload(headers, PNG)
+    for card_id, upload_id in [
+        (png, png_upload),
+        (jpeg, jpeg_upload),
+        (broken, broken_upload),
+    ]:
+        _attach(headers, card_id, upload_id)
+    thumbnail_url = f"/api/v1/uploads/{png_upload}/thumbnail"
+    assert client.get(thumbnail_url, headers=headers).status_code == 404
+    etag = client.get(f"/api/v1/boards/{board_id}/snapshot", headers=headers).headers[
+        "etag"
+    ]
+
+    assert jobs.run_pending() == 3
+    cards = {card["id"]: card for card in _list(headers, board_id)}
+    assert cards[png]["attachments"][0]["thumbnail"] == "ready"
+    assert cards[jpeg]["attachments"][0]["thumbnail"] == "ready"
+    assert cards[broken]["attachments"][0]["thumbnail"] == "failed"
+    # Cards showing the blob changed, so the board ETag moved on.
+    resp = client.get(
+        f"/api/v1/boards/{board_id}/snapshot",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert resp.status_code == 200
+
+    resp = client.get(thumbnail_url, headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "image/png"
+    assert Image.open(io.BytesIO(resp.content)).size == (256, 128)
+    resp = client.get(f"/api/v1/uploads/{jpeg_upload}/thumbnail", headers=headers)
+    assert Image.open(io.BytesIO(resp.content)).size == (85, 256)
+
+    # The thumbnail sits next to the original and goes with it.
+    sha256 = (
+        client.get(f"/api/v1/uploads/{png_upload}", headers=headers)
+        .headers["etag"]
+        .strip('"')
+    )
+    stored = {p.name for p in uploads_svc.UPLOAD_DIR.iterdir()}
+    assert {f"{sha256}.png", f"{sha256}.thumb.png"} <= stored
+    attachment_id = cards[png]["attachments"][0]["id"]
+    client.delete(f"/api/v1/cards/{png}/attachments/{attachment_id}", headers=headers)
+    client.delete(f"/api/v1/uploads/{png_upload}", headers=headers)
+    stored = {p.name for p in uploads_svc.UPLOAD_DIR.iterdir()}
+    assert not any(name.startswith(sha256) for name in stored)
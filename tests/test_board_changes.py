@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.adapters.models import CardTombstone
+from src.main import app
+from src.services import boards as boards_svc
+
+client = TestClient(app)
+
+
+def _setup() -> tuple[dict[str, str], int, list[int]]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    creds = {"email": "sync@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "sync"}, headers=headers
+    ).json()["id"]
+    card_ids = [
+        client.post(
+            "/api/v1/cards",
+            json={
+                "title": f"c{n}",
+                "column": "todo",
+                "order_idx": n,
+                "board_id": board_id,
+            },
+            headers=headers,
+        ).json()["id"]
+        for n in range(4)
+    ]
+    return headers, board_id, card_ids
+
+
+def test_changes_since_token_return_only_the_delta(monkeypatch):
+    monkeypatch.setattr(boards_svc, "SYNC_OVERLAP", timedelta(0))
+    headers, board_id, (edited, deleted, batch_deleted, untouched) = _setup()
+    url = f"/api/v1/boards/{board_id}/changes"
+
+    full = client.get(url, headers=headers).json()
+    assert len(full["changed"]) == 4 and full["deleted"] == []
+
+    client.patch(f"/api/v1/cards/{edited}", json={"title": "edited"}, headers=headers)
+    client.delete(f"/api/v1/cards/{deleted}", headers=headers)
+    client.post(
+        "/api/v1/cards/batch",
+        json={"operations": [{"op": "delete", "id": batch_deleted}]},
+        headers=headers,
+    )
+
+    delta = client.get(url, params={"since": full["next_token"]}, headers=headers)
+    assert delta.status_code == 200
+    body = delta.json()
+    assert [(c["id"], c["title"]) for c in body["changed"]] == [(edited, "edited")]
+    assert body["deleted"] == sorted([deleted, batch_deleted])
+
+    empty = client.get(url, params={"since": body["next_token"]}, headers=headers)
+    assert empty.json()["changed"] == [] and empty.json()["deleted"] == []
+    assert untouched not in {c["id"] for c in body["changed"]}
+
+
+def test_rebalanced_cards_are_part_of_the_delta(monkeypatch):
+    monkeypatch.setattr(boards_svc, "SYNC_OVERLAP", timedelta(0))
+    headers, board_id, (first, *_, last) = _setup()
+    url = f"/api/v1/boards/{board_id}/changes"
+    full = client.get(url, headers=headers).json()
+
+    # Ranks 0..3 leave no gap after `first`, so the column is renumbered.
+    client.patch(
+        f"/api/v1/cards/{last}/move",
+        json={"column": "todo", "after_id": first},
+        headers=headers,
+    )
+
+    delta = client.get(url, params={"since": full["next_token"]}, headers=headers)
+    state = {card["id"]: card for card in full["changed"]}
+    state.update({card["id"]: card for card in delta.json()["changed"]})
+    synced = sorted((c["order_idx"], c["id"]) for c in state.values())
+    snapshot = client.get(f"/api/v1/boards/{board_id}/snapshot", headers=headers)
+    expected = [(c["order_idx"], c["id"]) for c in snapshot.json()["columns"]["todo"]]
+    assert synced == expected
+    assert [card_id for _, card_id in synced][:2] == [first, last]
+
+
+def test_bad_or_foreign_tokens_are_rejected():
+    headers, board_id, _ = _setup()
+    other_board = client.post(
+        "/api/v1/boards", json={"title": "other"}, headers=headers
+    ).json()["id"]
+    token = client.get(f"/api/v1/boards/{other_board}/changes", headers=headers).json()[
+        "next_token"
+    ]
+
+    for since in ("not-a-token", token):
+        resp = client.get(
+            f"/api/v1/boards/{board_id}/changes",
+            params={"since": since},
+            headers=headers,
+        )
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "INVALID_SYNC_TOKEN"
+
+
+def test_tombstones_expire_with_the_retention_window():
+    headers, board_id, (old, deleted, *_) = _setup()
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        db.add(
+            CardTombstone(
+                card_id=old,
+                board_id=board_id,
+                deleted_at=now - boards_svc.SYNC_TOMBSTONE_RETENTION * 2,
+            )
+        )
+        db.commit()
+
+    client.delete(f"/api/v1/cards/{deleted}", headers=headers)
+    with SessionLocal() as db:
+        kept = db.scalars(select(CardTombstone.card_id)).all()
+    assert kept == [deleted]
+
+    stale = boards_svc.encode_sync_token(
+        board_id, now - boards_svc.SYNC_TOMBSTONE_RETENTION - timedelta(hours=1)
+    )
+    resp = client.get(
+        f"/api/v1/boards/{board_id}/changes",
+        params={"since": stale},
+        headers=headers,
+    )
+    assert resp.status_code == 410
+    assert resp.json()["code"] == "SYNC_TOKEN_EXPIRED"
+
+
+def test_delta_query_uses_board_updated_at_index():
+    with engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM cards "
+                "WHERE board_id = 1 AND updated_at > '2024-01-01'"
+            )
+        ).all()
+    assert "ix_cards_board_updated_at" in " ".join(str(row) for row in plan)
@@ -0,0 +1,218 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.adapters.models import Card
+from src.main import app
+from src.services.events import (
+    CARD_UPDATED,
+    EVENT_SUBSCRIBERS_DROPPED,
+    BoardEventBroker,
+    SubscriptionDropped,
+    broker,
+    queue_card_event,
+)
+
+client = TestClient(app)
+
+
+def _event_ids(frames: list[bytes]) -> list[str]:
+    return [frame.split(b"\n")[0].decode().removeprefix("id: ") for frame in frames]
+
+
+def test_subscribers_receive_and_resume_from_last_event_id():
+    events = BoardEventBroker(replay_size=3, buffer_size=10, max_boards=10)
+
+    async def scenario():
+        sub = events.subscribe(1)
+        events.publish(1, "card.created", {"id": 7, "board_id": 1})
+        events.publish(2, "card.created", {"id": 8, "board_id": 2})
+        first = await asyncio.wait_for(sub.get(), 1)
+        assert b"event: card.created" in first and b'"id":7' in first
+        last_id = _event_ids([first])[0]
+
+        for n in range(2):
+            events.publish(1, "card.updated", {"id": 7, "board_id": 1, "n": n})
+        resumed = events.subscribe(1, last_id)
+        replayed = [await resumed.get(), await resumed.get()]
+        assert [b'"n":0' in replayed[0], b'"n":1' in replayed[1]] == [True, True]
+
+        for _ in range(5):  # push the resume point out of the replay log
+            events.publish(1, "card.updated", {"id": 7, "board_id": 1})
+        stale = events.subscribe(1, last_id)
+        assert b"event: resync" in await stale.get()
+        restarted = events.subscribe(1, "other-epoch:1")
+        assert b"event: resync" in await restarted.get()
+
+    asyncio.run(scenario())
+
+
+def test_evicted_boards_never_reuse_event_ids():
+    events = BoardEventBroker(replay_size=10, buffer_size=10, max_boards=1)
+
+    async def scenario():
+        sub = events.subscribe(1)
+        events.publish(1, "card.created", {"id": 7, "board_id": 1})
+        last_id = _event_ids([await asyncio.wait_for(sub.get(), 1)])[0]
+        events.publish(1, "card.updated", {"id": 7, "board_id": 1})
+        events.publish(2, "card.created", {"id": 8, "board_id": 2})  # evicts board 1
+        events.publish(1, "card.updated", {"id": 7, "board_id": 1})
+        await asyncio.wait_for(sub.get(), 1)
+        latest = _event_ids([await asyncio.wait_for(sub.get(), 1)])[0]
+        assert latest.endswith(":3")
+        stale = events.subscribe(1, last_id)
+        assert b"event: resync" in await stale.get()
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscribers_are_dropped():
+    events = BoardEventBroker(replay_size=10, buffer_size=2, max_boards=10)
+    dropped_before = EVENT_SUBSCRIBERS_DROPPED.value()
+
+    async def scenario():
+        sub = events.subscribe(1)
+        for n in range(3):
+            events.publish(1, "card.updated", {"id": n, "board_id": 1})
+        await asyncio.sleep(0)  # let the threadsafe deliveries run
+        try:
+            await sub.get()
+        except SubscriptionDropped:
+            return True
+        return False
+
+    assert asyncio.run(scenario())
+    assert EVENT_SUBSCRIBERS_DROPPED.value() == dropped_before + 1
+
+
+def _login(email: str) -> dict[str, str]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    creds = {"email": email, "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_rolled_back_changes_are_not_published():
+    headers = _login("rollback-events@example.com")
+    board_id = client.post("/api/v1/boards", json={"title": "b"}, headers=headers)
+    board_id = board_id.json()["id"]
+
+    async def scenario():
+        sub = broker.subscribe(board_id)
+        with SessionLocal() as db:
+            card = Card(
+                title="x", column="todo", order_idx=1, board_id=board_id, owner_id=1
+            )
+            db.add(card)
+            queue_card_event(db, CARD_UPDATED, card)
+            db.rollback()
+        try:
+            await asyncio.wait_for(sub.get(), 0.05)
+        except asyncio.TimeoutError:
+            return True
+        finally:
+            broker.unsubscribe(sub)
+        return False
+
+    assert asyncio.run(scenario())
+
+
+def test_event_stream_pushes_committed_card_changes():
+    headers = _login("events@example.com")
+    board_id = client.post("/api/v1/boards", json={"title": "live"}, headers=headers)
+    board_id = board_id.json()["id"]
+    auth = headers["Authorization"].encode()
+
+    async def scenario() -> bytes:
+        disconnect = asyncio.Event()
+        received = b""
+        got_event = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal received
+            if message["type"] == "http.response.start":
+                assert message["status"] == 200
+            received += message.get("body", b"")
+            if b"card.created" in received:
+                got_event.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/api/v1/boards/{board_id}/events",
+            "raw_path": f"/api/v1/boards/{board_id}/events".encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver"), (b"authorization", auth)],
+            "client": ("127.0.0.1", 5000),
+            "server": ("testserver", 80),
+        }
+        stream = asyncio.create_task(app(scope, receive, send))
+        while b"retry:" not in received:
+            await asyncio.sleep(0.01)
+        created = await asyncio.to_thread(
+            client.post,
+            "/api/v1/cards",
+            json={
+                "title": "new",
+                "column": "todo",
+                "order_idx": 0,
+                "board_id": board_id,
+            },
+            headers=headers,
+        )
+        assert created.status_code == 201
+        await asyncio.wait_for(got_event.wait(), 2)
+        disconnect.set()
+        await asyncio.wait_for(stream, 2)
+        return received
+
+    body = asyncio.run(scenario())
+    assert b"event: card.created" in body
+    assert b'"title":"new"' in body
+
+
+def test_column_rebalance_asks_subscribers_to_resync():
+    headers = _login("rebalance-events@example.com")
+    board_id = client.post("/api/v1/boards", json={"title": "b"}, headers=headers)
+    board_id = board_id.json()["id"]
+    first, _, last = [
+        client.post(
+            "/api/v1/cards",
+            json={"title": "c", "column": "todo", "order_idx": i, "board_id": board_id},
+            headers=headers,
+        ).json()["id"]
+        for i in range(3)
+    ]
+
+    async def scenario() -> list[bytes]:
+        sub = broker.subscribe(board_id)
+        try:
+            # No gap between ranks 0 and 1, so the column is renumbered.
+            moved = await asyncio.to_thread(
+                client.patch,
+                f"/api/v1/cards/{last}/move",
+                json={"column": "todo", "after_id": first},
+                headers=headers,
+            )
+            assert moved.status_code == 200
+            return [await asyncio.wait_for(sub.get(), 1) for _ in range(2)]
+        finally:
+            broker.unsubscribe(sub)
+
+    resync, moved = asyncio.run(scenario())
+    assert b"event: resync" in resync
+    assert b"event: card.moved" in moved
@@ -0,0 +1,83 @@
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, engine
+from src.main import app
+
+client = TestClient(app)
+
+
+def _login(email: str) -> dict[str, str]:
+    creds = {"email": email, "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _seed() -> tuple[dict[str, str], int]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    headers = _login("snap@example.com")
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "Snap"}, headers=headers
+    ).json()["id"]
+    for i, column in enumerate(["todo", "backlog", "todo"]):
+        client.post(
+            "/api/v1/cards",
+            json={
+                "title": f"c{i}",
+                "column": column,
+                "order_idx": i,
+                "board_id": board_id,
+                "estimate_hours": "1.5",
+                "due_date": "2030-01-02T03:04:05",
+            },
+            headers=headers,
+        )
+    return headers, board_id
+
+
+def test_snapshot_groups_cards_like_card_out():
+    headers, board_id = _seed()
+    resp = client.get(f"/api/v1/boards/{board_id}/snapshot", headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["board"]["id"] == board_id
+    assert set(body["columns"]) == {"backlog", "todo", "in_progress", "done"}
+    assert [c["title"] for c in body["columns"]["todo"]] == ["c0", "c2"]
+
+    listed = client.get(f"/api/v1/cards?board_id={board_id}", headers=headers).json()
+    snapshot_cards = [c for cards in body["columns"].values() for c in cards]
+    assert sorted(snapshot_cards, key=lambda c: c["id"]) == sorted(
+        listed, key=lambda c: c["id"]
+    )
+
+
+def test_snapshot_etag_revalidation():
+    headers, board_id = _seed()
+    url = f"/api/v1/boards/{board_id}/snapshot"
+    first = client.get(url, headers=headers)
+    etag = first.headers["ETag"]
+
+    cached = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    card_id = first.json()["columns"]["backlog"][0]["id"]
+    client.patch(
+        f"/api/v1/cards/{card_id}/move", json={"column": "done"}, headers=headers
+    )
+
+    changed = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [c["id"] for c in changed.json()["columns"]["done"]] == [card_id]
+
+
+def test_snapshot_requires_board_access():
+    _, board_id = _seed()
+    other = _login("snap-other@example.com")
+    resp = client.get(f"/api/v1/boards/{board_id}/snapshot", headers=other)
+    assert resp.status_code == 403
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+from itertools import count
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.adapters.models import BoardColumnStats
+from src.main import app
+from src.services.stats import main, rebuild_board_stats
+
+client = TestClient(app)
+_order = count()
+
+
+def _setup() -> tuple[dict[str, str], int]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    creds = {"email": "stats@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "stats"}, headers=headers
+    ).json()["id"]
+    return headers, board_id
+
+
+def _card(headers, board_id, column, estimate=None, due_date=None) -> int:
+    body = {
+        "title": column,
+        "column": column,
+        "order_idx": next(_order),
+        "board_id": board_id,
+    }
+    if estimate is not None:
+        body["estimate_hours"] = estimate
+    if due_date is not None:
+        body["due_date"] = due_date.isoformat()
+    return client.post("/api/v1/cards", json=body, headers=headers).json()["id"]
+
+
+def _by_column(stats) -> dict:
+    return {
+        c["column"]: (c["card_count"], float(c["estimate_hours"]), c["overdue"])
+        for c in stats["columns"]
+    }
+
+
+def test_stats_follow_card_writes():
+    headers, board_id = _setup()
+    past = datetime.now(timezone.utc) - timedelta(days=1)
+    todo = _card(headers, board_id, "todo", "2.5", due_date=past)
+    moved = _card(headers, board_id, "todo", "1")
+    deleted = _card(headers, board_id, "in_progress", "4")
+    _card(headers, board_id, "done", "3", due_date=past)
+
+    client.patch(f"/api/v1/cards/{todo}", json={"estimate_hours": "5"}, headers=headers)
+    client.patch(
+        f"/api/v1/cards/{moved}/move",
+        json={"column": "in_progress", "order_idx": 100},
+        headers=headers,
+    )
+    client.delete(f"/api/v1/cards/{deleted}", headers=headers)
+    client.post(
+        "/api/v1/cards/batch",
+        json={
+            "operations": [
+                {
+                    "op": "create",
+                    "title": "b",
+                    "column": "todo",
+                    "order_idx": 101,
+                    "board_id": board_id,
+                    "estimate_hours": "1.25",
+                },
+                {"op": "move", "id": moved, "column": "done", "order_idx": 102},
+            ]
+        },
+        headers=headers,
+    )
+
+    resp = client.get(f"/api/v1/boards/{board_id}/stats", headers=headers)
+    assert resp.status_code == 200
+    stats = resp.json()
+    assert _by_column(stats) == {
+        "backlog": (0, 0.0, 0),
+        "todo": (2, 6.25, 1),
+        "in_progress": (0, 0.0, 0),
+        "done": (2, 4.0, 0),
+    }
+    assert stats["card_count"] == 4
+    assert float(stats["estimate_hours"]) == 10.25
+    # Cards in "done" are never overdue.
+    assert stats["overdue"] == 1
+
+
+def test_rebuild_detects_and_repairs_drift(capsys):
+    headers, board_id = _setup()
+    _card(headers, board_id, "todo", "2")
+    _card(headers, board_id, "todo", "3")
+
+    with SessionLocal() as db:
+        assert rebuild_board_stats(db, fix=False) == []
+        db.execute(
+            update(BoardColumnStats)
+            .where(BoardColumnStats.board_id == board_id)
+            .values(card_count=7)
+        )
+        db.commit()
+        drift = rebuild_board_stats(db, fix=False)
+    assert [(d["column"], d["stored"][0], d["actual"][0]) for d in drift] == [
+        ("todo", 7, 2)
+    ]
+
+    assert main([]) == 1
+    assert main(["--fix"]) == 0
+    assert "1 drifted rows, rebuilt" in capsys.readouterr().out
+    stats = client.get(f"/api/v1/boards/{board_id}/stats", headers=headers).json()
+    assert _by_column(stats)["todo"] == (2, 5.0, 0)
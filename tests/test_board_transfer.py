@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.main import app
+from src.services import transfer
+from src.services.principals import Principal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def headers(monkeypatch):
+    monkeypatch.setattr(transfer, "EXPORT_BATCH_SIZE", 2)
+    monkeypatch.setattr(transfer, "IMPORT_BATCH_SIZE", 2)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return _login("transfer@example.com")
+
+
+def _login(email: str) -> dict[str, str]:
+    creds = {"email": email, "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _chunked(body: bytes, size: int):
+    # Chunk boundaries fall in the middle of lines.
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def _import(headers, body: bytes):
+    return client.post(
+        "/api/v1/boards/import",
+        content=_chunked(body, 7),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+
+
+def _card_fields(board_id: int, headers) -> list[dict]:
+    columns = client.get(f"/api/v1/boards/{board_id}/snapshot", headers=headers).json()[
+        "columns"
+    ]
+    keep = ("title", "column", "order_idx", "estimate_hours", "due_date")
+    return [
+        {key: card[key] for key in keep} for cards in columns.values() for card in cards
+    ]
+
+
+def test_export_round_trips_through_import(headers):
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "Roadmap"}, headers=headers
+    ).json()["id"]
+    cards = [
+        {"title": "plain", "column": "todo", "order_idx": 0},
+        {"title": "second", "column": "todo", "order_idx": 1},
+        {
+            "title": "full",
+            "column": "done",
+            "order_idx": 0,
+            "estimate_hours": "2.50",
+            "due_date": "2031-05-06T07:08:09Z",
+        },
+    ]
+    for card in cards:
+        client.post(
+            "/api/v1/cards", json={**card, "board_id": board_id}, headers=headers
+        )
+
+    resp = client.get(f"/api/v1/boards/{board_id}/export", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in resp.content.splitlines()]
+    assert lines[0] == {"type": "board", "title": "Roadmap"}
+    assert [line["title"] for line in lines[1:]] == ["full", "plain", "second"]
+
+    imported = _import(headers, resp.content)
+    assert imported.status_code == 201, imported.text
+    new_id = imported.json()["id"]
+    assert new_id != board_id and imported.json()["title"] == "Roadmap"
+    assert _card_fields(new_id, headers) == _card_fields(board_id, headers)
+    stats = client.get(f"/api/v1/boards/{new_id}/stats", headers=headers).json()
+    assert (stats["card_count"], stats["estimate_hours"]) == (3, "2.50")
+
+    other = _login("stranger@example.com")
+    resp = client.get(f"/api/v1/boards/{board_id}/export", headers=other)
+    assert resp.status_code == 403
+
+
+def test_import_is_all_or_nothing(headers):
+    board = b'{"type": "board", "title": "Imported"}\n'
+    card = b'{"type": "card", "title": "ok", "column": "todo", "order_idx": %d}\n'
+    valid = board + b"".join(card % i for i in range(5))
+
+    bad_card = (
+        valid + b'{"type": "card", "title": "x", "column": "doing", "order_idx": 9}\n'
+    )
+    resp = _import(headers, bad_card)
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "IMPORT_INVALID_LINE"
+    assert resp.json()["details"]["line"] == 7
+
+    assert _import(headers, valid + b"not json\n").json()["details"]["line"] == 7
+    assert _import(headers, card % 0).json()["code"] == "IMPORT_INVALID_LINE"
+    assert _import(headers, b"").status_code == 400
+    resp = _import(headers, valid + card % 3)
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "IMPORT_CONFLICT"
+    # Failed imports leave no board behind.
+    assert client.get("/api/v1/boards", headers=headers).json() == []
+
+    resp = _import(headers, valid + b"\n")
+    assert resp.status_code == 201
+    assert len(_card_fields(resp.json()["id"], headers)) == 5
+
+
+def test_import_opens_no_transaction_while_the_body_arrives(headers):
+    body = b'{"type": "board", "title": "Slow"}\n' + b"".join(
+        b'{"type": "card", "title": "c", "column": "todo", "order_idx": %d}\n' % i
+        for i in range(5)
+    )
+    owner_id = client.post(
+        "/api/v1/boards", json={"title": "mine"}, headers=headers
+    ).json()["owner_id"]
+
+    with SessionLocal() as db:
+
+        async def slow_upload():
+            for chunk in _chunked(body, 7):
+                # A transaction here would hold SQLite's write lock on the client's pace.
+                assert not db.in_transaction()
+                await asyncio.sleep(0)
+                yield chunk
+
+        owner = Principal(id=owner_id, role="user", is_active=True)
+        board = asyncio.run(transfer.import_board(db, owner, slow_upload()))
+    assert len(_card_fields(board.id, headers)) == 5
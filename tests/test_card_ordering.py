@@ -0,0 +1,135 @@
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, engine
+from src.main import app
+from src.services import ordering
+from src.services.ordering import RANK_GAP, rank_between
+
+client = TestClient(app)
+
+
+def _board(orders: list[int], column: str = "todo") -> tuple[dict[str, str], list[int]]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    creds = {"email": "rank@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "Ranks"}, headers=headers
+    ).json()["id"]
+    ids = [
+        client.post(
+            "/api/v1/cards",
+            json={
+                "title": f"c{i}",
+                "column": column,
+                "order_idx": order,
+                "board_id": board_id,
+            },
+            headers=headers,
+        ).json()["id"]
+        for i, order in enumerate(orders)
+    ]
+    return headers, ids
+
+
+def _column(headers: dict[str, str], column: str = "todo") -> list[tuple[int, int]]:
+    cards = client.get(f"/api/v1/cards?column={column}&limit=100", headers=headers)
+    return [(c["id"], c["order_idx"]) for c in cards.json()]
+
+
+def test_rank_between():
+    assert rank_between(None, None) == RANK_GAP
+    assert rank_between(RANK_GAP, None) == 2 * RANK_GAP
+    assert rank_between(0, 10) == 5
+    assert rank_between(None, 4 * RANK_GAP) == 3 * RANK_GAP
+    assert rank_between(None, 1) == 0
+    assert rank_between(None, 0) is None
+    assert rank_between(3, 4) is None
+
+
+def test_move_after_writes_only_the_moved_card():
+    headers, (a, b, c) = _board([RANK_GAP, 2 * RANK_GAP, 3 * RANK_GAP])
+    resp = client.patch(
+        f"/api/v1/cards/{c}/move",
+        json={"column": "todo", "after_id": a},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert _column(headers) == [
+        (a, RANK_GAP),
+        (c, RANK_GAP + RANK_GAP // 2),
+        (b, 2 * RANK_GAP),
+    ]
+
+
+def test_move_before_and_append_across_columns():
+    headers, (a, b) = _board([RANK_GAP, 2 * RANK_GAP])
+    resp = client.patch(
+        f"/api/v1/cards/{b}/move", json={"column": "done"}, headers=headers
+    )
+    assert resp.json()["order_idx"] == RANK_GAP
+    resp = client.patch(
+        f"/api/v1/cards/{a}/move",
+        json={"column": "done", "before_id": b},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert [card_id for card_id, _ in _column(headers, "done")] == [a, b]
+
+
+def test_full_column_is_rebalanced_lazily():
+    headers, (a, b, c) = _board([0, 1, 2])
+    resp = client.patch(
+        f"/api/v1/cards/{c}/move",
+        json={"column": "todo", "after_id": a},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    column = _column(headers)
+    assert [card_id for card_id, _ in column] == [a, c, b]
+    assert column[0][1] == RANK_GAP and column[2][1] == 2 * RANK_GAP
+
+
+def test_invalid_positions_are_rejected():
+    headers, (a, b) = _board([0, 1])
+    resp = client.patch(
+        f"/api/v1/cards/{a}/move",
+        json={"column": "done", "after_id": b},
+        headers=headers,
+    )
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "INVALID_MOVE_ANCHOR"
+
+    resp = client.patch(
+        f"/api/v1/cards/{a}/move",
+        json={"column": "todo", "order_idx": 3, "before_id": b},
+        headers=headers,
+    )
+    assert resp.status_code == 422
+
+    resp = client.patch(
+        f"/api/v1/cards/{a}/move",
+        json={"column": "todo", "order_idx": 1},
+        headers=headers,
+    )
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "ORDER_CONFLICT"
+
+
+def test_no_gap_after_rebalance_is_a_conflict(monkeypatch):
+    headers, (a, b) = _board([0, 1])
+    monkeypatch.setattr(ordering, "rank_between", lambda _prev, _next: None)
+    resp = client.patch(
+        f"/api/v1/cards/{b}/move",
+        json={"column": "todo", "before_id": a},
+        headers=headers,
+    )
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "ORDER_CONFLICT"
+    monkeypatch.undo()
+    assert _column(headers) == [(a, 0), (b, 1)]
@@ -0,0 +1,146 @@
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, engine
+from src.main import app
+
+client = TestClient(app)
+
+
+def _login(email: str) -> dict[str, str]:
+    creds = {"email": email, "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    )
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _board_with_cards(headers: dict[str, str], n: int) -> tuple[int, list[int]]:
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "Batch"}, headers=headers
+    ).json()["id"]
+    ids = []
+    for i in range(n):
+        resp = client.post(
+            "/api/v1/cards",
+            json={
+                "title": f"c{i}",
+                "column": "todo",
+                "order_idx": i,
+                "board_id": board_id,
+            },
+            headers=headers,
+        )
+        ids.append(resp.json()["id"])
+    return board_id, ids
+
+
+def _reset() -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def test_mixed_batch_applies_all_operations():
+    _reset()
+    headers = _login("batch@example.com")
+    board_id, (a, b, c) = _board_with_cards(headers, 3)
+
+    resp = client.post(
+        "/api/v1/cards/batch",
+        json={
+            "operations": [
+                # swap the first two cards inside the same column
+                {"op": "move", "id": a, "column": "todo", "order_idx": 1},
+                {"op": "move", "id": b, "column": "todo", "order_idx": 0},
+                {"op": "update", "id": c, "title": "  renamed  "},
+                {"op": "delete", "id": c + 100},
+                {
+                    "op": "create",
+                    "title": "new",
+                    "column": "done",
+                    "order_idx": 0,
+                    "board_id": board_id,
+                },
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["status"] for r in results] == [200, 200, 200, 404, 201]
+    assert results[0]["card"]["order_idx"] == 1
+    assert results[1]["card"]["order_idx"] == 0
+    assert results[2]["card"]["title"] == "renamed"
+    assert results[3]["error"]["code"] == "CARD_NOT_FOUND"
+    assert results[4]["card"]["column"] == "done"
+
+    listed = client.get(f"/api/v1/cards?board_id={board_id}", headers=headers).json()
+    assert len(listed) == 4
+
+
+def test_batch_authorizes_each_operation():
+    _reset()
+    owner = _login("batch-owner@example.com")
+    board_id, (card_id,) = _board_with_cards(owner, 1)
+    other = _login("batch-other@example.com")
+
+    resp = client.post(
+        "/api/v1/cards/batch",
+        json={
+            "operations": [
+                {"op": "delete", "id": card_id},
+                {
+                    "op": "create",
+                    "title": "x",
+                    "column": "todo",
+                    "order_idx": 5,
+                    "board_id": board_id,
+                },
+            ]
+        },
+        headers=other,
+    )
+    assert resp.status_code == 200
+    assert [r["error"]["code"] for r in resp.json()["results"]] == [
+        "FORBIDDEN",
+        "FORBIDDEN",
+    ]
+    assert client.get(f"/api/v1/cards/{card_id}", headers=owner).status_code == 200
+
+
+def test_batch_conflict_rolls_back_everything():
+    _reset()
+    headers = _login("batch-conflict@example.com")
+    _, (a, b) = _board_with_cards(headers, 2)
+
+    resp = client.post(
+        "/api/v1/cards/batch",
+        json={
+            "operations": [
+                {"op": "update", "id": a, "title": "should not persist"},
+                {"op": "move", "id": b, "column": "todo", "order_idx": 0},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "BATCH_CONFLICT"
+    assert client.get(f"/api/v1/cards/{a}", headers=headers).json()["title"] == "c0"
+
+
+def test_batch_update_of_column_alone_keeps_order_idx():
+    _reset()
+    headers = _login("batch-column@example.com")
+    _, (a, b) = _board_with_cards(headers, 2)
+
+    resp = client.post(
+        "/api/v1/cards/batch",
+        json={"operations": [{"op": "update", "id": b, "column": "done"}]},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    card = resp.json()["results"][0]["card"]
+    assert (card["column"], card["order_idx"]) == ("done", 1)
+    stored = client.get(f"/api/v1/cards/{b}", headers=headers).json()
+    assert (stored["column"], stored["order_idx"]) == ("done", 1)
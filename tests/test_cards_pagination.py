@@ -0,0 +1,88 @@
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, engine
+from src.main import app
+
+client = TestClient(app)
+
+
+def _auth_headers(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _seed_board(n_cards: int) -> tuple[str, int]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    email, password = "pager@example.com", "password123"
+    client.post("/api/v1/auth/register", json={"email": email, "password": password})
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": email, "password": password},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    token = resp.json()["access_token"]
+    resp = client.post(
+        "/api/v1/boards", json={"title": "Paged"}, headers=_auth_headers(token)
+    )
+    board_id = resp.json()["id"]
+    for i in range(n_cards):
+        resp = client.post(
+            "/api/v1/cards",
+            json={
+                "title": f"card {i}",
+                "column": "todo" if i % 2 else "backlog",
+                "order_idx": i,
+                "board_id": board_id,
+            },
+            headers=_auth_headers(token),
+        )
+        assert resp.status_code == 201
+    return token, board_id
+
+
+def test_cursor_pages_match_offset_pages():
+    token, board_id = _seed_board(7)
+    headers = _auth_headers(token)
+
+    offset_ids = [
+        c["id"]
+        for c in client.get(
+            f"/api/v1/cards?board_id={board_id}&limit=100", headers=headers
+        ).json()
+    ]
+
+    cursor_ids: list[int] = []
+    url = f"/api/v1/cards?board_id={board_id}&limit=3"
+    resp = client.get(url, headers=headers)
+    while True:
+        assert resp.status_code == 200
+        cursor_ids.extend(c["id"] for c in resp.json())
+        next_cursor = resp.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        resp = client.get(f"{url}&cursor={next_cursor}", headers=headers)
+
+    assert cursor_ids == offset_ids
+    assert len(cursor_ids) == 7
+
+
+def test_cursor_ignores_offset_and_last_page_has_no_cursor():
+    token, board_id = _seed_board(4)
+    headers = _auth_headers(token)
+
+    first = client.get(f"/api/v1/cards?board_id={board_id}&limit=2", headers=headers)
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get(
+        f"/api/v1/cards?board_id={board_id}&limit=3&offset=50&cursor={cursor}",
+        headers=headers,
+    )
+    assert second.status_code == 200
+    assert len(second.json()) == 2
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_malformed_cursor_is_structured_error():
+    token, _ = _seed_board(0)
+    resp = client.get("/api/v1/cards?cursor=not-a-cursor", headers=_auth_headers(token))
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "INVALID_CURSOR"
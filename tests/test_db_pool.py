@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.adapters.db import (
+    InstrumentedQueuePool,
+    _engine_options,
+    _sqlite_pragmas,
+    engine,
+)
+from src.main import app
+
+client = TestClient(app)
+
+
+def test_pool_options_come_from_env():
+    env = {
+        "DB_POOL_SIZE": "20",
+        "DB_MAX_OVERFLOW": "5",
+        "DB_POOL_TIMEOUT": "2.5",
+        "DB_POOL_RECYCLE": "600",
+        "DB_POOL_PRE_PING": "false",
+    }
+    options = _engine_options("postgresql+psycopg2://u:p@db/kanban", env)
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 5
+    assert options["pool_timeout"] == 2.5
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is False
+    assert "connect_args" not in options
+
+
+def test_in_memory_sqlite_keeps_default_pool():
+    assert _engine_options("sqlite://", {}) == {
+        "connect_args": {"check_same_thread": False}
+    }
+
+
+def test_sqlite_pragmas_are_applied_and_validated():
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+    with pytest.raises(RuntimeError):
+        _sqlite_pragmas({"SQLITE_JOURNAL_MODE": "WAL; DROP TABLE users"})
+
+
+def test_pool_metrics_are_exported():
+    with engine.connect():
+        body = client.get("/metrics").text
+    assert 'db_pool_checked_out{engine="sync"} 1.0' in body
+    assert 'db_pool_checkout_wait_seconds_count{engine="sync"}' in body
+    assert 'db_pool_overflow{engine="sync"}' in body
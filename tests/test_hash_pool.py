@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services import auth as auth_svc
+from src.services.hash_pool import HashPoolSaturatedError, HashWorkerPool
+
+client = TestClient(app)
+
+
+def test_pool_runs_jobs_and_records_metrics():
+    pool = HashWorkerPool(workers=1, max_pending=2, queue_timeout=5.0, kind="thread")
+    try:
+        assert pool.run("hash", str.upper, "abc") == "ABC"
+    finally:
+        pool.shutdown()
+    body = client.get("/metrics").text
+    assert 'auth_hash_seconds_count{op="hash"}' in body
+    assert "auth_hash_pool_wait_seconds_count" in body
+    assert "auth_hash_pool_queue_depth 0.0" in body
+
+
+def test_pool_rejects_when_saturated():
+    release = threading.Event()
+    pool = HashWorkerPool(workers=1, max_pending=1, queue_timeout=5.0, kind="thread")
+    try:
+        blocker = threading.Thread(target=pool.run, args=("hash", release.wait))
+        blocker.start()
+        with pytest.raises(HashPoolSaturatedError):
+            while blocker.is_alive():
+                pool.run("hash", str.upper, "x")
+    finally:
+        release.set()
+        blocker.join()
+        pool.shutdown()
+
+
+def test_queued_job_times_out_and_is_cancelled():
+    started = threading.Event()
+    release = threading.Event()
+
+    def hold_worker():
+        started.set()
+        release.wait()
+
+    pool = HashWorkerPool(workers=1, max_pending=4, queue_timeout=0.05, kind="thread")
+    try:
+        blocker = threading.Thread(target=pool.run, args=("hash", hold_worker))
+        blocker.start()
+        # The single worker must be busy before the job under test is queued.
+        assert started.wait(5)
+        with pytest.raises(HashPoolSaturatedError):
+            pool.run("hash", str.upper, "queued")
+    finally:
+        release.set()
+        blocker.join()
+        pool.shutdown()
+
+
+def test_register_returns_structured_503_when_pool_saturated(monkeypatch):
+    def saturated(*_args, **_kwargs):
+        raise HashPoolSaturatedError("busy")
+
+    monkeypatch.setattr(auth_svc.get_hash_pool(), "run", saturated)
+    resp = client.post(
+        "/api/v1/auth/register",
+        json={"email": "busy@example.com", "password": "password123"},
+    )
+    assert resp.status_code == 503
+    assert resp.json()["code"] == "AUTH_BUSY"
+    assert resp.headers["Retry-After"] == "1"
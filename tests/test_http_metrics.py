@@ -0,0 +1,61 @@
+from unittest import mock
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app.middleware import HTTP_DB_QUERIES, HTTP_REQUESTS
+from src.main import app
+from src.services.http_client import (
+    EXTERNAL_SCORE_SECONDS,
+    ExternalScoreService,
+    ExternalServiceError,
+    SafeHttpClient,
+)
+
+client = TestClient(app)
+
+
+def test_requests_are_counted_per_route_template():
+    creds = {"email": "metrics@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    route = "/api/v1/cards/{card_id}"
+    before = HTTP_REQUESTS.value(method="GET", route=route, status="404")
+    queries_before = HTTP_DB_QUERIES.sum(route=route)
+    assert client.get("/api/v1/cards/424242", headers=headers).status_code == 404
+
+    assert HTTP_REQUESTS.value(method="GET", route=route, status="404") == before + 1
+    # the sync handler's DB work (card lookup) is attributed to its request
+    assert HTTP_DB_QUERIES.sum(route=route) >= queries_before + 1
+
+    body = client.get("/metrics").text
+    assert (
+        f'http_request_duration_seconds_count{{method="GET",route="{route}"}}' in body
+    )
+    assert "http_requests_in_flight" in body
+    assert 'route="/api/v1/cards/424242"' not in body
+
+
+def test_unmatched_paths_share_one_label():
+    client.get("/no/such/path")
+    assert HTTP_REQUESTS.value(method="GET", route="unmatched", status="404") >= 1
+
+
+def test_external_score_latency_is_recorded():
+    service = ExternalScoreService(SafeHttpClient(base_url="https://example.com"))
+    errors_before = EXTERNAL_SCORE_SECONDS.count(outcome="error")
+    with mock.patch.object(
+        service._client._client,
+        "request",
+        side_effect=httpx.TimeoutException("slow"),
+    ):
+        with mock.patch("src.services.http_client.time.sleep"):
+            with pytest.raises(ExternalServiceError):
+                service.fetch_score({"title": "x"})
+    assert EXTERNAL_SCORE_SECONDS.count(outcome="error") == errors_before + 1
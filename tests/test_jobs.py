@@ -0,0 +1,162 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.adapters.models import Job, User
+from src.main import app
+from src.services import external, jobs
+from src.services.http_client import ExternalServiceError
+from src.services.score_cache import score_cache
+
+client = TestClient(app)
+
+
+class FakeScoreService:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def fetch_score(self, payload: dict) -> float:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ExternalServiceError("upstream down")
+        return 0.9
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    score_cache.clear()
+    monkeypatch.setenv("JOB_RETRY_BACKOFF", "0")
+    service = FakeScoreService()
+    monkeypatch.setattr(external, "get_score_service", lambda: service)
+    return service
+
+
+def _login(email: str) -> dict[str, str]:
+    creds = {"email": email, "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _card(headers: dict[str, str]) -> int:
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "jobs"}, headers=headers
+    ).json()["id"]
+    return client.post(
+        "/api/v1/cards",
+        json={"title": "slow", "column": "todo", "order_idx": 0, "board_id": board_id},
+        headers=headers,
+    ).json()["id"]
+
+
+def _queue_score(headers: dict[str, str], card_id: int) -> dict:
+    resp = client.post(
+        f"/api/v1/cards/{card_id}/score?async=true", json={}, headers=headers
+    )
+    assert resp.status_code == 202
+    assert resp.headers["Location"] == f"/api/v1/jobs/{resp.json()['id']}"
+    return resp.json()
+
+
+def test_async_scoring_returns_job_and_persists_score(scorer):
+    headers = _login("jobs@example.com")
+    card_id = _card(headers)
+
+    job = _queue_score(headers, card_id)
+    assert (job["status"], job["kind"]) == ("queued", "score_card")
+    assert scorer.calls == 0
+
+    assert jobs.run_pending() == 1
+    done = client.get(f"/api/v1/jobs/{job['id']}", headers=headers).json()
+    assert (done["status"], done["result"], done["attempts"]) == (
+        "succeeded",
+        {"score": 0.9},
+        1,
+    )
+    card = client.get(f"/api/v1/cards/{card_id}", headers=headers).json()
+    assert card["score"] == 0.9
+
+    listed = client.get("/api/v1/jobs?status=succeeded", headers=headers).json()
+    assert [j["id"] for j in listed] == [job["id"]]
+    other = _login("other-jobs@example.com")
+    assert client.get(f"/api/v1/jobs/{job['id']}", headers=other).status_code == 404
+    assert client.get("/api/v1/jobs", headers=other).json() == []
+
+    # Admins see every job, in the list as well as one by one.
+    with SessionLocal() as db:
+        admin = db.scalar(select(User).where(User.email == "other-jobs@example.com"))
+        admin.role = "admin"
+        db.commit()
+    assert client.get(f"/api/v1/jobs/{job['id']}", headers=other).status_code == 200
+    listed = client.get("/api/v1/jobs", headers=other).json()
+    assert [j["id"] for j in listed] == [job["id"]]
+
+
+def test_failed_attempts_are_retried_then_given_up(scorer):
+    headers = _login("retry@example.com")
+    card_id = _card(headers)
+
+    scorer.failures = 1
+    retried = _queue_score(headers, card_id)
+    assert jobs.run_pending() == 2
+    job = client.get(f"/api/v1/jobs/{retried['id']}", headers=headers).json()
+    assert (job["status"], job["attempts"]) == ("succeeded", 2)
+
+    score_cache.clear()  # the first job cached this card's score
+    scorer.calls, scorer.failures = 0, 10
+    failed = _queue_score(headers, card_id)
+    jobs.run_pending()
+    job = client.get(f"/api/v1/jobs/{failed['id']}", headers=headers).json()
+    assert (job["status"], job["attempts"]) == ("failed", 3)
+    assert "EXTERNAL_SERVICE_UNAVAILABLE" in job["last_error"]
+
+
+def test_claims_are_exclusive_and_expired_leases_are_reclaimed(scorer):
+    headers = _login("claims@example.com")
+    job_id = _queue_score(headers, _card(headers))["id"]
+
+    with SessionLocal() as first, SessionLocal() as second:
+        assert jobs.claim_next(first, "worker-a", lease_seconds=60).id == job_id
+        assert jobs.claim_next(second, "worker-b", lease_seconds=60) is None
+
+        second.query(Job).filter(Job.id == job_id).update(
+            {Job.locked_until: datetime.now(timezone.utc) - timedelta(seconds=1)}
+        )
+        second.commit()
+        reclaimed = jobs.claim_next(second, "worker-b", lease_seconds=60)
+        assert (reclaimed.id, reclaimed.attempts) == (job_id, 2)
+
+        # The worker that lost its lease can no longer finish the job.
+        job = first.get(Job, job_id)
+        assert not jobs._finish(first, job, "worker-a", status=jobs.SUCCEEDED)
+        first.rollback()
+
+
+def test_runner_threads_drain_the_queue(scorer):
+    headers = _login("runner@example.com")
+    job_id = _queue_score(headers, _card(headers))["id"]
+
+    runner = jobs.JobRunner(workers=2, poll_interval=0.05)
+    runner.start()
+    try:
+        deadline = time.monotonic() + 5
+        status = None
+        while time.monotonic() < deadline and status != "succeeded":
+            time.sleep(0.02)
+            status = client.get(f"/api/v1/jobs/{job_id}", headers=headers).json()[
+                "status"
+            ]
+    finally:
+        runner.stop()
+    assert status == "succeeded"
+    assert scorer.calls == 1
@@ -0,0 +1,95 @@
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, engine
+from src.main import app
+from src.services.query_cache import MemoryBackend, query_cache
+
+client = TestClient(app)
+
+
+def _login(email: str) -> dict[str, str]:
+    creds = {"email": email, "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _setup() -> tuple[dict[str, str], int]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    query_cache.clear()
+    headers = _login("cache@example.com")
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "cache"}, headers=headers
+    ).json()["id"]
+    for n in range(3):
+        client.post(
+            "/api/v1/cards",
+            json={
+                "title": f"c{n}",
+                "column": "todo",
+                "order_idx": n,
+                "board_id": board_id,
+            },
+            headers=headers,
+        )
+    return headers, board_id
+
+
+def test_board_pages_are_cached_until_a_card_changes():
+    headers, board_id = _setup()
+    params = {"board_id": board_id, "limit": 2}
+
+    first = client.get("/api/v1/cards", params=params, headers=headers)
+    second = client.get("/api/v1/cards", params=params, headers=headers)
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    card_id = first.json()[0]["id"]
+    client.patch(f"/api/v1/cards/{card_id}", json={"title": "renamed"}, headers=headers)
+    after_write = client.get("/api/v1/cards", params=params, headers=headers)
+    assert after_write.headers["X-Cache"] == "MISS"
+    assert after_write.json()[0]["title"] == "renamed"
+
+    bypass = client.get(
+        "/api/v1/cards", params=params, headers={**headers, "X-Cache-Bypass": "1"}
+    )
+    assert bypass.headers["X-Cache"] == "BYPASS"
+    assert bypass.content == after_write.content
+
+    # Pages without a board are not cached.
+    unscoped = client.get("/api/v1/cards", headers=headers)
+    assert "X-Cache" not in unscoped.headers
+
+
+def test_cached_pages_are_scoped_to_the_requester():
+    headers, board_id = _setup()
+    client.get("/api/v1/cards", params={"board_id": board_id}, headers=headers)
+
+    other = _login("other@example.com")
+    resp = client.get("/api/v1/cards", params={"board_id": board_id}, headers=other)
+    assert resp.headers["X-Cache"] == "MISS"
+    assert resp.json() == []
+
+
+def test_memory_backend_evicts_by_bytes_and_count():
+    backend = MemoryBackend(max_entries=3, max_bytes=100)
+    backend.set("a", b"x" * 40, 60)
+    backend.set("b", b"x" * 40, 60)
+    backend.get("a")
+    backend.set("c", b"x" * 40, 60)
+    # 123 bytes > 100: the least recently used entry goes first.
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.nbytes == 82
+
+    backend.set("d", b"", 60)
+    backend.set("e", b"", 60)
+    # Four entries > 3: "c" is now the least recently used.
+    assert len(backend) == 3
+    assert backend.get("c") is None
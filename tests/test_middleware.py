@@ -0,0 +1,61 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from src.app.middleware import AccessLogRecord, CorrelationIdMiddleware
+from src.main import app
+
+client = TestClient(app)
+
+
+def test_correlation_id_generated_and_untrusted_values_replaced():
+    generated = client.get("/health").headers["X-Correlation-Id"]
+    assert len(generated) == 32
+
+    resp = client.get("/health", headers={"X-Correlation-Id": "bad id\r\nx"})
+    assert resp.headers["X-Correlation-Id"] != "bad id\r\nx"
+    assert resp.headers["Server-Timing"].startswith("app;dur=")
+
+
+def test_streaming_body_is_forwarded_without_buffering():
+    first_chunk_sent = asyncio.Event()
+    records: list[AccessLogRecord] = []
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"a", "more_body": True})
+        # Only continues once the first chunk reached the client side.
+        await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+        await send({"type": "http.response.body", "body": b"bc", "more_body": False})
+
+    sent: list[dict] = []
+
+    async def send(message):
+        sent.append(message)
+        if message.get("body") == b"a":
+            first_chunk_sent.set()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    middleware = CorrelationIdMiddleware(streaming_app, hooks=[records.append])
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "headers": [(b"x-correlation-id", b"stream-1")],
+        "client": ("127.0.0.1", 5000),
+    }
+    asyncio.run(middleware(scope, receive, send))
+
+    assert [m["type"] for m in sent] == [
+        "http.response.start",
+        "http.response.body",
+        "http.response.body",
+    ]
+    assert (b"x-correlation-id", b"stream-1") in sent[0]["headers"]
+    (record,) = records
+    assert record.correlation_id == "stream-1"
+    assert record.status == 200
+    assert record.response_bytes == 3
+    assert scope["state"]["correlation_id"] == "stream-1"
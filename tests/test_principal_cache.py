@@ -0,0 +1,78 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.adapters.models import User
+from src.main import app
+from src.services.principals import (
+    CACHE_REQUESTS,
+    Principal,
+    PrincipalCache,
+    principal_cache,
+)
+
+client = TestClient(app)
+
+
+def _login(email: str = "cached@example.com") -> tuple[int, dict[str, str]]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+    creds = {"email": email, "password": "password123"}
+    user_id = client.post("/api/v1/auth/register", json=creds).json()["id"]
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    )
+    return user_id, {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_repeat_requests_hit_the_cache():
+    _, headers = _login()
+    hits = CACHE_REQUESTS.value(result="hit")
+    misses = CACHE_REQUESTS.value(result="miss")
+
+    assert client.get("/api/v1/boards", headers=headers).status_code == 200
+    assert client.get("/api/v1/boards", headers=headers).status_code == 200
+
+    assert CACHE_REQUESTS.value(result="miss") == misses + 1
+    assert CACHE_REQUESTS.value(result="hit") == hits + 1
+
+
+def test_deactivation_invalidates_cached_principal():
+    user_id, headers = _login()
+    assert client.get("/api/v1/boards", headers=headers).status_code == 200
+    assert len(principal_cache) == 1
+
+    with SessionLocal() as db:
+        db.get(User, user_id).is_active = False
+        db.flush()
+        # Until the commit, other sessions still see the user as active.
+        assert client.get("/api/v1/boards", headers=headers).status_code == 200
+        assert len(principal_cache) == 1
+        db.commit()
+
+    assert len(principal_cache) == 0
+    assert client.get("/api/v1/boards", headers=headers).status_code == 401
+
+
+def test_ttl_never_exceeds_token_expiry():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=3600)
+    cache.put("tok", Principal(id=1, role="user", is_active=True), time.time() + 0.05)
+    assert cache.get("tok") is not None
+    time.sleep(0.1)
+    assert cache.get("tok") is None
+
+    cache.put("old", Principal(id=1, role="user", is_active=True), time.time() - 1)
+    assert cache.get("old") is None
+
+
+def test_cache_is_bounded_lru():
+    cache = PrincipalCache(maxsize=2, ttl_seconds=60)
+    exp = time.time() + 60
+    for i in range(3):
+        cache.put(f"t{i}", Principal(id=i, role="user", is_active=True), exp)
+    assert len(cache) == 2
+    assert cache.get("t0") is None
+    assert cache.get("t2") is not None
@@ -0,0 +1,111 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.http_client import (
+    CircuitOpenError,
+    ExternalServiceError,
+    SafeHttpClient,
+)
+from src.services.resilience import (
+    CIRCUIT_REJECTED,
+    CIRCUIT_STATE,
+    CLOSED,
+    CONCURRENCY_LIMIT,
+    HALF_OPEN,
+    OPEN,
+    AdaptiveLimiter,
+    CircuitBreaker,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_probes_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "t-breaker", min_calls=4, failure_ratio=0.5, open_seconds=10, clock=clock
+    )
+    for ok in (True, False, True, False):
+        assert breaker.allow()
+        breaker.record(ok)
+    assert breaker.state == OPEN
+    assert CIRCUIT_STATE.value(upstream="t-breaker") == 2
+    assert not breaker.allow()
+
+    clock.now += 10
+    assert breaker.allow()  # single half-open probe
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record(True)
+    assert breaker.state == CLOSED
+    assert CIRCUIT_REJECTED.value(upstream="t-breaker") == 2
+
+
+def test_breaker_forgets_failures_outside_the_window():
+    clock = FakeClock()
+    breaker = CircuitBreaker("t-window", min_calls=2, window_seconds=5, clock=clock)
+    breaker.record(False)
+    clock.now += 6
+    breaker.record(True)
+    assert breaker.state == CLOSED
+
+
+def test_limiter_grows_when_saturated_and_backs_off_on_failure():
+    limiter = AdaptiveLimiter("t-aimd", initial_limit=2, max_limit=4)
+    for _ in range(6):
+        assert limiter.acquire(0) and limiter.acquire(0)
+        limiter.release(0.01, ok=True)
+        limiter.release(0.01, ok=True)
+    assert limiter.limit == 4
+
+    assert limiter.acquire(0)
+    limiter.release(5.0, ok=True)  # too slow counts as congestion
+    assert limiter.limit == 2
+    assert CONCURRENCY_LIMIT.value(upstream="t-aimd") == 2
+
+
+def test_limiter_sheds_after_timeout_and_wakes_async_waiters():
+    limiter = AdaptiveLimiter("t-wait", initial_limit=1)
+    assert limiter.acquire(0)
+    assert not limiter.acquire(0.01)
+
+    async def wait_for_slot() -> bool:
+        waiter = asyncio.create_task(limiter.acquire_async(1.0))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        limiter.release(0.01, ok=True)
+        return await waiter
+
+    assert asyncio.run(wait_for_slot())
+    assert limiter.in_flight == 1
+
+
+def test_open_circuit_fails_fast_without_calling_upstream():
+    calls: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = SafeHttpClient(
+        base_url="https://score.test",
+        retries=1,
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("t-client", min_calls=3),
+    )
+    for _ in range(3):
+        with pytest.raises(ExternalServiceError):
+            client.post("/score")
+    assert len(calls) == 3
+
+    with pytest.raises(CircuitOpenError):
+        client.post("/score")
+    assert len(calls) == 3
@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session
+
+from src.adapters.db import Base, init_db, upgrade_schema
+from src.adapters.models import Board, BoardColumnStats, Card
+from src.services.stats import rebuild_board_stats
+
+# The boards and cards tables as the first release created them.
+OLD_SCHEMA = (
+    "CREATE TABLE users (id INTEGER NOT NULL PRIMARY KEY, email VARCHAR(255) NOT NULL,"
+    " hashed_password VARCHAR(255) NOT NULL, role VARCHAR(32) NOT NULL,"
+    " is_active BOOLEAN NOT NULL, created_at DATETIME NOT NULL)",
+    "CREATE TABLE boards (id INTEGER NOT NULL PRIMARY KEY, title VARCHAR(255) NOT NULL,"
+    " owner_id INTEGER NOT NULL REFERENCES users (id), created_at DATETIME NOT NULL)",
+    "CREATE TABLE cards (id INTEGER NOT NULL PRIMARY KEY, title VARCHAR(255) NOT NULL,"
+    ' "column" VARCHAR(64) NOT NULL, order_idx INTEGER NOT NULL,'
+    " board_id INTEGER NOT NULL REFERENCES boards (id),"
+    " owner_id INTEGER NOT NULL REFERENCES users (id), created_at DATETIME NOT NULL,"
+    " updated_at DATETIME NOT NULL, estimate_hours NUMERIC(10, 2), due_date DATETIME,"
+    ' CONSTRAINT uq_cards_board_column_order UNIQUE (board_id, "column", order_idx))',
+    "INSERT INTO users VALUES (1, 'old@example.com', 'x', 'user', 1,"
+    " '2025-01-02 03:04:05')",
+    "INSERT INTO boards VALUES (1, 'Old', 1, '2025-01-02 03:04:05')",
+)
+OLD_CARDS = tuple(
+    "INSERT INTO cards VALUES"
+    f" ({n}, 'old card {n}', '{column}', {n}, 1, 1, '2025-01-02 03:04:05',"
+    f" '2025-01-02 03:04:05', {estimate}, NULL)"
+    for n, (column, estimate) in enumerate(
+        [("todo", "1.5"), ("todo", "NULL"), ("done", "2")], start=1
+    )
+)
+
+
+def _old_database(tmp_path, *statements: str):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+    return engine
+
+
+def test_existing_tables_gain_new_columns_and_indexes(tmp_path):
+    engine = _old_database(tmp_path, *OLD_SCHEMA)
+
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    upgrade_schema(engine)  # a second run finds nothing to do
+
+    columns = {c["name"] for c in inspect(engine).get_columns("boards")}
+    assert {"updated_at", "version"} <= columns
+    assert "score" in {c["name"] for c in inspect(engine).get_columns("cards")}
+    indexes = {i["name"] for i in inspect(engine).get_indexes("cards")}
+    assert {index.name for index in Card.__table__.indexes} <= indexes
+
+    with Session(engine) as db:
+        old = db.get(Board, 1)
+        assert old.version == 0
+        assert old.updated_at == old.created_at
+        db.add(Board(title="New", owner_id=1))
+        db.add(Card(title="c", column="todo", order_idx=0, board_id=1, owner_id=1))
+        db.commit()
+    engine.dispose()
+
+
+def test_summary_tables_are_seeded_from_existing_cards(tmp_path):
+    engine = _old_database(tmp_path, *OLD_SCHEMA, *OLD_CARDS)
+
+    init_db(engine)
+
+    with Session(engine) as db:
+        stored = {
+            row.column: (row.card_count, row.estimate_total)
+            for row in db.scalars(select(BoardColumnStats))
+        }
+        assert stored == {"todo": (2, Decimal("1.50")), "done": (1, Decimal("2.00"))}
+        assert rebuild_board_stats(db, fix=False) == []
+    engine.dispose()
+
+
+def test_search_index_is_built_for_existing_cards(tmp_path):
+    engine = _old_database(tmp_path, *OLD_SCHEMA, *OLD_CARDS)
+
+    init_db(engine)
+
+    with Session(engine) as db:
+        db.add(
+            Card(title="new card", column="todo", order_idx=9, board_id=1, owner_id=1)
+        )
+        db.commit()
+        found = db.scalars(
+            text(
+                "SELECT rowid FROM cards_fts WHERE cards_fts MATCH 'card' ORDER BY rowid"
+            )
+        ).all()
+    assert found == [1, 2, 3, 4]
+    engine.dispose()
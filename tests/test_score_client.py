@@ -0,0 +1,255 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, engine
+from src.main import app
+from src.services import external
+from src.services.http_client import (
+    AsyncExternalScoreService,
+    AsyncSafeHttpClient,
+    CircuitOpenError,
+    ExternalServiceError,
+)
+from src.services.resilience import OPEN, CircuitBreaker
+from src.services.score_cache import ScoreCache, score_cache
+
+client = TestClient(app)
+
+
+def _scoring_service(calls: list, statuses: list[int]) -> AsyncExternalScoreService:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)  # keep calls in flight long enough to overlap
+        payload = json.loads(request.content)
+        code = statuses.pop(0) if statuses else 200
+        if payload.get("title") == "unscorable":
+            code = 503
+        return httpx.Response(code, json={"score": 0.75})
+
+    return AsyncExternalScoreService(
+        AsyncSafeHttpClient(
+            base_url="https://score.test",
+            retries=3,
+            backoff_seconds=0,
+            transport=httpx.MockTransport(handler),
+        )
+    )
+
+
+def test_async_client_retries_then_gives_up():
+    calls: list = []
+    service = _scoring_service(calls, [503, 200])
+    assert asyncio.run(service.fetch_score({"title": "x"})) == 0.75
+    assert len(calls) == 2
+
+    calls.clear()
+    failing = _scoring_service(calls, [503, 503, 503])
+    with pytest.raises(ExternalServiceError):
+        asyncio.run(failing.fetch_score({"title": "x"}))
+    assert len(calls) == 3
+
+
+def test_transport_and_decoding_errors_become_service_errors():
+    calls: list = []
+
+    async def refused(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    def service(handler) -> AsyncExternalScoreService:
+        return AsyncExternalScoreService(
+            AsyncSafeHttpClient(
+                base_url="https://score.test",
+                retries=3,
+                backoff_seconds=0,
+                transport=httpx.MockTransport(handler),
+            )
+        )
+
+    with pytest.raises(ExternalServiceError):
+        asyncio.run(service(refused).fetch_score({"title": "x"}))
+    assert len(calls) == 3
+
+    for body in (b"not json", b"[]", b'{"score": null}', b'{"score": "high"}'):
+        malformed = service(
+            lambda _request, body=body: httpx.Response(200, content=body)
+        )
+        with pytest.raises(ExternalServiceError):
+            asyncio.run(malformed.fetch_score({"title": "x"}))
+
+
+def test_other_httpx_errors_fail_fast_and_trip_the_breaker():
+    calls: list = []
+
+    async def redirect_loop(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.TooManyRedirects("Exceeded maximum allowed redirects.")
+
+    breaker = CircuitBreaker("test-redirects", min_calls=2)
+    service = AsyncExternalScoreService(
+        AsyncSafeHttpClient(
+            base_url="https://score.test",
+            retries=3,
+            backoff_seconds=0,
+            breaker=breaker,
+            transport=httpx.MockTransport(redirect_loop),
+        )
+    )
+    for _ in range(2):
+        with pytest.raises(ExternalServiceError):
+            asyncio.run(service.fetch_score({"title": "x"}))
+    assert len(calls) == 2
+    assert breaker.state == OPEN
+
+
+def test_score_cache_expires_and_evicts(monkeypatch):
+    cache = ScoreCache(maxsize=2, ttl_seconds=10)
+    cache.put("a", 1.0)
+    cache.put("b", 2.0)
+    assert cache.get("a") == 1.0
+    cache.put("c", 3.0)  # "b" is least recently used
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now = time.monotonic()
+    monkeypatch.setattr("src.services.ttl_cache.time.monotonic", lambda: now + 11)
+    assert cache.get("a") is None
+
+
+@pytest.fixture
+def upstream_calls(monkeypatch) -> list:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    score_cache.clear()
+    calls: list = []
+    service = _scoring_service(calls, [])
+    monkeypatch.setattr(external, "get_async_score_service", lambda: service)
+    return calls
+
+
+def _board_with_cards(titles: list[str]) -> tuple[dict[str, str], int, list[int]]:
+    creds = {"email": "scorer@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "b"}, headers=headers
+    ).json()["id"]
+    card_ids = [
+        client.post(
+            "/api/v1/cards",
+            json={
+                "title": title,
+                "column": "backlog",
+                "order_idx": position,
+                "board_id": board_id,
+            },
+            headers=headers,
+        ).json()["id"]
+        for position, title in enumerate(titles)
+    ]
+    return headers, board_id, card_ids
+
+
+def test_concurrent_identical_requests_share_one_call(upstream_calls):
+    payload = {"title": "same", "column": "backlog"}
+
+    async def score_concurrently():
+        return await asyncio.gather(
+            *(external.fetch_score_or_raise_async(payload) for _ in range(5))
+        )
+
+    assert asyncio.run(score_concurrently()) == [0.75] * 5
+    assert len(upstream_calls) == 1
+
+
+def test_board_scoring_reports_partial_results(upstream_calls):
+    headers, board_id, card_ids = _board_with_cards(["dup", "dup", "unscorable"])
+
+    resp = client.post(f"/api/v1/boards/{board_id}/score", json={}, headers=headers)
+
+    assert resp.status_code == 200
+    results = {r["card_id"]: r for r in resp.json()["results"]}
+    assert results[card_ids[0]]["score"] == 0.75
+    assert results[card_ids[1]]["score"] == 0.75
+    failed = results[card_ids[2]]
+    assert failed["status"] == 502
+    assert failed["error"]["code"] == "EXTERNAL_SERVICE_UNAVAILABLE"
+    # the two identical cards were coalesced; the failing one was retried
+    assert len(upstream_calls) == 1 + 3
+
+
+def test_board_scoring_checks_access(upstream_calls):
+    headers, _, _ = _board_with_cards([])
+    resp = client.post("/api/v1/boards/999999/score", json={}, headers=headers)
+    assert resp.status_code == 404
+    assert resp.json()["code"] == "BOARD_NOT_FOUND"
+
+
+def test_unchanged_card_is_scored_once(upstream_calls):
+    calls = upstream_calls
+    headers, _, (card_id,) = _board_with_cards(["t"])
+
+    url = f"/api/v1/cards/{card_id}/score"
+    for _ in range(2):
+        resp = client.post(url, json={"context": "c"}, headers=headers)
+        assert resp.status_code == 200
+        assert resp.json() == {"score": 0.75}
+    assert len(calls) == 1
+
+    client.patch(f"/api/v1/cards/{card_id}", json={"title": "t2"}, headers=headers)
+    assert client.post(url, json={"context": "c"}, headers=headers).status_code == 200
+    assert len(calls) == 2
+
+
+def _unreachable_upstream(monkeypatch) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    score_cache.clear()
+    # Nothing listens on the discard port, so every connection is refused.
+    service = AsyncExternalScoreService(
+        AsyncSafeHttpClient(base_url="http://127.0.0.1:9", backoff_seconds=0)
+    )
+    monkeypatch.setattr(external, "get_async_score_service", lambda: service)
+
+
+def test_unreachable_upstream_is_a_502(monkeypatch):
+    _unreachable_upstream(monkeypatch)
+    headers, _, card_ids = _board_with_cards(["x"])
+    resp = client.post(f"/api/v1/cards/{card_ids[0]}/score", json={}, headers=headers)
+    assert resp.status_code == 502
+    assert resp.json()["code"] == "EXTERNAL_SERVICE_UNAVAILABLE"
+
+
+def test_unreachable_upstream_fails_board_scoring_per_card(monkeypatch):
+    _unreachable_upstream(monkeypatch)
+    headers, board_id, card_ids = _board_with_cards(["a", "b"])
+    resp = client.post(f"/api/v1/boards/{board_id}/score", json={}, headers=headers)
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert sorted(r["card_id"] for r in results) == card_ids
+    assert {r["status"] for r in results} == {502}
+    assert {r["error"]["code"] for r in results} == {"EXTERNAL_SERVICE_UNAVAILABLE"}
+
+
+def test_board_scoring_survives_errors_outside_the_mapping(monkeypatch):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    score_cache.clear()
+
+    async def circuit_open(_payload):
+        raise CircuitOpenError("External service circuit is open")
+
+    monkeypatch.setattr(external, "fetch_score_or_raise_async", circuit_open)
+    headers, board_id, card_ids = _board_with_cards(["a"])
+    resp = client.post(f"/api/v1/boards/{board_id}/score", json={}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["results"][0]["status"] == 502
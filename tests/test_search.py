@@ -0,0 +1,101 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.main import app
+from src.services.search import ensure_search_index
+
+client = TestClient(app)
+
+
+def _login(email: str) -> dict[str, str]:
+    creds = {"email": email, "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _card(headers: dict[str, str], title: str, order_idx: int) -> int:
+    board_id = client.post(
+        "/api/v1/boards", json={"title": "search"}, headers=headers
+    ).json()["id"]
+    return client.post(
+        "/api/v1/cards",
+        json={
+            "title": title,
+            "column": "todo",
+            "order_idx": order_idx,
+            "board_id": board_id,
+        },
+        headers=headers,
+    ).json()["id"]
+
+
+def _search(headers: dict[str, str], q: str) -> list[str]:
+    resp = client.get("/api/v1/cards/search", params={"q": q}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    return [card["title"] for card in resp.json()]
+
+
+def _setup() -> tuple[dict[str, str], dict[str, str]]:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return _login("search@example.com"), _login("other@example.com")
+
+
+def test_search_ranks_matches_and_respects_ownership():
+    owner, other = _setup()
+    _card(owner, "Release checklist for the next quarter", 0)
+    _card(owner, "Release notes release", 1)
+    _card(owner, "Unrelated", 2)
+    _card(other, "Release party", 0)
+
+    # Denser matches rank first; the other user's card is not visible.
+    assert _search(owner, "release") == [
+        "Release notes release",
+        "Release checklist for the next quarter",
+    ]
+    assert _search(owner, "rele") == _search(owner, "release")
+    assert _search(owner, "release check") == ["Release checklist for the next quarter"]
+    assert _search(other, "release") == ["Release party"]
+    # Query-language syntax is treated as plain words.
+    assert _search(owner, 'release" OR unrelated*') == []
+    assert _search(owner, "---") == []
+
+
+def test_index_follows_card_writes():
+    owner, _ = _setup()
+    renamed = _card(owner, "Draft spec", 0)
+    deleted = _card(owner, "Draft budget", 1)
+    batch = _card(owner, "Draft roadmap", 2)
+
+    client.patch(
+        f"/api/v1/cards/{renamed}", json={"title": "Final spec"}, headers=owner
+    )
+    client.delete(f"/api/v1/cards/{deleted}", headers=owner)
+    client.post(
+        "/api/v1/cards/batch",
+        json={"operations": [{"op": "update", "id": batch, "title": "Final roadmap"}]},
+        headers=owner,
+    )
+    assert _search(owner, "draft") == []
+    assert sorted(_search(owner, "final")) == ["Final roadmap", "Final spec"]
+
+    # A database created before the index existed is backfilled.
+    with SessionLocal() as db:
+        db.execute(text("DROP TABLE cards_fts"))
+        db.execute(text("DROP TRIGGER cards_fts_ai"))
+        db.commit()
+        ensure_search_index(db)
+    # Every term has to match.
+    assert _search(owner, "spec roadmap") == []
+    assert _search(owner, "final spec") == ["Final spec"]
+
+
+def test_search_requires_a_query():
+    owner, _ = _setup()
+    resp = client.get("/api/v1/cards/search", params={"q": ""}, headers=owner)
+    assert resp.status_code == 422
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from pydantic import TypeAdapter
+
+from src.adapters.db import Base, SessionLocal, engine
+from src.adapters.models import Board, Card, User
+from src.domain.schemas import CardOut
+from src.services.cards import to_cards_out
+from src.services.serialization import cards_json
+
+
+def test_trusted_path_matches_card_out_json():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        user = User(email="ser@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        board = Board(title="Ser", owner_id=user.id)
+        db.add(board)
+        db.flush()
+        db.add_all(
+            [
+                Card(
+                    title="plain",
+                    column="todo",
+                    order_idx=0,
+                    board_id=board.id,
+                    owner_id=user.id,
+                ),
+                Card(
+                    title="full",
+                    column="done",
+                    order_idx=1,
+                    board_id=board.id,
+                    owner_id=user.id,
+                    estimate_hours=Decimal("2.50"),
+                    due_date=datetime(2031, 5, 6, 7, 8, 9, 123, tzinfo=timezone.utc),
+                ),
+            ]
+        )
+        db.commit()
+        cards = db.query(Card).order_by(Card.id).all()
+
+        expected = TypeAdapter(list[CardOut]).dump_json(to_cards_out(cards))
+        assert cards_json(cards) == expected
@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.adapters.db import Base, engine
+from src.app.responses import RangeFileResponse
+from src.main import app
+from src.services import uploads as uploads_svc
+
+client = TestClient(app)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024
+
+
+@pytest.fixture
+def headers(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads_svc, "UPLOAD_DIR", tmp_path / "uploads")
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    creds = {"email": "upload@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=creds)
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": creds["email"], "password": creds["password"]},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _stored_files() -> list[str]:
+    return sorted(p.name for p in uploads_svc.UPLOAD_DIR.iterdir())
+
+
+def _upload(headers: dict[str, str], content: bytes = PNG) -> dict:
+    resp = client.post(
+        "/api/v1/upload",
+        content=content,
+        headers={**headers, "Content-Type": "image/png"},
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+def _chunks(*parts: bytes):
+    yield from parts
+
+
+def test_upload_png_ok_and_uuid_name(headers):
+    body = _upload(headers)
+    assert len(body["id"]) == 32 and int(body["id"], 16) >= 0
+    assert body["size"] == len(PNG)
+    assert body["sha256"] == hashlib.sha256(PNG).hexdigest()
+    # Stored under the content hash; the client never picks the name.
+    assert _stored_files() == [f"{body['sha256']}.png"]
+    assert (uploads_svc.UPLOAD_DIR / f"{body['sha256']}.png").read_bytes() == PNG
+
+
+def test_upload_rejects_large_file(headers):
+    big = PNG + b"\x00" * uploads_svc.MAX_UPLOAD_BYTES
+    resp = client.post(
+        "/api/v1/upload",
+        content=big,
+        headers={**headers, "Content-Type": "image/png"},
+    )
+    assert resp.status_code == 413
+    assert resp.json()["code"] == "FILE_TOO_LARGE"
+
+    # Without Content-Length the limit is enforced while streaming.
+    chunk = b"\x00" * 256 * 1024
+    resp = client.post(
+        "/api/v1/upload",
+        content=_chunks(PNG, *[chunk] * 5),
+        headers={**headers, "Content-Type": "image/png"},
+    )
+    assert resp.status_code == 413
+    assert _stored_files() == []
+
+
+def test_upload_rejects_wrong_signature(headers):
+    for content, content_type in [
+        (b"\xff\xd8\xff\xe0 jpeg body", "image/png"),
+        (b"\x89P", "image/png"),
+        (b"", "image/jpeg"),
+    ]:
+        resp = client.post(
+            "/api/v1/upload",
+            content=content,
+            headers={**headers, "Content-Type": content_type},
+        )
+        assert resp.status_code == 400, content
+        assert resp.json()["code"] == "INVALID_FILE_SIGNATURE"
+    # A signature split across chunks is still recognised.
+    resp = client.post(
+        "/api/v1/upload",
+        content=_chunks(b"\xff", b"\xd8", b"\xff\xe0 rest"),
+        headers={**headers, "Content-Type": "image/jpeg"},
+    )
+    assert resp.status_code == 201
+    assert resp.json()["content_type"] == "image/jpeg"
+    assert _stored_files()[0].endswith(".jpg")
+
+
+def test_upload_rejects_other_types_and_anonymous_clients(headers):
+    resp = client.post(
+        "/api/v1/upload",
+        content=PNG,
+        headers={**headers, "Content-Type": "image/svg+xml"},
+    )
+    assert resp.status_code == 415
+    resp = client.post(
+        "/api/v1/upload", content=PNG, headers={"Content-Type": "image/png"}
+    )
+    assert resp.status_code == 401
+
+
+def test_duplicate_content_is_stored_once_and_reference_counted(headers):
+    first = _upload(headers)
+    second = _upload(headers)
+    other = _upload(headers, PNG + b"other")
+    assert first["id"] != second["id"]
+    assert first["sha256"] == second["sha256"]
+    assert len(_stored_files()) == 2
+
+    assert (
+        client.delete(f"/api/v1/uploads/{first['id']}", headers=headers).status_code
+        == 204
+    )
+    # The blob is still referenced by the second upload.
+    assert client.get(f"/api/v1/uploads/{second['id']}", headers=headers).content == PNG
+    client.delete(f"/api/v1/uploads/{second['id']}", headers=headers)
+    assert _stored_files() == [f"{other['sha256']}.png"]
+    assert (
+        client.get(f"/api/v1/uploads/{first['id']}", headers=headers).status_code == 404
+    )
+
+
+def test_download_supports_etag_and_ranges(headers):
+    upload = _upload(headers)
+    url = f"/api/v1/uploads/{upload['id']}"
+
+    full = client.get(url, headers=headers)
+    assert full.status_code == 200
+    assert full.content == PNG
+    assert full.headers["content-type"] == "image/png"
+    assert full.headers["etag"] == f'"{upload["sha256"]}"'
+    assert full.headers["accept-ranges"] == "bytes"
+
+    cached = client.get(url, headers={**headers, "If-None-Match": full.headers["etag"]})
+    assert cached.status_code == 304 and cached.content == b""
+
+    part = client.get(url, headers={**headers, "Range": "bytes=0-7"})
+    assert part.status_code == 206
+    assert part.content == PNG[:8]
+    assert part.headers["content-range"] == f"bytes 0-7/{len(PNG)}"
+    suffix = client.get(url, headers={**headers, "Range": "bytes=-4"})
+    assert suffix.status_code == 206 and suffix.content == PNG[-4:]
+    beyond = client.get(url, headers={**headers, "Range": f"bytes={len(PNG)}-"})
+    assert beyond.status_code == 416
+    assert beyond.headers["content-range"] == f"bytes */{len(PNG)}"
+    # A stale If-Range validator gets the whole file instead of a range.
+    stale = client.get(
+        url, headers={**headers, "Range": "bytes=0-7", "If-Range": '"x"'}
+    )
+    assert stale.status_code == 200 and stale.content == PNG
+
+    other = client.post(
+        "/api/v1/auth/register",
+        json={"email": "intruder@example.com", "password": "password123"},
+    )
+    assert other.status_code == 201
+    token = client.post(
+        "/api/v1/auth/login",
+        data={"username": "intruder@example.com", "password": "password123"},
+    ).json()["access_token"]
+    denied = client.get(url, headers={"Authorization": f"Bearer {token}"})
+    assert denied.status_code == 404
+
+
+def test_range_response_uses_zerocopy_when_the_server_offers_it(tmp_path):
+    path = tmp_path / "blob"
+    path.write_bytes(PNG)
+    response = RangeFileResponse(
+        path, size=len(PNG), media_type="image/png", etag='"x"', range_header="bytes=8-"
+    )
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "extensions": {"http.response.zerocopy": {}},
+    }
+    asyncio.run(response(scope, None, send))
+    assert sent[0]["status"] == 206
+    assert sent[1]["type"] == "http.response.zerocopy"
+    assert (sent[1]["offset"], sent[1]["count"]) == (8, len(PNG) - 8)